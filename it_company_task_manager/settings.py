@@ -66,6 +66,8 @@ INTERNAL_IPS = [
 ]
 
 MIDDLEWARE = [
+    "task_manager.instrumentation.InstrumentationMiddleware",
+    "task_manager.profiling.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "debug_toolbar.middleware.DebugToolbarMiddleware",
@@ -81,7 +83,8 @@ ROOT_URLCONF = "it_company_task_manager.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # DjangoTemplates timing renders for the Server-Timing header
+        "BACKEND": "task_manager.instrumentation.InstrumentedDjangoTemplates",
         "DIRS": [os.path.join(BASE_DIR, "templates")],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -106,6 +109,44 @@ WSGI_APPLICATION = "it_company_task_manager.wsgi.application"
 
 LOGIN_REDIRECT_URL = "/"
 
+# Per-request timings, see task_manager/instrumentation.py. Queries slower
+# than this are logged with the view that ran them
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS", 100))
+
+# Request profiling, see task_manager/profiling.py. Disabled unless a
+# directory is set. A sample rate of N profiles every Nth request, 0 only
+# requests with a header from `manage.py profiling_token`
+PROFILING_DIR = os.environ.get("PROFILING_DIR", "")
+PROFILING_SAMPLE_RATE = int(os.environ.get("PROFILING_SAMPLE_RATE", 0))
+PROFILING_KEEP = int(os.environ.get("PROFILING_KEEP", 50))
+
+# Prometheus metrics at /metrics, see task_manager/metrics.py. Every
+# process writes its own file in METRICS_DIR and the endpoint sums them,
+# so gunicorn workers report together. Empty the directory when the
+# server starts. Scrapes are allowed from METRICS_ALLOWED_IPS, or from
+# anywhere with "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_DIR = os.environ.get("METRICS_DIR", "")
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+METRICS_ALLOWED_IPS = ["127.0.0.1", "::1"]
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+        },
+    },
+    "loggers": {
+        "task_manager.instrumentation": {
+            "handlers": ["console"],
+            # one line per request, too noisy for the test runner
+            "level": "WARNING" if TESTING else "INFO",
+            "propagate": False,
+        },
+    },
+}
+
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
@@ -124,6 +165,45 @@ if not TESTING:
     db_from_env = dj_database_url.config(conn_max_age=600)  # DATABASE_URL
     DATABASES["default"].update(db_from_env)
 
+# Cached task cards and table rows are keyed on updated_at, so any
+# backend works. CACHE_BACKEND is "locmem" (per process), "file" or
+# "redis" (shared between workers), CACHE_LOCATION is the directory or
+# the redis:// url
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[os.environ.get("CACHE_BACKEND", "locmem")],
+        "LOCATION": os.environ.get("CACHE_LOCATION", ""),
+        "TIMEOUT": int(os.environ.get("CACHE_TIMEOUT", 24 * 60 * 60)),
+        "OPTIONS": {},
+    }
+}
+
+if CACHES["default"]["BACKEND"].endswith("LocMemCache"):
+    CACHES["default"]["OPTIONS"]["MAX_ENTRIES"] = 10000
+
+# Tag suggestions, see task_manager/tag_index.py. Every process keeps the
+# last TAG_SUGGESTION_CACHE_SIZE answers for TAG_SUGGESTION_CACHE_TTL
+# seconds
+TAG_SUGGESTION_CACHE_SIZE = int(
+    os.environ.get("TAG_SUGGESTION_CACHE_SIZE", 4096)
+)
+TAG_SUGGESTION_CACHE_TTL = float(
+    os.environ.get("TAG_SUGGESTION_CACHE_TTL", 60)
+)
+
+# Task filter counts, see task_manager/facets.py. Task writes invalidate
+# them, TASK_FACETS_CACHE_TIMEOUT bounds how stale other processes get
+# with the locmem cache
+TASK_FACETS_CACHE_TIMEOUT = int(
+    os.environ.get("TASK_FACETS_CACHE_TIMEOUT", 5 * 60)
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
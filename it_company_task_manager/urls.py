@@ -15,15 +15,24 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from task_manager.views import metrics_view, tag_suggestions_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("accounts/", include("django.contrib.auth.urls")),
+    # ahead of taggit_autosuggest's own view for the same URL
+    re_path(
+        r"^taggit_autosuggest/list/(?:(?P<tagmodel>[._\w]+)/)?$",
+        tag_suggestions_view,
+        name="tag-suggestions",
+    ),
     path('taggit_autosuggest/', include('taggit_autosuggest.urls')),
     path("__debug__/", include("debug_toolbar.urls")),
+    path("metrics", metrics_view, name="metrics"),
     path("", include("team_manager.urls", namespace="team_manager")),
     path("task/", include("task_manager.urls", namespace="task_manager")),
 ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -0,0 +1,35 @@
+// select2 over the JSON endpoints of task_manager.autocomplete.AutocompleteView
+// The tags widget's media loads admin/js/jquery.init.js first, which takes
+// jQuery (and select2 with it) off the globals into django.jQuery
+(function ($) {
+  $(function () {
+    $("select[data-autocomplete-url]").each(function () {
+      var select = $(this);
+      var next = null;
+
+      select.select2({
+        width: "100%",
+        allowClear: !select.prop("multiple"),
+        placeholder: "",
+        ajax: {
+          url: select.data("autocomplete-url"),
+          dataType: "json",
+          delay: 250,
+          data: function (params) {
+            return {
+              term: params.term || "",
+              cursor: params.page ? next : "",
+            };
+          },
+          processResults: function (data) {
+            next = data.next;
+            return {
+              results: data.results,
+              pagination: {more: Boolean(data.next)},
+            };
+          },
+        },
+      });
+    });
+  });
+})((window.django && django.jQuery) || window.jQuery);
@@ -0,0 +1,151 @@
+from django import forms
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import connection
+from django.db.models import CharField, QuerySet, Value
+from django.db.models.functions import Collate, Concat, Lower
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views import View
+
+from .pagination import KeysetPaginator, InvalidCursor
+
+
+# The prefix is matched ignoring case, with a range on lower(field) that
+# every backend answers with an index range scan, unlike LIKE 'term%'. A
+# range only matches prefixes in code point order, so Postgres compares
+# in the "C" collation. install_autocomplete_index() adds the index on
+# the same expression.
+def code_point_order(expression):
+    if connection.vendor == "postgresql":
+        return Collate(expression, "C")
+    return expression
+
+
+def autocomplete_key(field: str):
+    return code_point_order(Lower(field))
+
+
+def autocomplete_index_sql(vendor: str, table: str, column: str) -> str:
+    if vendor == "postgresql":
+        expression = f'(lower({column}) COLLATE "C")'
+    else:
+        expression = f"lower({column})"
+
+    return (
+        f"CREATE INDEX IF NOT EXISTS {table}_{column}_prefix_idx "
+        f"ON {table} ({expression}, id)"
+    )
+
+
+def install_autocomplete_index(schema_editor, table: str, column: str):
+    if schema_editor.connection.vendor in ("sqlite", "postgresql"):
+        schema_editor.execute(autocomplete_index_sql(
+            schema_editor.connection.vendor, table, column
+        ))
+
+
+def uninstall_autocomplete_index(schema_editor, table: str, column: str):
+    schema_editor.execute(f"DROP INDEX IF EXISTS {table}_{column}_prefix_idx")
+
+
+# Results are keyset paginated on (lower(field), id).
+class AutocompleteView(LoginRequiredMixin, View):
+    queryset = None
+    field = "name"
+    paginate_by = 20
+
+    def get_queryset(self) -> QuerySet:
+        return self.queryset.all()
+
+    def label(self, obj) -> str:
+        return getattr(obj, self.field)
+
+    def get(self, request, *args, **kwargs):
+        term = request.GET.get("term", "").strip()
+        queryset = self.get_queryset().only("id", self.field).annotate(
+            prefix_key=autocomplete_key(self.field)
+        )
+
+        if term:
+            # lowered by the database too, so both sides agree on case
+            prefix = Lower(Value(term, output_field=CharField()))
+            queryset = queryset.filter(
+                prefix_key__gte=prefix,
+                prefix_key__lt=Concat(prefix, Value("\U0010ffff")),
+            )
+
+        paginator = KeysetPaginator(
+            queryset,
+            self.paginate_by,
+            fields=("prefix_key", "id"),
+            count=False,
+        )
+
+        try:
+            page = paginator.page(request.GET.get("cursor"))
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+        return JsonResponse({
+            "results": [
+                {"id": obj.pk, "text": self.label(obj)} for obj in page
+            ],
+            "next": page.next_cursor,
+        })
+
+
+class AutocompleteMixin:
+    # Only the selected options are rendered, the rest are fetched from
+    # the JSON endpoint by static/js/autocomplete.js
+    def __init__(self, url_name: str, attrs: dict | None = None):
+        super().__init__(attrs=attrs)
+        self.url_name = url_name
+
+    def build_attrs(self, base_attrs, extra_attrs=None) -> dict:
+        attrs = super().build_attrs(base_attrs, extra_attrs=extra_attrs)
+        attrs["data-autocomplete-url"] = reverse(self.url_name)
+        return attrs
+
+    def optgroups(self, name, value, attrs=None) -> list:
+        selected = [v for v in value if v not in ("", None)]
+        groups = []
+
+        if not self.allow_multiple_selected:
+            option = self.create_option(name, "", "---------", not selected, 0)
+            groups.append((None, [option], 0))
+
+        if not selected:
+            return groups
+
+        queryset = self.choices.queryset.filter(pk__in=selected)
+
+        for index, obj in enumerate(queryset, start=len(groups)):
+            option = self.create_option(
+                name,
+                self.choices.field.prepare_value(obj),
+                self.choices.field.label_from_instance(obj),
+                True,
+                index,
+                attrs=attrs,
+            )
+            groups.append((None, [option], index))
+
+        return groups
+
+    @property
+    def media(self):
+        return forms.Media(
+            css={"all": ("admin/css/vendor/select2/select2.min.css",)},
+            js=(
+                "admin/js/vendor/select2/select2.full.min.js",
+                "js/autocomplete.js",
+            ),
+        )
+
+
+class AutocompleteSelect(AutocompleteMixin, forms.Select):
+    pass
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin, forms.SelectMultiple):
+    pass
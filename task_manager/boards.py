@@ -0,0 +1,82 @@
+from django.db.models import QuerySet
+from django.http import Http404
+
+from .pagination import KeysetPaginator, KeysetPage, InvalidCursor
+
+
+class TaskBoardColumn:
+    def __init__(
+        self,
+        title: str,
+        request,
+        page: KeysetPage,
+        cursor_kwarg: str,
+    ):
+        self.title = title
+        self.request = request
+        self.page = page
+        self.cursor_kwarg = cursor_kwarg
+
+    def __iter__(self):
+        return iter(self.page)
+
+    def query(self, cursor: str | None) -> str:
+        updated = self.request.GET.copy()
+        updated[self.cursor_kwarg] = cursor
+        return updated.urlencode()
+
+    @property
+    def next_query(self) -> str | None:
+        if not self.page.has_next():
+            return None
+        return self.query(self.page.next_cursor)
+
+    @property
+    def previous_query(self) -> str | None:
+        if not self.page.has_previous():
+            return None
+        return self.query(self.page.previous_cursor)
+
+
+class TaskBoard:
+    def __init__(self, completed: TaskBoardColumn, open: TaskBoardColumn):
+        self.completed = completed
+        self.open = open
+        self.columns = [completed, open]
+
+
+# Completed and open tasks are fetched by separate LIMITed keyset queries
+# with the owner joined, so a board never loads more than a page per
+# column and each query can use the partial (name, id) index. The cursor
+# of each column lives in its own GET parameter, so the columns page
+# independently of each other and of the page's own pagination.
+def build_task_board(
+    request,
+    queryset: QuerySet,
+    per_page: int = 5,
+    prefix: str = "",
+) -> TaskBoard:
+    queryset = queryset.select_related("owner")
+    columns = {}
+
+    for name, title, is_completed in (
+        ("completed", "Completed tasks", True),
+        ("open", "Not completed tasks", False),
+    ):
+        cursor_kwarg = f"{prefix}{name}_cursor"
+        paginator = KeysetPaginator(
+            queryset.filter(is_completed=is_completed),
+            per_page,
+            count=False,
+        )
+
+        try:
+            page = paginator.page(request.GET.get(cursor_kwarg))
+        except InvalidCursor as e:
+            raise Http404(str(e))
+
+        columns[name] = TaskBoardColumn(
+            title, request, page, cursor_kwarg
+        )
+
+    return TaskBoard(**columns)
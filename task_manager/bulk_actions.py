@@ -0,0 +1,159 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+from taggit.models import Tag, TaggedItem
+
+from .facets import invalidate_task_facets
+from .m2m import delete_rows, get_tag_ids
+from .models import Task
+from .permissions import team_member_tasks
+from .signals import touch, touch_tasks
+from .tag_index import refresh_tag_index
+from team_manager.counters import adjust_counter
+from team_manager.models import Worker
+
+
+BULK_ACTIONS = [
+    ("complete", "Mark complete"),
+    ("incomplete", "Mark incomplete"),
+    ("set_priority", "Set priority"),
+    ("add_assignees", "Add assignees"),
+    ("remove_assignees", "Remove assignees"),
+    ("add_tags", "Add tags"),
+    ("remove_tags", "Remove tags"),
+    ("delete", "Delete"),
+]
+
+
+# Every action is a fixed number of statements however many tasks are
+# selected: QuerySet.update() for columns and one INSERT or DELETE per
+# through table. None of them send model or m2m_changed signals, the
+# completed tasks counter, updated_at, the tag index and the filter counts
+# are updated here instead.
+def set_completed(task_ids: list, is_completed: bool) -> None:
+    changed = Task.objects.filter(
+        pk__in=task_ids, is_completed=not is_completed
+    ).update(is_completed=is_completed, updated_at=timezone.now())
+
+    adjust_counter("completed_tasks", changed if is_completed else -changed)
+
+
+def set_priority(task_ids: list, priority: str) -> None:
+    Task.objects.filter(pk__in=task_ids).exclude(priority=priority).update(
+        priority=priority, updated_at=timezone.now()
+    )
+
+
+def add_assignees(task_ids: list, worker_ids: list) -> None:
+    through = Task.assignees.through
+
+    through.objects.bulk_create(
+        [
+            through(task_id=task_id, worker_id=worker_id)
+            for task_id in task_ids
+            for worker_id in worker_ids
+        ],
+        ignore_conflicts=True,
+    )
+    touch_tasks(task_ids)
+    touch(Worker, worker_ids)
+
+
+def remove_assignees(task_ids: list, worker_ids: list) -> None:
+    Task.assignees.through.objects.filter(
+        task_id__in=task_ids, worker_id__in=worker_ids
+    ).delete()
+    touch_tasks(task_ids)
+    touch(Worker, worker_ids)
+
+
+def add_tags(task_ids: list, tag_names: list) -> None:
+    content_type = ContentType.objects.get_for_model(Task)
+    tag_ids = get_tag_ids(set(tag_names)).values()
+
+    TaggedItem.objects.bulk_create(
+        [
+            TaggedItem(
+                content_type=content_type, object_id=task_id, tag_id=tag_id
+            )
+            for task_id in task_ids
+            for tag_id in tag_ids
+        ],
+        ignore_conflicts=True,
+    )
+    touch_tasks(task_ids)
+    refresh_tag_index(tag_ids)
+
+
+def remove_tags(task_ids: list, tag_names: list) -> None:
+    tag_ids = list(Tag.objects.filter(
+        name__in=tag_names
+    ).values_list("pk", flat=True))
+
+    # a plain DELETE, QuerySet.delete() would load the tagged items to
+    # send post_delete
+    delete_rows(TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(Task),
+        object_id__in=task_ids,
+        tag_id__in=tag_ids,
+    ))
+    touch_tasks(task_ids)
+    refresh_tag_index(tag_ids)
+
+
+def delete_tasks(task_ids: list) -> None:
+    tasks = Task.objects.filter(pk__in=task_ids)
+    completed = tasks.filter(is_completed=True).count()
+
+    # QuerySet.delete() would load every task to send post_delete. Nothing
+    # but the assignees and tags refers to a task (test_bulk_actions checks
+    # that), so those go first and the tasks themselves in one DELETE
+    Task.assignees.through.objects.filter(task_id__in=task_ids).delete()
+    tagged_items = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(Task),
+        object_id__in=task_ids,
+    )
+    tag_ids = list(tagged_items.values_list("tag_id", flat=True).distinct())
+    delete_rows(tagged_items)
+    delete_rows(tasks)
+
+    adjust_counter("completed_tasks", -completed)
+    refresh_tag_index(tag_ids)
+
+
+def run_bulk_action(
+    user,
+    action: str,
+    task_ids: list,
+    priority: str | None = None,
+    worker_ids: list = (),
+    tag_names: list = (),
+) -> tuple[int, int]:
+    # tasks outside the user's teams are skipped, like TaskDetailView.post
+    # ignores updates from non-members
+    allowed = list(team_member_tasks(
+        user, Task.objects.filter(pk__in=task_ids)
+    ).values_list("id", flat=True))
+
+    if allowed:
+        with transaction.atomic():
+            if action in ("complete", "incomplete"):
+                set_completed(allowed, action == "complete")
+            elif action == "set_priority":
+                set_priority(allowed, priority)
+            elif action == "add_assignees":
+                add_assignees(allowed, worker_ids)
+            elif action == "remove_assignees":
+                remove_assignees(allowed, worker_ids)
+            elif action == "add_tags":
+                add_tags(allowed, tag_names)
+            elif action == "remove_tags":
+                remove_tags(allowed, tag_names)
+            elif action == "delete":
+                delete_tasks(allowed)
+            else:
+                raise ValueError(f"Unknown bulk action {action!r}")
+
+            invalidate_task_facets()
+
+    return len(allowed), len(set(task_ids)) - len(allowed)
@@ -0,0 +1,118 @@
+import datetime
+import hashlib
+
+from django.contrib.messages import get_messages
+from django.core.exceptions import ImproperlyConfigured
+from django.middleware.csrf import get_token
+from django.db.models import Count, Max, QuerySet, Subquery, Value
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def aggregate_subquery(queryset: QuerySet, aggregate) -> Subquery:
+    # the constant isn't grouped on, so this is one aggregate over every
+    # row of queryset, correlated through its OuterRefs
+    return Subquery(
+        queryset.order_by().annotate(
+            all=Value(1)
+        ).values("all").annotate(value=aggregate).values("value")
+    )
+
+
+def fingerprint(name: str, queryset: QuerySet) -> dict:
+    # the latest change and the number of rows, rows deleted by a cascade
+    # change the count without touching anything
+    return {
+        f"{name}_updated_at": aggregate_subquery(
+            queryset, Max("updated_at")
+        ),
+        f"{name}_count": aggregate_subquery(queryset, Count("*")),
+    }
+
+
+def board_fingerprint(tasks: QuerySet) -> dict:
+    # the cards show the owner's name too
+    return {
+        **fingerprint("tasks", tasks),
+        "task_owners_updated_at": aggregate_subquery(
+            tasks, Max("owner__updated_at")
+        ),
+    }
+
+
+def list_fingerprint(queryset: QuerySet) -> dict:
+    return queryset.order_by().aggregate(
+        updated_at=Max("updated_at"), count=Count("*")
+    )
+
+
+# Answers re-polls with 304 Not Modified. get_version() reads whatever
+# the page shows in a single query: updated_at of the objects, the
+# fingerprints of related rows and any other values that show up on it.
+# With the user, the URL, the date (past deadline) and the CSRF secret of
+# the forms on the page that makes the ETag, the latest updated_at is
+# Last-Modified. When the client has them, nothing else is loaded and no
+# template is rendered.
+class ConditionalGetMixin:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # fail on import rather than with a 500 on the first request
+        if cls.get_version is ConditionalGetMixin.get_version:
+            raise ImproperlyConfigured(
+                f"{cls.__name__} must define get_version()"
+            )
+
+    def get_version(self) -> dict | None:
+        raise NotImplementedError
+
+    def get_etag(self, version: dict) -> str:
+        user = self.request.user
+        # login rotates the secret, a cached page would post the old one.
+        # On a first visit this creates the one the page will render.
+        get_token(self.request)
+        key = repr((
+            user.pk,
+            getattr(user, "updated_at", None),
+            self.request.META["CSRF_COOKIE"],
+            self.request.get_full_path(),
+            datetime.date.today(),
+            sorted(version.items()),
+        ))
+        return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    def get(self, request, *args, **kwargs):
+        # messages are shown once, a 304 would leave them for a later page
+        if len(get_messages(request)):
+            return super().get(request, *args, **kwargs)
+
+        version = self.get_version()
+        if version is None:
+            # not found, the view raises the 404
+            return super().get(request, *args, **kwargs)
+
+        etag = self.get_etag(version)
+        last_modified = max(
+            (
+                value for value in version.values()
+                if isinstance(value, datetime.datetime)
+            ),
+            default=None,
+        )
+        last_modified = last_modified and int(last_modified.timestamp())
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        response.headers.setdefault("ETag", etag)
+        if last_modified:
+            response.headers.setdefault(
+                "Last-Modified", http_date(last_modified)
+            )
+        # pages differ between users and change any time, browsers have to
+        # ask every time but may keep a private copy
+        patch_cache_control(response, private=True, no_cache=True)
+
+        return response
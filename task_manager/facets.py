@@ -0,0 +1,83 @@
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from taggit.models import TaggedItem
+
+from .filters import task_filter_params, filter_tasks
+from .models import Task, TagIndex
+
+
+FACET_FIELDS = ("task_type", "is_completed", "priority")
+TOP_TAGS = 10
+
+FACETS_VERSION_KEY = "task-facets-version"
+
+
+# How many tasks each choice of the task filter would list. A facet
+# counts with every filter but its own, so its choices can be compared
+# with each other. That makes the WHERE clause of each facet different,
+# it's one grouped query per facet rather than a single GROUPING SETS.
+def field_counts(params: dict, field: str) -> dict:
+    tasks = filter_tasks(Task.objects.all(), {**params, field: ""})
+    return dict(
+        tasks.order_by().values_list(field).annotate(count=Count("*"))
+    )
+
+
+def tag_counts(params: dict) -> list[tuple[str, int]]:
+    params = {**params, "tags": "", "tags_mode": ""}
+
+    if not any(params.values()):
+        # unfiltered, the tag index has the counts
+        return list(TagIndex.objects.filter(task_count__gt=0).order_by(
+            "-task_count", "name"
+        ).values_list("tag__name", "task_count")[:TOP_TAGS])
+
+    return list(TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(Task),
+        object_id__in=filter_tasks(Task.objects.all(), params).values("pk"),
+    ).values_list("tag__name").annotate(
+        count=Count("*")
+    ).order_by("-count", "tag__name")[:TOP_TAGS])
+
+
+# Cached until a task changes: every write drops the version, which is
+# part of every key. Counts on other processes may be
+# TASK_FACETS_CACHE_TIMEOUT seconds old with the per process cache.
+def invalidate_task_facets() -> None:
+    # after the commit, a page loaded in between would cache the old counts
+    # under the new version
+    transaction.on_commit(lambda: cache.delete(FACETS_VERSION_KEY))
+
+
+def facets_cache_key(params: dict) -> str:
+    version = cache.get_or_set(
+        FACETS_VERSION_KEY, lambda: uuid.uuid4().hex, None
+    )
+    digest = hashlib.md5(
+        json.dumps(params, sort_keys=True).encode()
+    ).hexdigest()
+    return f"task-facets:{version}:{digest}"
+
+
+def get_task_facets(params) -> dict:
+    params = task_filter_params(params)
+    key = facets_cache_key(params)
+
+    facets = cache.get(key)
+    if facets is None:
+        facets = {field: field_counts(params, field) for field in FACET_FIELDS}
+        facets["tags"] = tag_counts(params)
+        cache.set(
+            key,
+            facets,
+            getattr(settings, "TASK_FACETS_CACHE_TIMEOUT", 5 * 60),
+        )
+
+    return facets
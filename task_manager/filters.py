@@ -0,0 +1,94 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, QuerySet
+from taggit.models import TaggedItem
+
+from .search import search
+
+
+TAG_MODES = ("any", "all")
+
+
+# The task and project list filters, shared by the list views, the
+# exports and the export_tasks command. ``params`` is request.GET or any
+# mapping with the same keys.
+def task_filter_params(params) -> dict:
+    return {
+        "name": params.get("name", ""),
+        "task_type": params.get("task_type", ""),
+        # remove coma ',' that taggit_auttosugest is adding to tags
+        "tags": params.get("tags", "").strip(","),
+        "tags_mode": params.get("tags_mode", ""),
+        "is_completed": params.get("is_completed", ""),
+        "priority": params.get("priority", ""),
+    }
+
+
+def tag_names(tags: str) -> list[str]:
+    names = (name.strip() for name in tags.split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+# Objects with any (or all) of the tags. A join on the tags returns an
+# object once per matching tag, this is a semi-join on the tagged items
+# instead so nothing has to be made DISTINCT. For "all" the items are
+# grouped per object and only objects with every tag are kept, a tag is
+# on an object at most once.
+def filter_tags(queryset: QuerySet, tags: str, mode: str = "any") -> QuerySet:
+    names = tag_names(tags)
+    if not names:
+        return queryset
+
+    items = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(queryset.model),
+        tag__name__in=names,
+    ).values("object_id")
+
+    if mode == "all":
+        items = items.annotate(
+            matched=Count("*")
+        ).filter(matched=len(names)).values("object_id")
+
+    return queryset.filter(pk__in=items)
+
+
+def filter_tasks(queryset: QuerySet, params) -> QuerySet:
+    params = task_filter_params(params)
+
+    if params["name"]:
+        queryset = search(queryset, params["name"])
+
+    if params["task_type"]:
+        queryset = queryset.filter(task_type=params["task_type"])
+
+    if params["tags"]:
+        queryset = filter_tags(
+            queryset, params["tags"], params["tags_mode"]
+        )
+
+    if params["is_completed"] == "True":
+        queryset = queryset.filter(is_completed=True)
+
+    if params["is_completed"] == "False":
+        queryset = queryset.filter(is_completed=False)
+
+    if params["priority"]:
+        queryset = queryset.filter(priority=params["priority"])
+
+    return queryset
+
+
+def filter_projects(queryset: QuerySet, params) -> QuerySet:
+    name = params.get("name", "")
+    team_projects = params.get("team_projects", "")
+    tags = params.get("tags", "")
+
+    if name:
+        queryset = search(queryset, name)
+
+    if tags:
+        queryset = filter_tags(queryset, tags, params.get("tags_mode", ""))
+
+    if team_projects:
+        queryset = queryset.filter(teams=team_projects)
+
+    return queryset
@@ -1,12 +1,29 @@
 from django import forms
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from datetime import date, datetime
+from taggit.forms import TagField
+from taggit_autosuggest.widgets import TagAutoSuggest
 
-from .models import Task, Project, TaskType
+from .autocomplete import AutocompleteSelect, AutocompleteSelectMultiple
+from .bulk_actions import BULK_ACTIONS, run_bulk_action
+from .filters import TAG_MODES
+from .imports import IMPORT_FORMATS, guess_format
+from .m2m import sync_m2m
+from .models import Task, Project, TaskType, PRIORITY_CHOICES
 from team_manager.models import Team
 
 
+def tags_mode_field() -> forms.ChoiceField:
+    return forms.ChoiceField(
+        choices=[(mode, f"{mode.title()} of the tags") for mode in TAG_MODES],
+        label="Match",
+        required=False,
+        widget=forms.RadioSelect(),
+    )
+
+
 class TaskFilterForm(forms.ModelForm):
     task_type = forms.ModelChoiceField(
         queryset=TaskType.objects.all(),
@@ -21,10 +38,44 @@ class TaskFilterForm(forms.ModelForm):
         required=False,
         widget=forms.RadioSelect()
     )
+    tags_mode = tags_mode_field()
+    priority = forms.ChoiceField(
+        choices=[("", "Filter by priority")] + PRIORITY_CHOICES,
+        required=False,
+    )
 
     class Meta:
         model = Task
-        fields = ["task_type", "tags", "is_completed"]
+        fields = ["task_type", "tags", "tags_mode", "is_completed", "priority"]
+        widgets = {
+            # suggests the tags used most on tasks
+            "tags": TagAutoSuggest(tagmodel="task_manager.task"),
+        }
+
+    def __init__(self, *args, facets: dict | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if facets:
+            self.show_counts(facets)
+
+    def show_counts(self, facets: dict) -> None:
+        # how many tasks each choice would list, see facets.py
+        task_types = facets["task_type"]
+        self.fields["task_type"].label_from_instance = (
+            lambda obj: f"{obj} ({task_types.get(obj.pk, 0)})"
+        )
+
+        for field in ("is_completed", "priority"):
+            self.fields[field].choices = [
+                (value, label) if value == "" else
+                (value, f"{label} ({facets[field].get(value, 0)})")
+                for value, label in self.fields[field].choices
+            ]
+
+        if facets["tags"]:
+            self.fields["tags"].help_text = "Most used: " + ", ".join(
+                f"{name} ({count})" for name, count in facets["tags"]
+            )
 
 
 class TaskSearchForm(forms.Form):
@@ -49,11 +100,19 @@ class ProjectSearchForm(forms.Form):
         }
         )
     )
+    tags = forms.CharField(
+        label="",
+        required=False,
+        widget=TagAutoSuggest(tagmodel="task_manager.project"),
+    )
+    tags_mode = tags_mode_field()
 
 
 class TaskCreateForm(forms.ModelForm):
     assignees = forms.ModelMultipleChoiceField(
-        widget=forms.CheckboxSelectMultiple,
+        widget=AutocompleteSelectMultiple(
+            "team_manager:coworker-autocomplete"
+        ),
         required=False,
         queryset=None,
     )
@@ -64,6 +123,8 @@ class TaskCreateForm(forms.ModelForm):
         widgets = {
             "owner": forms.HiddenInput(),
             "is_completed": forms.HiddenInput(),
+            "project": AutocompleteSelect("task_manager:project-autocomplete"),
+            "tags": TagAutoSuggest(tagmodel="task_manager.task"),
             "deadline": forms.DateInput(attrs={
                 "type": "date",
                 })
@@ -82,7 +143,9 @@ class TaskCreateForm(forms.ModelForm):
 
 class TaskChangeStatusForm(forms.ModelForm):
     assignees = forms.ModelMultipleChoiceField(
-        widget=forms.CheckboxSelectMultiple,
+        widget=AutocompleteSelectMultiple(
+            "team_manager:coworker-autocomplete"
+        ),
         required=False,
         queryset=None
     )
@@ -104,31 +167,85 @@ class TaskChangeStatusForm(forms.ModelForm):
             teams__members=user
         )
 
+    def _save_m2m(self):
+        sync_m2m(
+            self.instance.assignees, self.cleaned_data.get("assignees", [])
+        )
+
     def save(self, commit=True):
         task = super().save(commit=False)
+        task.is_completed = bool(self.cleaned_data.get("is_completed"))
 
-        update_assignees = self.cleaned_data.get("assignees", [])
-        update_is_completed = self.cleaned_data.get("is_completed", "")
+        if commit:
+            with transaction.atomic():
+                if "is_completed" in self.changed_data:
+                    task.save(update_fields=["is_completed", "updated_at"])
+                self._save_m2m()
 
-        task.assignees.clear()
-        task.assignees.add(*update_assignees)
+        return task
 
-        if update_is_completed:
-            task.is_completed = True
-        else:
-            task.is_completed = False
 
-        if commit:
-            task.save()
+class TaskBulkActionForm(forms.Form):
+    tasks = forms.ModelMultipleChoiceField(
+        queryset=Task.objects.only("id"),
+        widget=forms.MultipleHiddenInput,
+    )
+    action = forms.ChoiceField(choices=BULK_ACTIONS)
+    priority = forms.ChoiceField(
+        choices=[("", "Priority")] + PRIORITY_CHOICES,
+        required=False,
+    )
+    assignees = forms.ModelMultipleChoiceField(
+        widget=AutocompleteSelectMultiple(
+            "team_manager:coworker-autocomplete"
+        ),
+        required=False,
+        queryset=None
+    )
+    tags = TagField(required=False)
 
-        return task
+    def __init__(self, user, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user = user
+        # same choices as TaskChangeStatusForm
+        self.fields["assignees"].queryset = get_user_model().objects.filter(
+            teams__members=user
+        )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        action = cleaned_data.get("action")
+        required = {
+            "set_priority": "priority",
+            "add_assignees": "assignees",
+            "remove_assignees": "assignees",
+            "add_tags": "tags",
+            "remove_tags": "tags",
+        }.get(action)
+
+        if required and not cleaned_data.get(required):
+            self.add_error(required, "This field is required for this action.")
+
+        return cleaned_data
+
+    def save(self) -> tuple[int, int]:
+        return run_bulk_action(
+            self.user,
+            self.cleaned_data["action"],
+            [task.pk for task in self.cleaned_data["tasks"]],
+            priority=self.cleaned_data["priority"],
+            worker_ids=[
+                worker.pk for worker in self.cleaned_data["assignees"]
+            ],
+            tag_names=self.cleaned_data["tags"],
+        )
 
 
 class ProjectCreateForm(forms.ModelForm):
     teams = forms.ModelMultipleChoiceField(
         queryset=Team.objects.all(),
         required=True,
-        widget=forms.CheckboxSelectMultiple,
+        widget=AutocompleteSelectMultiple("team_manager:team-autocomplete"),
     )
 
     class Meta:
@@ -139,7 +256,8 @@ class ProjectCreateForm(forms.ModelForm):
             "is_completed": forms.HiddenInput(),
             "deadline": forms.DateInput(attrs={
                 "type": "date",
-            })
+            }),
+            "tags": TagAutoSuggest(tagmodel="task_manager.project"),
         }
 
     def clean_deadline(self):
@@ -147,6 +265,47 @@ class ProjectCreateForm(forms.ModelForm):
         return valid_deadline(deadline)
 
 
+class ProjectUpdateForm(forms.ModelForm):
+    class Meta:
+        model = Project
+        fields = "__all__"
+        widgets = {
+            "teams": AutocompleteSelectMultiple(
+                "team_manager:team-autocomplete"
+            ),
+            "owner": AutocompleteSelect("team_manager:worker-autocomplete"),
+            "tags": TagAutoSuggest(tagmodel="task_manager.project"),
+        }
+
+
+class TaskImportForm(forms.Form):
+    file = forms.FileField(
+        help_text="CSV or JSONL with the same columns as the task export.",
+    )
+    format = forms.ChoiceField(
+        choices=[("", "From the file extension")] + [
+            (import_format, import_format.upper())
+            for import_format in IMPORT_FORMATS
+        ],
+        required=False,
+    )
+    dry_run = forms.BooleanField(
+        label="Only validate",
+        required=False,
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        file = cleaned_data.get("file")
+
+        if file and not cleaned_data.get("format"):
+            cleaned_data["format"] = guess_format(file.name)
+            if cleaned_data["format"] is None:
+                self.add_error("format", "Can't tell the file format.")
+
+        return cleaned_data
+
+
 def valid_deadline(deadline: date) -> date:
     if deadline < datetime.today().date():
         raise ValidationError("Deadline cannot be in the past!")
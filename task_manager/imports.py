@@ -0,0 +1,302 @@
+import csv
+import json
+from datetime import date
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.utils import timezone
+from taggit.models import TaggedItem
+
+from .exports import LIST_SEPARATOR
+from .facets import invalidate_task_facets
+from .m2m import get_tag_ids, insert_rows
+from .models import TaskType, Task, Project, PRIORITY_CHOICES
+from .search import deferred_search_index
+from .tag_index import refresh_tag_index
+from team_manager.counters import adjust_counter
+
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+BATCH_SIZE = 5000
+
+TASK_FIELDS = [
+    "name",
+    "description",
+    "deadline",
+    "is_completed",
+    "priority",
+    "task_type",
+    "project",
+    "owner",
+    "updated_at",
+]
+
+PRIORITIES = {priority for priority, label in PRIORITY_CHOICES}
+
+TRUE_VALUES = {"true", "1", "yes", "y", "on"}
+FALSE_VALUES = {"false", "0", "no", "n", "off", ""}
+
+
+class RowError(Exception):
+    pass
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.errors = []
+
+    def add_error(self, row: int, message: str) -> None:
+        self.errors.append((row, message))
+
+
+def guess_format(filename: str) -> str | None:
+    extension = filename.rsplit(".", 1)[-1].lower()
+    return extension if extension in IMPORT_FORMATS else None
+
+
+# Both readers yield (row number, dict), or (row number, error message)
+# for rows that can't be parsed at all. CSV files use the export columns.
+def read_csv(file):
+    for number, row in enumerate(csv.DictReader(file), start=1):
+        if None in row:
+            yield number, "Row has more values than the header"
+        else:
+            yield number, row
+
+
+def read_jsonl(file):
+    number = 0
+
+    for line in file:
+        if not line.strip():
+            continue
+        number += 1
+
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield number, f"Invalid JSON: {e}"
+            continue
+
+        if isinstance(row, dict):
+            yield number, row
+        else:
+            yield number, "Expected a JSON object"
+
+
+READERS = {
+    "csv": read_csv,
+    "jsonl": read_jsonl,
+}
+
+
+def text(row: dict, field: str) -> str:
+    value = row.get(field)
+    return "" if value is None else str(value).strip()
+
+
+def names(row: dict, field: str) -> list:
+    value = row.get(field) or []
+
+    if isinstance(value, str):
+        value = value.split(LIST_SEPARATOR)
+
+    return list(dict.fromkeys(
+        str(name).strip() for name in value if str(name).strip()
+    ))
+
+
+# Rows are validated in plain Python and the names they refer to are
+# resolved with one query per model and batch. Tasks, assignees and tags
+# go in with executemany(), model instances and bulk_create() cost more
+# than the inserts themselves. Invalid rows are reported and skipped, the
+# rest of the batch is imported.
+class TaskImporter:
+    def __init__(
+        self,
+        batch_size: int = BATCH_SIZE,
+        default_owner=None,
+        dry_run: bool = False,
+    ):
+        self.batch_size = batch_size
+        self.default_owner_id = default_owner.pk if default_owner else None
+        self.dry_run = dry_run
+        self.result = ImportResult()
+
+    def run(self, file, import_format: str) -> ImportResult:
+        rows = READERS[import_format](file)
+
+        while batch := list(islice(rows, self.batch_size)):
+            self.import_batch(batch)
+
+        return self.result
+
+    def clean(self, row: dict) -> dict:
+        name = text(row, "name")
+        if not name:
+            raise RowError("name is required")
+        if len(name) > 255:
+            raise RowError("name is longer than 255 characters")
+
+        try:
+            deadline = date.fromisoformat(text(row, "deadline"))
+        except ValueError:
+            raise RowError("deadline must be a YYYY-MM-DD date")
+
+        is_completed = row.get("is_completed")
+        if not isinstance(is_completed, bool):
+            is_completed = text(row, "is_completed").lower()
+            if is_completed not in TRUE_VALUES | FALSE_VALUES:
+                raise RowError("is_completed must be true or false")
+            is_completed = is_completed in TRUE_VALUES
+
+        priority = text(row, "priority").lower() or "medium"
+        if priority not in PRIORITIES:
+            raise RowError(f"unknown priority {priority!r}")
+
+        task_type = text(row, "task_type")
+        if not task_type:
+            raise RowError("task_type is required")
+
+        # max_length of taggit's Tag.name
+        tags = names(row, "tags")
+        if any(len(tag) > 100 for tag in tags):
+            raise RowError("tags can't be longer than 100 characters")
+
+        return {
+            "name": name,
+            "description": text(row, "description") or None,
+            "deadline": deadline,
+            "is_completed": is_completed,
+            "priority": priority,
+            "task_type": task_type,
+            "project": text(row, "project"),
+            "owner": text(row, "owner"),
+            "assignees": names(row, "assignees"),
+            "tags": tags,
+        }
+
+    def import_batch(self, batch: list) -> None:
+        cleaned = []
+
+        for number, row in batch:
+            if isinstance(row, str):
+                self.result.add_error(number, row)
+                continue
+
+            try:
+                cleaned.append((number, self.clean(row)))
+            except RowError as e:
+                self.result.add_error(number, str(e))
+
+        task_types = dict(TaskType.objects.filter(
+            name__in={row["task_type"] for _, row in cleaned}
+        ).order_by().values_list("name", "id"))
+        projects = dict(Project.objects.filter(
+            name__in={row["project"] for _, row in cleaned if row["project"]}
+        ).order_by().values_list("name", "id"))
+        workers = dict(get_user_model().objects.filter(
+            username__in={
+                username
+                for _, row in cleaned
+                for username in [row["owner"], *row["assignees"]]
+                if username
+            }
+        ).order_by().values_list("username", "id"))
+        taken = set(Task.objects.filter(
+            name__in=[row["name"] for _, row in cleaned]
+        ).order_by().values_list("name", flat=True))
+
+        tasks = []
+        for number, row in cleaned:
+            try:
+                tasks.append(self.resolve(
+                    row, task_types, projects, workers, taken
+                ))
+            except RowError as e:
+                self.result.add_error(number, str(e))
+
+        if tasks and not self.dry_run:
+            self.insert(tasks)
+
+        self.result.created += len(tasks)
+
+    def resolve(
+        self,
+        row: dict,
+        task_types: dict,
+        projects: dict,
+        workers: dict,
+        taken: set,
+    ) -> tuple:
+        if row["name"] in taken:
+            raise RowError(f"a task named {row['name']!r} already exists")
+
+        if row["task_type"] not in task_types:
+            raise RowError(f"unknown task type {row['task_type']!r}")
+
+        if row["project"] and row["project"] not in projects:
+            raise RowError(f"unknown project {row['project']!r}")
+
+        for username in [row["owner"], *row["assignees"]]:
+            if username and username not in workers:
+                raise RowError(f"unknown worker {username!r}")
+
+        taken.add(row["name"])
+
+        task = (
+            row["name"],
+            row["description"],
+            row["deadline"].isoformat(),
+            row["is_completed"],
+            row["priority"],
+            task_types[row["task_type"]],
+            projects.get(row["project"]),
+            workers.get(row["owner"], self.default_owner_id),
+        )
+        assignee_ids = [workers[username] for username in row["assignees"]]
+
+        return task, assignee_ids, row["tags"]
+
+    def insert(self, tasks: list) -> None:
+        with transaction.atomic():
+            tag_ids = get_tag_ids(
+                {name for _, _, tags in tasks for name in tags}
+            )
+            # auto_now isn't applied to raw inserts
+            updated_at = connection.ops.adapt_datetimefield_value(
+                timezone.now()
+            )
+            with deferred_search_index(Task._meta.db_table):
+                insert_rows(Task, TASK_FIELDS, [
+                    (*task, updated_at) for task, _, _ in tasks
+                ])
+            # names are unique and were checked above, one lookup gets the
+            # ids of the whole batch
+            task_ids = dict(Task.objects.filter(
+                name__in=[task[0] for task, _, _ in tasks]
+            ).order_by().values_list("name", "id"))
+
+            content_type = ContentType.objects.get_for_model(Task)
+            insert_rows(Task.assignees.through, ["task", "worker"], [
+                (task_ids[task[0]], worker_id)
+                for task, assignee_ids, _ in tasks
+                for worker_id in assignee_ids
+            ])
+            insert_rows(TaggedItem, ["content_type", "object_id", "tag"], [
+                (content_type.pk, task_ids[task[0]], tag_ids[name])
+                for task, _, tags in tasks
+                for name in tags
+            ])
+
+            # the raw inserts don't send the signals the counters rely on
+            adjust_counter(
+                "completed_tasks",
+                sum(task[3] for task, _, _ in tasks),
+            )
+            refresh_tag_index(tag_ids.values())
+            invalidate_task_facets()
@@ -0,0 +1,143 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.template.backends.django import DjangoTemplates
+from django.template.backends.django import Template as BackendTemplate
+
+from .metrics import observe_request
+
+
+logger = logging.getLogger("task_manager.instrumentation")
+
+SLOW_QUERY_MS = 100
+
+
+def view_name(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match else "-"
+
+
+class RequestTimings:
+    def __init__(self, request, slow_query_ms: float):
+        self.request = request
+        self.slow_query = slow_query_ms / 1000
+        self.queries = 0
+        self.db = 0.0
+        self.template = 0.0
+        self.rendering = False
+
+    # installed with connection.execute_wrapper(), wraps every query the
+    # request runs on any database
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.queries += 1
+            self.db += elapsed
+
+            if elapsed >= self.slow_query:
+                logger.warning(
+                    "slow query view=%s duration=%.1fms sql=%s",
+                    view_name(self.request),
+                    elapsed * 1000,
+                    sql,
+                    extra={
+                        "view": view_name(self.request),
+                        "duration_ms": round(elapsed * 1000, 1),
+                        "sql": sql,
+                    },
+                )
+
+
+# What render(), render_to_string() and TemplateResponse render, includes
+# and extends happen inside it. Time is added to the request passed along,
+# templates rendered without one aren't counted.
+class InstrumentedTemplate(BackendTemplate):
+    def render(self, context=None, request=None):
+        timings = getattr(request, "timings", None)
+        if timings is None or timings.rendering:
+            return super().render(context, request)
+
+        started = time.perf_counter()
+        timings.rendering = True
+        try:
+            return super().render(context, request)
+        finally:
+            timings.rendering = False
+            timings.template += time.perf_counter() - started
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    def from_string(self, template_code):
+        template = super().from_string(template_code)
+        return InstrumentedTemplate(template.template, self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return InstrumentedTemplate(template.template, self)
+
+
+# Query count, database time, template render time and total time for
+# every request, sent back as a Server-Timing header and logged as one
+# line. Latency, query count and response size also go into the /metrics
+# histograms. Only counters are kept per query, the cost is a few function
+# calls per query and per request. Template time needs the
+# InstrumentedDjangoTemplates backend and only covers templates rendered
+# with the request, like render() and TemplateResponse do.
+class InstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.slow_query_ms = getattr(
+            settings, "SLOW_QUERY_MS", SLOW_QUERY_MS
+        )
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        timings = request.timings = RequestTimings(
+            request, self.slow_query_ms
+        )
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timings))
+            response = self.get_response(request)
+
+        total = time.perf_counter() - started
+        observe_request(view_name(request), total, timings.queries, response)
+
+        response["Server-Timing"] = (
+            f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} '
+            f'queries", template;dur={timings.template * 1000:.1f}, '
+            f"total;dur={total * 1000:.1f}"
+        )
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "request method=%s path=%s view=%s status=%s "
+                "total=%.1fms db=%.1fms queries=%d template=%.1fms",
+                request.method,
+                request.path,
+                view_name(request),
+                response.status_code,
+                total * 1000,
+                timings.db * 1000,
+                timings.queries,
+                timings.template * 1000,
+                extra={
+                    "method": request.method,
+                    "path": request.path,
+                    "view": view_name(request),
+                    "status": response.status_code,
+                    "total_ms": round(total * 1000, 1),
+                    "db_ms": round(timings.db * 1000, 1),
+                    "queries": timings.queries,
+                    "template_ms": round(timings.template * 1000, 1),
+                },
+            )
+
+        return response
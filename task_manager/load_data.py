@@ -0,0 +1,313 @@
+import random
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from taggit.models import Tag, TaggedItem
+
+from .facets import invalidate_task_facets
+from .m2m import insert_rows
+from .models import TaskType, Task, Project, PRIORITY_CHOICES
+from .tag_index import rebuild_tag_index
+from team_manager.counters import rebuild_counters
+from team_manager.models import Position, Team
+
+
+POSITIONS = [
+    "Backend developer",
+    "Frontend developer",
+    "QA engineer",
+    "DevOps engineer",
+    "Designer",
+    "Project manager",
+    "Data analyst",
+]
+
+TASK_TYPES = [
+    "Bug",
+    "Feature",
+    "Refactoring",
+    "Documentation",
+    "Research",
+    "Testing",
+    "Deployment",
+    "Support",
+]
+
+WORDS = (
+    "api cache login page report export import search filter dashboard "
+    "deploy database migration index query form template team project "
+    "worker deadline review release payment email notification mobile "
+    "layout upload download permission token session backup monitor"
+).split()
+
+
+# Builds a realistic worker/team/project/task graph with bulk inserts.
+# The same seed and sizes always produce the same data. Only ids and small
+# per-team/per-project lists are kept in memory, tasks and their m2m rows
+# are generated and inserted one batch at a time.
+class LoadDataGenerator:
+    def __init__(
+        self,
+        workers: int = 0,
+        teams: int = 0,
+        projects: int = 0,
+        tasks: int = 0,
+        tags: int = 0,
+        task_types: int = len(TASK_TYPES),
+        seed: int = 0,
+        prefix: str = "load",
+        batch_size: int = 5000,
+        password: str = "load-password",
+        log=None,
+    ):
+        self.sizes = {
+            "workers": workers,
+            "teams": teams,
+            "projects": projects,
+            "tasks": tasks,
+            "tags": tags,
+        }
+        self.task_type_count = task_types
+        self.rng = random.Random(seed)
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.password = password
+        self.log = log or (lambda message: None)
+        self.today = date.today()
+
+    def task_name(self, i: int) -> str:
+        return f"{self.prefix}-task-{i:09}"
+
+    def batches(self, total: int):
+        for start in range(0, total, self.batch_size):
+            yield range(start, min(start + self.batch_size, total))
+
+    def sentence(self, low: int, high: int) -> str:
+        return " ".join(
+            self.rng.choices(WORDS, k=self.rng.randint(low, high))
+        )
+
+    def sample(self, population: list, low: int, high: int) -> list:
+        if not population:
+            return []
+        count = min(self.rng.randint(low, high), len(population))
+        return self.rng.sample(population, count)
+
+    def generate(self) -> None:
+        self.create_positions()
+        self.create_task_types()
+        self.create_workers()
+        self.create_teams()
+        self.create_tags()
+        self.create_projects()
+        self.create_tasks()
+        # bulk inserts skip the signals that keep the counters, the tag
+        # index and the filter counts up to date
+        rebuild_counters()
+        rebuild_tag_index()
+        invalidate_task_facets()
+
+    def create_positions(self) -> None:
+        self.position_ids = [
+            Position.objects.get_or_create(name=name)[0].id
+            for name in POSITIONS
+        ]
+
+    def create_task_types(self) -> None:
+        names = TASK_TYPES[:self.task_type_count] + [
+            f"{self.prefix}-type-{i}"
+            for i in range(len(TASK_TYPES), self.task_type_count)
+        ]
+        self.task_type_ids = [
+            TaskType.objects.get_or_create(name=name)[0].id
+            for name in names
+        ]
+
+    def create_workers(self) -> None:
+        worker_model = get_user_model()
+        # hashing is slow, every generated worker shares one hash
+        password = make_password(self.password, salt=self.prefix)
+        self.worker_ids = []
+
+        for batch in self.batches(self.sizes["workers"]):
+            workers = worker_model.objects.bulk_create(
+                worker_model(
+                    username=f"{self.prefix}-worker-{i:07}",
+                    password=password,
+                    first_name=self.rng.choice(WORDS).title(),
+                    last_name=self.rng.choice(WORDS).title(),
+                    position_id=self.rng.choice(self.position_ids),
+                )
+                for i in batch
+            )
+            self.worker_ids.extend(
+                self.ids(worker_model, workers, "username")
+            )
+
+        self.log(f"workers: {len(self.worker_ids)}")
+
+    def create_teams(self) -> None:
+        self.team_ids = []
+        self.team_members = []
+        through = Team.members.through
+
+        for batch in self.batches(self.sizes["teams"]):
+            teams = Team.objects.bulk_create(
+                Team(
+                    name=f"{self.prefix}-team-{i:07}",
+                    description=self.sentence(5, 15),
+                    owner_id=self.owner_id(),
+                )
+                for i in batch
+            )
+            rows = []
+
+            for team_id in self.ids(Team, teams, "name"):
+                members = self.sample(self.worker_ids, 3, 15)
+                self.team_ids.append(team_id)
+                self.team_members.append(members)
+                rows.extend((team_id, worker_id) for worker_id in members)
+
+            insert_rows(through, ["team", "worker"], rows)
+
+        self.log(f"teams: {len(self.team_ids)}")
+
+    def create_tags(self) -> None:
+        self.tag_ids = []
+
+        for batch in self.batches(self.sizes["tags"]):
+            tags = Tag.objects.bulk_create(
+                Tag(
+                    name=f"{self.prefix}-tag-{i}",
+                    slug=f"{self.prefix}-tag-{i}",
+                )
+                for i in batch
+            )
+            self.tag_ids.extend(self.ids(Tag, tags, "name"))
+
+        self.log(f"tags: {len(self.tag_ids)}")
+
+    def create_projects(self) -> None:
+        self.project_ids = []
+        self.project_teams = []
+        through = Project.teams.through
+        content_type = ContentType.objects.get_for_model(Project)
+
+        for batch in self.batches(self.sizes["projects"]):
+            projects = Project.objects.bulk_create(
+                Project(
+                    name=f"{self.prefix}-project-{i:07}",
+                    description=self.sentence(10, 30),
+                    is_completed=self.rng.random() < 0.3,
+                    priority=self.rng.choice(PRIORITY_CHOICES)[0],
+                    deadline=self.deadline(),
+                    owner_id=self.owner_id(),
+                )
+                for i in batch
+            )
+            team_rows = []
+            tag_rows = []
+
+            for project_id in self.ids(Project, projects, "name"):
+                teams = self.sample(range(len(self.team_ids)), 1, 3)
+                self.project_ids.append(project_id)
+                self.project_teams.append(teams)
+                team_rows.extend(
+                    (project_id, self.team_ids[t]) for t in teams
+                )
+                tag_rows.extend(
+                    (content_type.id, project_id, tag_id)
+                    for tag_id in self.sample(self.tag_ids, 0, 3)
+                )
+
+            with transaction.atomic():
+                insert_rows(through, ["project", "team"], team_rows)
+                self.insert_tagged_items(tag_rows)
+
+        self.log(f"projects: {len(self.project_ids)}")
+
+    def create_tasks(self) -> None:
+        through = Task.assignees.through
+        content_type = ContentType.objects.get_for_model(Task)
+        created = 0
+
+        for batch in self.batches(self.sizes["tasks"]):
+            projects = [
+                self.rng.randrange(len(self.project_ids))
+                if self.project_ids else None
+                for _ in batch
+            ]
+            tasks = [
+                Task(
+                    name=self.task_name(i),
+                    description=self.sentence(5, 40),
+                    deadline=self.deadline(),
+                    is_completed=self.rng.random() < 0.6,
+                    priority=self.rng.choice(PRIORITY_CHOICES)[0],
+                    task_type_id=self.rng.choice(self.task_type_ids),
+                    owner_id=self.owner_id(),
+                    project_id=(
+                        None if project is None
+                        else self.project_ids[project]
+                    ),
+                )
+                for i, project in zip(batch, projects)
+            ]
+
+            with transaction.atomic():
+                Task.objects.bulk_create(tasks)
+                assignee_rows = []
+                tag_rows = []
+
+                task_ids = self.ids(Task, tasks, "name")
+                for task_id, project in zip(task_ids, projects):
+                    assignee_rows.extend(
+                        (task_id, worker_id)
+                        for worker_id in self.sample(
+                            self.project_members(project), 0, 3
+                        )
+                    )
+                    tag_rows.extend(
+                        (content_type.id, task_id, tag_id)
+                        for tag_id in self.sample(self.tag_ids, 0, 4)
+                    )
+
+                insert_rows(through, ["task", "worker"], assignee_rows)
+                self.insert_tagged_items(tag_rows)
+
+            created += len(tasks)
+            self.log(f"tasks: {created}")
+
+    def project_members(self, project: int | None) -> list:
+        if project is None or not self.project_teams[project]:
+            return self.worker_ids
+
+        team = self.rng.choice(self.project_teams[project])
+        return self.team_members[team]
+
+    def owner_id(self) -> int | None:
+        if not self.worker_ids:
+            return None
+        return self.rng.choice(self.worker_ids)
+
+    def deadline(self) -> date:
+        return self.today + timedelta(days=self.rng.randint(-90, 365))
+
+    def insert_tagged_items(self, rows: list) -> None:
+        insert_rows(TaggedItem, ["content_type", "object_id", "tag"], rows)
+
+    def ids(self, model, objs: list, field: str) -> list:
+        # databases that can't return ids from bulk inserts need a lookup
+        if objs and objs[0].pk is None:
+            values = [getattr(obj, field) for obj in objs]
+            id_by_value = dict(
+                model.objects.filter(
+                    **{f"{field}__in": values}
+                ).values_list(field, "id")
+            )
+            return [id_by_value[value] for value in values]
+
+        return [obj.pk for obj in objs]
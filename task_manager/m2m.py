@@ -0,0 +1,107 @@
+from django.db import connection, transaction
+from django.utils.text import slugify
+from taggit.models import Tag
+
+
+# What RelatedManager.set() does without its extra lookups: the current
+# ids are read from the through table without joining the target table,
+# then a DELETE and an INSERT are issued only if something was removed or
+# added. remove() and add() still send m2m_changed. Callers that write
+# more than one relation wrap them in their own transaction, this joins it
+# instead of adding a savepoint.
+def sync_m2m(manager, objs) -> tuple[set, set]:
+    ids = {getattr(obj, "pk", obj) for obj in objs}
+    ids = {int(pk) for pk in ids}
+
+    with transaction.atomic(savepoint=False):
+        current = set(
+            manager.through.objects.filter(
+                **{manager.source_field_name: manager.instance.pk}
+            ).values_list(f"{manager.target_field_name}_id", flat=True)
+        )
+        removed = current - ids
+        added = ids - current
+
+        if removed:
+            manager.remove(*removed)
+        if added:
+            manager.add(*added)
+
+    return added, removed
+
+
+def insert_rows(model, fields: list, rows: list) -> None:
+    # rows are plain tuples in the order of fields, building model
+    # instances for them costs more than the insert itself. No signals are
+    # sent and no defaults are applied.
+    if not rows:
+        return
+
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(
+        quote_name(model._meta.get_field(field).column)
+        for field in fields
+    )
+    placeholders = ", ".join(["%s"] * len(fields))
+
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {quote_name(model._meta.db_table)} "
+            f"({columns}) VALUES ({placeholders})",
+            rows,
+        )
+
+
+def delete_rows(queryset) -> int:
+    # one DELETE of the rows the queryset matches. QuerySet.delete() loads
+    # them first to send pre_delete and post_delete and to collect the rows
+    # referring to them. Here nothing is sent and nothing cascades, the
+    # caller deletes the referring rows before.
+    model = queryset.model
+    quote_name = connection.ops.quote_name
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote_name(model._meta.db_table)} "
+            f"WHERE {quote_name(model._meta.pk.column)} IN ({sql})",
+            params,
+        )
+        return cursor.rowcount
+
+
+def get_tag_ids(tag_names: set) -> dict:
+    # existing tags are looked up and missing ones created, two queries
+    # plus two more when there are new tags. Tag.save() would pick a free
+    # slug the same way, one query at a time
+    if not tag_names:
+        return {}
+
+    ids = dict(
+        Tag.objects.filter(name__in=tag_names).values_list("name", "id")
+    )
+    missing = sorted(tag_names - ids.keys())
+
+    if missing:
+        slugs = {name: slugify(name, allow_unicode=True) or "tag"
+                 for name in missing}
+        taken = set(Tag.objects.filter(
+            slug__in=slugs.values()
+        ).values_list("slug", flat=True))
+        new_tags = []
+
+        for name in missing:
+            slug = slugs[name]
+            suffix = 1
+            while slug in taken:
+                slug = f"{slugs[name]}_{suffix}"
+                suffix += 1
+            taken.add(slug)
+            new_tags.append(Tag(name=name, slug=slug))
+
+        Tag.objects.bulk_create(new_tags)
+        ids.update(Tag.objects.filter(
+            name__in=missing
+        ).values_list("name", "id"))
+
+    return ids
@@ -0,0 +1,282 @@
+import json
+import logging
+import os
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+from django.views import generic
+
+from task_manager.load_data import LoadDataGenerator
+from team_manager.models import Team
+
+
+BENCHED_VIEWS = (generic.ListView, generic.DetailView, generic.CreateView)
+
+NAMESPACES = ("task_manager", "team_manager")
+
+SIZES = {
+    "small": {
+        "workers": 50,
+        "teams": 10,
+        "projects": 50,
+        "tasks": 1_000,
+        "tags": 50,
+    },
+    "medium": {
+        "workers": 500,
+        "teams": 50,
+        "projects": 500,
+        "tasks": 10_000,
+        "tags": 200,
+    },
+    "large": {
+        "workers": 2_000,
+        "teams": 200,
+        "projects": 2_000,
+        "tasks": 100_000,
+        "tags": 500,
+    },
+}
+
+# latency regressions smaller than this are noise, whatever the tolerance
+LATENCY_SLACK_MS = 2.0
+
+
+class Rollback(Exception):
+    pass
+
+
+def benched_urls() -> dict:
+    urls = {}
+
+    for resolver in get_resolver().url_patterns:
+        if not isinstance(resolver, URLResolver):
+            continue
+        if resolver.namespace not in NAMESPACES:
+            continue
+
+        for pattern in resolver.url_patterns:
+            view_class = getattr(pattern.callback, "view_class", None)
+            if view_class and issubclass(view_class, BENCHED_VIEWS):
+                name = f"{resolver.namespace}:{pattern.name}"
+                urls[name] = (view_class, "pk" in pattern.pattern.converters)
+
+    return urls
+
+
+def percentile(values: list, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time every list, detail and create view of both apps on generated "
+        "datasets and compare the results with stored baselines. The data "
+        "is generated in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="small,medium",
+            help=f"Comma separated dataset sizes out of {', '.join(SIZES)}",
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--views",
+            default="",
+            help="Only URL names containing this text",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=os.path.join(settings.BASE_DIR, "bench_baseline.json"),
+        )
+        parser.add_argument(
+            "--save",
+            action="store_true",
+            help="Store the results as the new baseline instead of "
+                 "comparing against it",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.5,
+            help="Allowed relative growth of latency and response size",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        sizes = [size for size in options["sizes"].split(",") if size]
+        unknown = set(sizes) - SIZES.keys()
+        if unknown:
+            raise CommandError(f"Unknown sizes: {', '.join(sorted(unknown))}")
+
+        # fail before the slow part, there would be nothing to compare with
+        if not options["save"] and not os.path.exists(options["baseline"]):
+            raise CommandError(
+                f"No baseline at {options['baseline']}, run with --save"
+            )
+
+        # the per-request log lines would drown the report
+        logging.getLogger("task_manager.instrumentation").setLevel(
+            logging.WARNING
+        )
+
+        results = {
+            size: self.run_size(size, options) for size in sizes
+        }
+
+        if options["save"]:
+            self.save(options["baseline"], results)
+            return
+
+        with open(options["baseline"]) as file:
+            baseline = json.load(file)
+
+        regressions = self.compare(baseline, results, options["tolerance"])
+        if regressions:
+            for regression in regressions:
+                self.stderr.write(self.style.ERROR(regression))
+            raise CommandError(f"{len(regressions)} regressions")
+
+        self.stdout.write(self.style.SUCCESS("No regressions"))
+
+    def run_size(self, size: str, options) -> dict:
+        self.stdout.write(self.style.MIGRATE_HEADING(size))
+
+        try:
+            with transaction.atomic():
+                LoadDataGenerator(
+                    seed=options["seed"], prefix="bench", **SIZES[size]
+                ).generate()
+                results = self.measure(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+        return results
+
+    def measure(self, options) -> dict:
+        # an address outside INTERNAL_IPS, so debug_toolbar stays out of
+        # the timings like it does in production
+        client = Client(
+            HTTP_HOST=(settings.ALLOWED_HOSTS or ["testserver"])[0],
+            REMOTE_ADDR="192.0.2.1",
+        )
+        client.force_login(self.user())
+        results = {}
+
+        for name, (view_class, detail) in benched_urls().items():
+            if options["views"] not in name:
+                continue
+
+            kwargs = {"pk": self.middle_pk(view_class)} if detail else {}
+            url = reverse(name, kwargs=kwargs)
+            results[name] = self.measure_url(client, url, options["repeat"])
+            self.report(name, results[name])
+
+        return results
+
+    def user(self):
+        # a member of the biggest team, so membership checks and the
+        # coworker lists have something to find
+        team = Team.objects.annotate(
+            member_count=Count("members")
+        ).order_by("-member_count", "id").first()
+        return team.members.order_by("id").first()
+
+    def middle_pk(self, view_class) -> int:
+        queryset = view_class.model._default_manager.order_by("pk")
+        return queryset.values_list("pk", flat=True)[queryset.count() // 2]
+
+    def measure_url(self, client: Client, url: str, repeat: int) -> dict:
+        timings = []
+
+        # the first request warms up caches and imports
+        client.get(url)
+
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = client.get(url)
+                if response.streaming:
+                    size = sum(len(chunk) for chunk in response)
+                else:
+                    size = len(response.content)
+                timings.append((time.perf_counter() - start) * 1000)
+
+            if response.status_code != 200:
+                raise CommandError(f"{url} returned {response.status_code}")
+
+        return {
+            "p50_ms": round(statistics.median(timings), 2),
+            "p95_ms": round(percentile(timings, 0.95), 2),
+            "queries": len(queries),
+            "bytes": size,
+        }
+
+    def report(self, name: str, result: dict) -> None:
+        self.stdout.write(
+            f"  {name:<40} p50 {result['p50_ms']:>8.2f} ms  "
+            f"p95 {result['p95_ms']:>8.2f} ms  "
+            f"{result['queries']:>4} queries  {result['bytes']:>8} bytes"
+        )
+
+    def compare(self, baseline: dict, results: dict, tolerance: float):
+        regressions = []
+
+        for size, views in results.items():
+            for name, result in views.items():
+                base = baseline.get(size, {}).get(name)
+                if base is None:
+                    continue
+
+                # p95 is only reported, a few stray GC pauses or context
+                # switches in 20 requests move it too much to gate on
+                limit = max(
+                    base["p50_ms"] * (1 + tolerance),
+                    base["p50_ms"] + LATENCY_SLACK_MS,
+                )
+                if result["p50_ms"] > limit:
+                    regressions.append(
+                        f"{size} {name}: p50 {result['p50_ms']} ms > "
+                        f"{base['p50_ms']} ms baseline"
+                    )
+
+                # query counts are deterministic, any growth is a regression
+                if result["queries"] > base["queries"]:
+                    regressions.append(
+                        f"{size} {name}: {result['queries']} queries > "
+                        f"{base['queries']} baseline"
+                    )
+
+                if result["bytes"] > base["bytes"] * (1 + tolerance):
+                    regressions.append(
+                        f"{size} {name}: {result['bytes']} bytes > "
+                        f"{base['bytes']} baseline"
+                    )
+
+        return regressions
+
+    def save(self, path: str, results: dict) -> None:
+        baseline = {}
+        if os.path.exists(path):
+            with open(path) as file:
+                baseline = json.load(file)
+
+        # sizes that weren't run keep their old baseline
+        baseline.update(results)
+
+        with open(path, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+        self.stdout.write(f"Saved baseline to {path}")
@@ -0,0 +1,123 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from task_manager.load_data import LoadDataGenerator
+from task_manager.models import TaskType, Task, Project
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare EXPLAIN plans and timings of the task list queries with "
+        "and without the task/project indexes on a generated dataset. "
+        "Everything runs in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=100_000)
+        parser.add_argument("--projects", type=int, default=10_000)
+        parser.add_argument("--task-types", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.generate(options)
+                self.analyze()
+
+                after = self.measure(options["repeat"])
+                self.drop_indexes()
+                self.analyze()
+                before = self.measure(options["repeat"])
+
+                self.report(before, after)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def generate(self, options):
+        generator = LoadDataGenerator(
+            projects=options["projects"],
+            tasks=options["tasks"],
+            task_types=options["task_types"],
+            seed=options["seed"],
+            prefix="benchmark",
+        )
+        generator.generate()
+
+        self.task_type = TaskType.objects.get(
+            id=generator.task_type_ids[0]
+        )
+        self.middle_name = generator.task_name(options["tasks"] // 2)
+
+    def scenarios(self) -> dict:
+        open_tasks = Task.objects.filter(is_completed=False)
+
+        return {
+            "open tasks": open_tasks.order_by("name", "id"),
+            "open tasks, deep page": open_tasks.filter(
+                name__gt=self.middle_name
+            ).order_by("name", "id"),
+            "type": Task.objects.filter(
+                task_type=self.task_type
+            ).order_by("name", "id"),
+            "type + open": open_tasks.filter(
+                task_type=self.task_type
+            ).order_by("name", "id"),
+            "open by deadline": open_tasks.order_by("deadline"),
+            "open projects": Project.objects.filter(
+                is_completed=False
+            ).order_by("name", "id"),
+        }
+
+    def measure(self, repeat: int) -> dict:
+        results = {}
+
+        for name, queryset in self.scenarios().items():
+            page = queryset[:6]
+            timings = []
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                list(page.all())
+                timings.append(time.perf_counter() - start)
+
+            results[name] = (min(timings), page.explain())
+
+        return results
+
+    def drop_indexes(self):
+        with connection.cursor() as cursor:
+            for model in (Task, Project):
+                for index in model._meta.indexes:
+                    cursor.execute(
+                        f"DROP INDEX {connection.ops.quote_name(index.name)}"
+                    )
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def report(self, before: dict, after: dict):
+        for name in after:
+            before_time, before_plan = before[name]
+            after_time, after_plan = after[name]
+
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(
+                f"  without indexes: {before_time * 1000:.2f} ms\n"
+                f"  with indexes:    {after_time * 1000:.2f} ms"
+            )
+            self.stdout.write("  plan without indexes:")
+            self.stdout.write(self.indent(before_plan))
+            self.stdout.write("  plan with indexes:")
+            self.stdout.write(self.indent(after_plan))
+
+    def indent(self, text: str) -> str:
+        return "\n".join(f"    {line}" for line in text.splitlines())
@@ -0,0 +1,131 @@
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count, Exists, OuterRef
+from taggit.models import TaggedItem
+
+from task_manager.filters import filter_tags
+from task_manager.load_data import LoadDataGenerator
+from task_manager.models import Task
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare timings and EXPLAIN plans of the task list tag filters "
+        "with the join on tags they replaced, on a generated dataset. "
+        "Everything runs in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=1_000_000)
+        parser.add_argument("--tags", type=int, default=50_000)
+        parser.add_argument("--projects", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.generate(options)
+                self.analyze()
+                self.report(self.measure(options["repeat"]))
+                raise Rollback
+        except Rollback:
+            pass
+
+    def generate(self, options):
+        LoadDataGenerator(
+            projects=options["projects"],
+            tasks=options["tasks"],
+            tags=options["tags"],
+            seed=options["seed"],
+            prefix="benchmark",
+            log=lambda message: self.stderr.write(message),
+        ).generate()
+
+        # tags that are on some task together, or "all" matches nothing
+        content_type = ContentType.objects.get_for_model(Task)
+        task_id = TaggedItem.objects.filter(
+            content_type=content_type
+        ).values("object_id").annotate(
+            tags=Count("*")
+        ).filter(tags__gte=3).values_list("object_id", flat=True)[0]
+
+        self.tag_names = list(TaggedItem.objects.filter(
+            content_type=content_type, object_id=task_id
+        ).order_by("tag__name").values_list("tag__name", flat=True)[:3])
+
+    def scenarios(self) -> dict:
+        names = self.tag_names
+        tags = ",".join(names)
+        tasks = Task.objects.all()
+
+        tag_exists = tasks
+        for name in names:
+            tag_exists = tag_exists.filter(Exists(TaggedItem.objects.filter(
+                content_type=ContentType.objects.get_for_model(Task),
+                object_id=OuterRef("pk"),
+                tag__name=name,
+            )))
+
+        return {
+            "any, join + distinct (before)": tasks.filter(
+                tags__name__in=names
+            ).distinct(),
+            "any, semi-join": filter_tags(tasks, tags, "any"),
+            "all, join per tag": tasks.filter(
+                tags__name=names[0]
+            ).filter(tags__name=names[1]).filter(tags__name=names[2]),
+            "all, grouped semi-join": filter_tags(tasks, tags, "all"),
+            "all, exists per tag": tag_exists,
+        }
+
+    def measure(self, repeat: int) -> dict:
+        results = {}
+
+        for name, queryset in self.scenarios().items():
+            page = queryset.order_by("name", "id")[:6]
+            timings = {"page": [], "count": []}
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                list(page.all())
+                timings["page"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                count = queryset.count()
+                timings["count"].append(time.perf_counter() - start)
+
+            results[name] = (
+                min(timings["page"]),
+                min(timings["count"]),
+                count,
+                page.explain(),
+            )
+
+        return results
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def report(self, results: dict):
+        self.stdout.write(f"tags: {', '.join(self.tag_names)}")
+
+        for name, (page_time, count_time, count, plan) in results.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(
+                f"  first page: {page_time * 1000:.2f} ms\n"
+                f"  count:      {count_time * 1000:.2f} ms ({count} tasks)"
+            )
+            self.stdout.write("  plan:")
+            self.stdout.write(self.indent(plan))
+
+    def indent(self, text: str) -> str:
+        return "\n".join(f"    {line}" for line in text.splitlines())
@@ -0,0 +1,77 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.exports import EXPORT_FORMATS, export
+from task_manager.filters import TAG_MODES, filter_tasks
+from task_manager.models import Task, PRIORITY_CHOICES
+
+
+class Command(BaseCommand):
+    help = (
+        "Export tasks to CSV or JSONL with the same filters and pipeline "
+        "as the task list export"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "output",
+            help="File to write, '-' for stdout",
+        )
+        parser.add_argument(
+            "--format",
+            choices=sorted(EXPORT_FORMATS),
+            help="Defaults to the output file extension, or csv",
+        )
+        parser.add_argument("--name", default="")
+        parser.add_argument("--task-type", default="")
+        parser.add_argument("--tags", default="")
+        parser.add_argument("--tags-mode", choices=TAG_MODES, default="any")
+        parser.add_argument(
+            "--is-completed", choices=["True", "False"], default=""
+        )
+        parser.add_argument(
+            "--priority",
+            choices=[value for value, label in PRIORITY_CHOICES],
+            default="",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        export_format = options["format"] or self.guess_format(output)
+
+        queryset = filter_tasks(Task.objects.all(), options)
+        chunks = export(queryset, export_format)
+
+        if output == "-":
+            self.write(sys.stdout, chunks)
+            return
+
+        with open(output, "w", encoding="utf-8", newline="") as file:
+            rows = self.write(file, chunks)
+
+        if export_format == "csv":
+            # the header row
+            rows -= 1
+
+        self.stderr.write(f"Exported {rows} tasks to {output}")
+
+    def guess_format(self, output: str) -> str:
+        extension = output.rsplit(".", 1)[-1].lower()
+
+        if extension in EXPORT_FORMATS:
+            return extension
+        if output != "-" and "." in output:
+            raise CommandError(
+                f"Can't tell the format of {output}, use --format"
+            )
+        return "csv"
+
+    def write(self, file, chunks) -> int:
+        rows = 0
+
+        for chunk in chunks:
+            file.write(chunk)
+            rows += 1
+
+        return rows
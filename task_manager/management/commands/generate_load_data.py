@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from task_manager.load_data import LoadDataGenerator
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic worker/team/project/task/tag dataset "
+        "for scale testing"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=1000)
+        parser.add_argument("--teams", type=int, default=100)
+        parser.add_argument("--projects", type=int, default=500)
+        parser.add_argument("--tasks", type=int, default=10_000)
+        parser.add_argument("--tags", type=int, default=200)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--prefix",
+            default="load",
+            help="Prefix for generated names, use a new one for every run "
+                 "against the same database",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+
+        generator = LoadDataGenerator(
+            workers=options["workers"],
+            teams=options["teams"],
+            projects=options["projects"],
+            tasks=options["tasks"],
+            tags=options["tags"],
+            seed=options["seed"],
+            prefix=options["prefix"],
+            batch_size=options["batch_size"],
+            log=self.log if options["verbosity"] > 1 else None,
+        )
+        generator.generate()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {options['workers']} workers, {options['teams']} "
+            f"teams, {options['projects']} projects, {options['tasks']} "
+            f"tasks and {options['tags']} tags in "
+            f"{time.perf_counter() - start:.1f}s"
+        ))
+
+    def log(self, message: str) -> None:
+        self.stdout.write(message)
@@ -0,0 +1,82 @@
+import sys
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.imports import (
+    BATCH_SIZE,
+    IMPORT_FORMATS,
+    TaskImporter,
+    guess_format,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tasks from CSV or JSONL in the task export format, "
+        "validating and inserting them in batches"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "input",
+            help="File to read, '-' for stdin",
+        )
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="Defaults to the input file extension",
+        )
+        parser.add_argument(
+            "--owner",
+            help="Username of the owner for rows without one",
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate the rows without writing anything",
+        )
+
+    def handle(self, *args, **options):
+        source = options["input"]
+        import_format = options["format"] or guess_format(source)
+
+        if import_format is None:
+            raise CommandError(
+                f"Can't tell the format of {source}, use --format"
+            )
+
+        owner = None
+        if options["owner"]:
+            try:
+                owner = get_user_model().objects.get(
+                    username=options["owner"]
+                )
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"Unknown worker {options['owner']!r}")
+
+        importer = TaskImporter(
+            batch_size=options["batch_size"],
+            default_owner=owner,
+            dry_run=options["dry_run"],
+        )
+        started = time.perf_counter()
+
+        if source == "-":
+            result = importer.run(sys.stdin, import_format)
+        else:
+            with open(source, encoding="utf-8", newline="") as file:
+                result = importer.run(file, import_format)
+
+        elapsed = time.perf_counter() - started
+
+        for row, message in result.errors:
+            self.stderr.write(f"Row {row}: {message}")
+
+        verb = "Validated" if options["dry_run"] else "Imported"
+        self.stderr.write(
+            f"{verb} {result.created} tasks in {elapsed:.1f}s, "
+            f"{len(result.errors)} rows rejected"
+        )
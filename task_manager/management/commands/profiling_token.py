@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from task_manager.profiling import (
+    PROFILE_HEADER,
+    TOKEN_MAX_AGE,
+    make_profiling_token,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Print a signed X-Profile header value that makes "
+        "ProfilingMiddleware profile a request"
+    )
+
+    def handle(self, *args, **options):
+        max_age = getattr(settings, "PROFILING_TOKEN_MAX_AGE", TOKEN_MAX_AGE)
+
+        self.stdout.write(f"{PROFILE_HEADER}: {make_profiling_token()}")
+        self.stderr.write(f"Valid for {max_age} seconds")
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.tag_index import rebuild_tag_index
+
+
+class Command(BaseCommand):
+    help = "Recount how often every tag is used on tasks and projects"
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"tags: {rebuild_tag_index()}")
@@ -0,0 +1,218 @@
+import glob
+import json
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.conf import settings
+from django.utils.crypto import constant_time_compare
+
+
+INITIAL_SIZE = 64 * 1024
+
+# name, help text and upper bounds of the buckets
+HISTOGRAMS = {
+    "http_request_duration_seconds": (
+        "Request latency by URL name.",
+        (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    ),
+    "http_request_db_queries": (
+        "Database queries per request by URL name.",
+        (0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+    ),
+    "http_response_size_bytes": (
+        "Response body size by URL name, streaming responses excluded.",
+        (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+    ),
+}
+
+
+# A file of (key, float) entries that one process appends to and any
+# process can read, the same layout prometheus_client uses for its
+# multiprocess mode. The first 8 bytes hold the used length. Each entry
+# is a 4 byte key length, the key padded to 8 bytes and an 8 byte double.
+# The used length is written last, readers never see half an entry.
+class MmapedDict:
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, "a+b")
+
+        if os.fstat(self.file.fileno()).st_size == 0:
+            self.file.truncate(INITIAL_SIZE)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+        self.used = struct.unpack_from("q", self.map, 0)[0] or 8
+        self.positions = {
+            key: position for key, _, position in self.entries(self.map)
+        }
+
+    @staticmethod
+    def entries(data):
+        used = struct.unpack_from("q", data, 0)[0]
+        offset = 8
+
+        while offset < used:
+            length = struct.unpack_from("i", data, offset)[0]
+            key = bytes(data[offset + 4:offset + 4 + length]).decode()
+            offset += 4 + length + (-(4 + length) % 8)
+            yield key, struct.unpack_from("d", data, offset)[0], offset
+            offset += 8
+
+    def allocate(self, key: str) -> int:
+        encoded = key.encode()
+        padded = encoded + b" " * (-(4 + len(encoded)) % 8)
+        size = 4 + len(padded) + 8
+
+        while self.used + size > len(self.map):
+            capacity = len(self.map) * 2
+            self.map.close()
+            self.file.truncate(capacity)
+            self.map = mmap.mmap(self.file.fileno(), 0)
+
+        struct.pack_into(
+            f"i{len(padded)}sd", self.map, self.used,
+            len(encoded), padded, 0.0,
+        )
+        position = self.used + 4 + len(padded)
+        self.used += size
+        struct.pack_into("q", self.map, 0, self.used)
+        self.positions[key] = position
+
+        return position
+
+    def inc(self, key: str, amount: float) -> None:
+        with self.lock:
+            position = self.positions.get(key)
+            if position is None:
+                position = self.allocate(key)
+
+            value = struct.unpack_from("d", self.map, position)[0]
+            struct.pack_into("d", self.map, position, value + amount)
+
+    @classmethod
+    def read(cls, path: str) -> dict:
+        with open(path, "rb") as file:
+            data = file.read()
+
+        return {key: value for key, value, _ in cls.entries(data)}
+
+
+_store = None
+_store_pid = None
+_store_directory = None
+
+# encoded keys by (name, view, bucket), a few hundred at most
+_keys = {}
+
+
+def get_store() -> MmapedDict | None:
+    # one file per process, reopened after a fork so gunicorn workers
+    # never share a file with the master or each other
+    global _store, _store_pid, _store_directory
+
+    directory = getattr(settings, "METRICS_DIR", "")
+    if not directory:
+        return None
+
+    pid = os.getpid()
+    if _store_pid != pid or _store_directory != directory:
+        os.makedirs(directory, exist_ok=True)
+        _store = MmapedDict(os.path.join(directory, f"metrics_{pid}.db"))
+        _store_pid = pid
+        _store_directory = directory
+
+    return _store
+
+
+def encode_key(name: str, view: str, le: str) -> str:
+    key = _keys.get((name, view, le))
+
+    if key is None:
+        key = _keys[name, view, le] = json.dumps([name, view, le])
+
+    return key
+
+
+def observe(store: MmapedDict, name: str, view: str, value: float) -> None:
+    buckets = HISTOGRAMS[name][1]
+    index = bisect_left(buckets, value)
+    le = str(buckets[index]) if index < len(buckets) else "+Inf"
+
+    store.inc(encode_key(name, view, le), 1)
+    store.inc(encode_key(name, view, "sum"), value)
+
+
+def observe_request(view: str, duration: float, queries: int, response):
+    store = get_store()
+    if store is None:
+        return
+
+    observe(store, "http_request_duration_seconds", view, duration)
+    observe(store, "http_request_db_queries", view, queries)
+    if not response.streaming:
+        observe(
+            store, "http_response_size_bytes", view, len(response.content)
+        )
+
+
+def collect() -> dict:
+    # summed over the files of every process, including ones that have
+    # exited, so counts never go backwards while the directory lives
+    totals = defaultdict(float)
+    directory = getattr(settings, "METRICS_DIR", "")
+
+    for path in glob.glob(os.path.join(directory, "metrics_*.db")):
+        for key, value in MmapedDict.read(path).items():
+            totals[tuple(json.loads(key))] += value
+
+    return totals
+
+
+def escape(value: str) -> str:
+    return (
+        value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+    )
+
+
+def render_metrics() -> str:
+    totals = collect()
+    lines = []
+
+    for name, (help_text, buckets) in HISTOGRAMS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+
+        views = sorted({view for metric, view, _ in totals if metric == name})
+        for view in views:
+            label = f'view="{escape(view)}"'
+            count = 0
+
+            for le in [*map(str, buckets), "+Inf"]:
+                count += totals.get((name, view, le), 0)
+                lines.append(
+                    f'{name}_bucket{{{label},le="{le}"}} {int(count)}'
+                )
+
+            lines.append(
+                f"{name}_sum{{{label}}} {totals.get((name, view, 'sum'), 0)}"
+            )
+            lines.append(f"{name}_count{{{label}}} {int(count)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def metrics_allowed(request) -> bool:
+    # scraped from the same host, or from elsewhere with the bearer token
+    token = getattr(settings, "METRICS_TOKEN", "")
+    authorization = request.headers.get("Authorization", "")
+
+    if token and constant_time_compare(authorization, f"Bearer {token}"):
+        return True
+
+    return request.META.get("REMOTE_ADDR") in getattr(
+        settings, "METRICS_ALLOWED_IPS", ("127.0.0.1", "::1")
+    )
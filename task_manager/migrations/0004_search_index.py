@@ -0,0 +1,25 @@
+from django.db import migrations
+
+from task_manager.search import install_search_index, uninstall_search_index
+
+
+def create_search_indexes(apps, schema_editor):
+    for model_name in ("Task", "Project"):
+        model = apps.get_model("task_manager", model_name)
+        install_search_index(schema_editor, model._meta.db_table)
+
+
+def drop_search_indexes(apps, schema_editor):
+    for model_name in ("Task", "Project"):
+        model = apps.get_model("task_manager", model_name)
+        uninstall_search_index(schema_editor, model._meta.db_table)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_manager", "0003_alter_task_project"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.4 on 2026-10-18 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0004_search_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("is_completed", False)),
+                fields=["name", "id"],
+                name="project_open_name_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("is_completed", False)),
+                fields=["deadline"],
+                name="project_open_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["task_type", "name", "id"], name="task_type_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_completed", False)),
+                fields=["name", "id"],
+                name="task_open_name_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_completed", False)),
+                fields=["task_type", "name", "id"],
+                name="task_type_open_name_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_completed", False)),
+                fields=["deadline"],
+                name="task_open_deadline_idx",
+            ),
+        ),
+    ]
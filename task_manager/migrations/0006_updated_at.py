@@ -0,0 +1,49 @@
+# Generated by Django 4.2.4 on 2026-10-18 19:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+from task_manager.search import install_search_index
+
+
+def reinstall_search_indexes(apps, schema_editor):
+    # SQLite adds these columns by rebuilding the tables, which drops the
+    # FTS triggers, in both directions
+    for model_name in ("Task", "Project"):
+        model = apps.get_model("task_manager", model_name)
+        install_search_index(schema_editor, model._meta.db_table)
+
+
+class Migration(migrations.Migration):
+
+    # the fixture has no updated_at, it has to be loaded before the
+    # column exists
+    dependencies = [
+        ("task_manager", "0005_task_list_indexes"),
+        ("team_manager", "0002_auto_load__fixture_data_20230914_1915"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            migrations.RunPython.noop, reinstall_search_indexes
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            reinstall_search_indexes, migrations.RunPython.noop
+        ),
+    ]
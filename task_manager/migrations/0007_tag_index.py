@@ -0,0 +1,83 @@
+# Generated by Django 4.2.4 on 2026-10-18 19:27
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def populate_tag_index(apps, schema_editor):
+    Tag = apps.get_model("taggit", "Tag")
+    TaggedItem = apps.get_model("taggit", "TaggedItem")
+    TagIndex = apps.get_model("task_manager", "TagIndex")
+
+    counts = {}
+    for tag_id, model, count in TaggedItem.objects.filter(
+        content_type__app_label="task_manager",
+        content_type__model__in=["task", "project"],
+    ).values("tag_id", "content_type__model").annotate(
+        count=Count("*")
+    ).values_list("tag_id", "content_type__model", "count"):
+        counts[tag_id, model] = count
+
+    TagIndex.objects.bulk_create(
+        (
+            TagIndex(
+                tag_id=tag_id,
+                name=name.lower(),
+                task_count=counts.get((tag_id, "task"), 0),
+                project_count=counts.get((tag_id, "project"), 0),
+            )
+            for tag_id, name in Tag.objects.values_list("id", "name")
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("taggit", "0005_auto_20220424_2025"),
+        ("task_manager", "0006_updated_at"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagIndex",
+            fields=[
+                (
+                    "tag",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="index",
+                        serialize=False,
+                        to="taggit.tag",
+                    ),
+                ),
+                ("name", models.CharField(db_index=True, max_length=100)),
+                ("task_count", models.PositiveIntegerField(default=0)),
+                ("project_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["-task_count", "name"],
+                        name="tagindex_task_count_idx",
+                    ),
+                    models.Index(
+                        fields=["-project_count", "name"],
+                        name="tagindex_project_count_idx",
+                    ),
+                    models.Index(
+                        (
+                            models.F("task_count") + models.F("project_count")
+                        ).desc(),
+                        "name",
+                        name="tagindex_count_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(populate_tag_index, migrations.RunPython.noop),
+    ]
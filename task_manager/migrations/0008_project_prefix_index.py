@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from task_manager.autocomplete import (
+    install_autocomplete_index,
+    uninstall_autocomplete_index,
+)
+
+
+def create_prefix_index(apps, schema_editor):
+    project = apps.get_model("task_manager", "Project")
+    install_autocomplete_index(schema_editor, project._meta.db_table, "name")
+
+
+def drop_prefix_index(apps, schema_editor):
+    project = apps.get_model("task_manager", "Project")
+    uninstall_autocomplete_index(schema_editor, project._meta.db_table, "name")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_manager", "0007_tag_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_index, drop_prefix_index),
+    ]
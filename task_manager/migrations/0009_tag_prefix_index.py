@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from task_manager.tag_index import (
+    install_tag_prefix_index,
+    uninstall_tag_prefix_index,
+)
+
+
+def create_prefix_index(apps, schema_editor):
+    tag_index = apps.get_model("task_manager", "TagIndex")
+    install_tag_prefix_index(schema_editor, tag_index._meta.db_table)
+
+
+def drop_prefix_index(apps, schema_editor):
+    tag_index = apps.get_model("task_manager", "TagIndex")
+    uninstall_tag_prefix_index(schema_editor, tag_index._meta.db_table)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_manager", "0008_project_prefix_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_index, drop_prefix_index),
+    ]
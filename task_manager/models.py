@@ -1,5 +1,6 @@
 from django.db import models
 from it_company_task_manager.settings import AUTH_USER_MODEL
+from taggit.models import Tag
 from taggit_autosuggest.managers import TaggableManager
 
 from team_manager.models import Team
@@ -60,11 +61,40 @@ class Task(models.Model):
         related_name="tasks",
         null=True
     )
+    # the version cached fragments are keyed on. save() sets it, code
+    # that writes with update() or raw SQL, or changes assignees or tags,
+    # has to bump it too (see signals.py)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["name"]
         verbose_name = "task"
         verbose_name_plural = "tasks"
+        # match the TaskListView filters, which are always ordered by
+        # (name, id) for keyset pagination. Django renders boolean filters
+        # as "NOT is_completed", so the completion state goes into partial
+        # index conditions rather than a leading index column
+        indexes = [
+            models.Index(
+                fields=["task_type", "name", "id"],
+                name="task_type_name_idx",
+            ),
+            models.Index(
+                fields=["name", "id"],
+                condition=models.Q(is_completed=False),
+                name="task_open_name_idx",
+            ),
+            models.Index(
+                fields=["task_type", "name", "id"],
+                condition=models.Q(is_completed=False),
+                name="task_type_open_name_idx",
+            ),
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(is_completed=False),
+                name="task_open_deadline_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -96,11 +126,61 @@ class Project(models.Model):
         on_delete=models.CASCADE,
         null=True
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "project"
         verbose_name_plural = "projects"
         ordering = ["name"]
+        indexes = [
+            models.Index(
+                fields=["name", "id"],
+                condition=models.Q(is_completed=False),
+                name="project_open_name_idx",
+            ),
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(is_completed=False),
+                name="project_open_deadline_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+# How often each tag is used on tasks and on projects, searched by prefix
+# for the tag suggestions. Kept up to date by the handlers in signals.py,
+# code that adds or removes tags with bulk_create() or raw SQL calls
+# tag_index.refresh_tag_index() instead.
+class TagIndex(models.Model):
+    tag = models.OneToOneField(
+        Tag,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="index",
+    )
+    # lower case, so the prefix match ignores case
+    name = models.CharField(max_length=100, db_index=True)
+    task_count = models.PositiveIntegerField(default=0)
+    project_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-task_count", "name"],
+                name="tagindex_task_count_idx",
+            ),
+            models.Index(
+                fields=["-project_count", "name"],
+                name="tagindex_project_count_idx",
+            ),
+            models.Index(
+                (models.F("task_count") + models.F("project_count")).desc(),
+                "name",
+                name="tagindex_count_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -0,0 +1,249 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError
+from django.db.models import BigIntegerField, IntegerField, Q, QuerySet
+from django.http import Http404
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class KeysetPage:
+    is_keyset = True
+
+    def __init__(
+        self,
+        object_list: list,
+        number: int,
+        paginator: "KeysetPaginator",
+        has_next: bool,
+        has_previous: bool,
+    ):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return f"<Page {self.number}>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+    @cached_property
+    def next_cursor(self) -> str | None:
+        if not self.has_next():
+            return None
+        return self.paginator.encode_cursor(
+            self.object_list[-1], "next", self.number + 1
+        )
+
+    @cached_property
+    def previous_cursor(self) -> str | None:
+        if not self.has_previous():
+            return None
+        return self.paginator.encode_cursor(
+            self.object_list[0], "previous", max(1, self.number - 1)
+        )
+
+
+# Paginates on the values of ``fields`` instead of OFFSET, so every page
+# is an index range scan no matter how deep it is. ``fields`` must end
+# with a unique column, prefix a field with "-" to sort it descending.
+class KeysetPaginator:
+    def __init__(
+        self,
+        queryset: QuerySet,
+        per_page: int,
+        fields: tuple = ("name", "id"),
+        count: bool = True,
+    ):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.fields = tuple(fields)
+        self.with_count = count
+
+    @cached_property
+    def count(self) -> int | None:
+        if not self.with_count:
+            return None
+        return self.queryset.count()
+
+    @cached_property
+    def num_pages(self) -> int | None:
+        if self.count is None:
+            return None
+        return max(1, -(-self.count // self.per_page))
+
+    def ordering(self, reverse: bool = False) -> list:
+        ordering = []
+
+        for field in self.fields:
+            descending = field.startswith("-")
+            if reverse:
+                descending = not descending
+            ordering.append(("-" if descending else "") + field.lstrip("-"))
+
+        return ordering
+
+    def key_filter(self, values: list, reverse: bool = False) -> Q:
+        # (a, b) > (x, y)  <=>  a > x OR (a = x AND b > y)
+        conditions = []
+
+        for i, field in enumerate(self.fields):
+            name = field.lstrip("-")
+            descending = field.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+
+            condition = Q(**{f"{name}__{lookup}": values[i]})
+            for previous, value in zip(self.fields[:i], values):
+                condition &= Q(**{previous.lstrip("-"): value})
+
+            conditions.append(condition)
+
+        return reduce(or_, conditions)
+
+    def key_field(self, name: str):
+        annotation = self.queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return self.queryset.model._meta.get_field(name)
+
+    def clean_values(self, values: list) -> list:
+        # the values of a tampered cursor would end up in the WHERE clause,
+        # they are converted like form input. Key fields aren't nullable
+        # and no backend stores integers wider than 64 bits, SQLite has no
+        # range validators for them.
+        cleaned = []
+
+        for field, value in zip(self.fields, values):
+            field = self.key_field(field.lstrip("-"))
+            try:
+                value = field.to_python(value)
+                field.run_validators(value)
+            except (ValidationError, TypeError, ValueError):
+                raise InvalidCursor("That cursor is not valid")
+
+            if value is None or (
+                isinstance(field, IntegerField)
+                and abs(value) > BigIntegerField.MAX_BIGINT
+            ):
+                raise InvalidCursor("That cursor is not valid")
+            cleaned.append(value)
+
+        return cleaned
+
+    def key_values(self, obj) -> list:
+        return [getattr(obj, field.lstrip("-")) for field in self.fields]
+
+    def encode_cursor(self, obj, direction: str, number: int) -> str:
+        payload = json.dumps(
+            [self.key_values(obj), direction, number],
+            default=str,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> tuple:
+        try:
+            payload = base64.urlsafe_b64decode(
+                cursor.encode() + b"=" * (-len(cursor) % 4)
+            )
+            values, direction, number = json.loads(payload)
+        except (binascii.Error, UnicodeError, ValueError, TypeError):
+            raise InvalidCursor("That cursor is not valid")
+
+        if (
+            direction not in ("next", "previous")
+            or not isinstance(values, list)
+            or len(values) != len(self.fields)
+            or not isinstance(number, int)
+            or number < 1
+        ):
+            raise InvalidCursor("That cursor is not valid")
+
+        return self.clean_values(values), direction, number
+
+    def page(self, cursor: str | None = None) -> KeysetPage:
+        if not cursor:
+            rows = list(
+                self.queryset.order_by(*self.ordering())[:self.per_page + 1]
+            )
+            return KeysetPage(
+                rows[:self.per_page],
+                1,
+                self,
+                has_next=len(rows) > self.per_page,
+                has_previous=False,
+            )
+
+        values, direction, number = self.decode_cursor(cursor)
+        reverse = direction == "previous"
+
+        rows = list(
+            self.queryset.filter(
+                self.key_filter(values, reverse=reverse)
+            ).order_by(
+                *self.ordering(reverse=reverse)
+            )[:self.per_page + 1]
+        )
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if reverse:
+            rows.reverse()
+            return KeysetPage(
+                rows, number, self, has_next=True, has_previous=has_more
+            )
+
+        return KeysetPage(
+            rows, number, self, has_next=has_more, has_previous=True
+        )
+
+
+class KeysetPaginationMixin:
+    keyset_fields = ("name", "id")
+    cursor_kwarg = "cursor"
+    # set to False to skip the COUNT(*) query on every page
+    paginate_count = True
+
+    def get_keyset_fields(self) -> tuple:
+        return self.keyset_fields
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            fields=self.get_keyset_fields(),
+            count=self.paginate_count,
+        )
+        cursor = self.request.GET.get(self.cursor_kwarg)
+
+        try:
+            page = paginator.page(cursor)
+        except InvalidCursor as e:
+            raise Http404(str(e))
+
+        return paginator, page, page.object_list, page.has_other_pages()
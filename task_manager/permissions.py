@@ -0,0 +1,42 @@
+from django.db.models import Exists, OuterRef, QuerySet
+
+from .models import Task, Project
+
+
+# Each check is a single EXISTS query and never loads the user's teams or
+# the task's assignees, so it costs the same however big those lists get.
+def is_project_team_member(user, project_id: int | None) -> bool:
+    if project_id is None or not user.is_authenticated:
+        return False
+
+    return Project.teams.through.objects.filter(
+        project_id=project_id,
+        team__members=user,
+    ).exists()
+
+
+def is_task_team_member(user, task: Task) -> bool:
+    return is_project_team_member(user, task.project_id)
+
+
+def is_task_assignee(user, task: Task) -> bool:
+    if not user.is_authenticated:
+        return False
+
+    return Task.assignees.through.objects.filter(
+        task_id=task.pk,
+        worker_id=user.pk,
+    ).exists()
+
+
+# the set-based form of is_task_team_member(), for actions on many tasks
+def team_member_tasks(user, queryset: QuerySet) -> QuerySet:
+    if not user.is_authenticated:
+        return queryset.none()
+
+    return queryset.filter(Exists(
+        Project.teams.through.objects.filter(
+            project_id=OuterRef("project_id"),
+            team__members=user,
+        )
+    ))
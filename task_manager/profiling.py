@@ -0,0 +1,167 @@
+import cProfile
+import itertools
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+
+from .instrumentation import view_name
+
+
+PROFILE_HEADER = "X-Profile"
+
+TOKEN_SALT = "task_manager.profiling"
+
+TOKEN_MAX_AGE = 24 * 60 * 60
+
+UNSAFE_CHARS_RE = re.compile(r"[^\w.-]+")
+
+
+def make_profiling_token() -> str:
+    return signing.TimestampSigner(salt=TOKEN_SALT).sign("profile")
+
+
+def valid_profiling_token(token: str, max_age: int) -> bool:
+    try:
+        signing.TimestampSigner(salt=TOKEN_SALT).unsign(token, max_age=max_age)
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}"
+
+
+# Samples the stack of one thread from a second thread. cProfile only
+# keeps caller and callee pairs, the sampled stacks are what a flamegraph
+# needs. Stacks start below the frame the sampler was created for.
+class StackSampler(threading.Thread):
+    def __init__(self, root_frame, interval: float):
+        super().__init__(daemon=True)
+        self.thread_id = threading.get_ident()
+        self.root_frame = root_frame
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+
+            while frame is not None and frame is not self.root_frame:
+                stack.append(frame_name(frame))
+                frame = frame.f_back
+
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+
+# Opt-in profiling: off unless PROFILING_DIR is set. Then every
+# PROFILING_SAMPLE_RATE-th request, and any request carrying a signed
+# X-Profile header (see the profiling_token command), is run under
+# cProfile and the stack sampler. Each profiled request leaves a .prof
+# file for pstats or snakeviz and a .collapsed file for flamegraph.pl,
+# both named after the view. Only the newest PROFILING_KEEP pairs are
+# kept.
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        self.directory = getattr(settings, "PROFILING_DIR", None)
+
+        if not self.directory:
+            raise MiddlewareNotUsed
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "PROFILING_SAMPLE_RATE", 0)
+        self.keep = getattr(settings, "PROFILING_KEEP", 50)
+        if self.keep < 1:
+            raise ImproperlyConfigured("PROFILING_KEEP must be at least 1")
+        self.interval = getattr(settings, "PROFILING_INTERVAL", 0.001)
+        self.token_max_age = getattr(
+            settings, "PROFILING_TOKEN_MAX_AGE", TOKEN_MAX_AGE
+        )
+        self.requests = itertools.count(1)
+        # cProfile can't profile two threads at once, concurrent requests
+        # wait for the next sample
+        self.lock = threading.Lock()
+
+    def should_profile(self, request) -> bool:
+        token = request.headers.get(PROFILE_HEADER)
+
+        if token:
+            return valid_profiling_token(token, self.token_max_age)
+
+        return bool(self.sample_rate) and (
+            next(self.requests) % self.sample_rate == 0
+        )
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        if not self.lock.acquire(blocking=False):
+            return self.get_response(request)
+
+        try:
+            return self.profile(request)
+        finally:
+            self.lock.release()
+
+    def profile(self, request):
+        profile = cProfile.Profile()
+        sampler = StackSampler(sys._getframe(), self.interval)
+
+        sampler.start()
+        profile.enable()
+        try:
+            response = self.get_response(request)
+        finally:
+            profile.disable()
+            sampler.stop()
+
+        self.write(request, profile, sampler.stacks)
+        return response
+
+    def write(self, request, profile, stacks: Counter) -> None:
+        name = UNSAFE_CHARS_RE.sub(
+            "_", view_name(request).replace(":", ".")
+        )
+        now = datetime.now(timezone.utc)
+        path = os.path.join(
+            self.directory, f"{now:%Y%m%dT%H%M%S%f}-{name}-{os.getpid()}"
+        )
+
+        profile.dump_stats(f"{path}.prof")
+        with open(f"{path}.collapsed", "w", encoding="utf-8") as file:
+            for stack, count in stacks.items():
+                file.write(f"{stack} {count}\n")
+
+        self.rotate()
+
+    def rotate(self) -> None:
+        # names start with the time, so they sort oldest first
+        profiles = sorted(
+            name for name in os.listdir(self.directory)
+            if name.endswith(".prof")
+        )
+
+        for name in profiles[:max(len(profiles) - self.keep, 0)]:
+            base = os.path.join(self.directory, name[:-len(".prof")])
+            for extension in (".prof", ".collapsed"):
+                try:
+                    os.remove(base + extension)
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,57 @@
+import json
+
+from django.core import signing
+
+
+TASK_FILTER_COOKIE = "task_filter"
+TASK_FILTER_FIELDS = (
+    "task_type", "tags", "tags_mode", "is_completed", "priority"
+)
+TASK_FILTER_MAX_AGE = 60 * 60 * 24 * 30
+
+
+# The last task list filter is kept in a signed cookie instead of the
+# session, reading it costs no query and it is only written when it
+# changes. The user id is part of the salt so a filter saved by one
+# account is ignored by any other account on the same browser.
+def task_filter_salt(request) -> str:
+    return f"task_manager.task_filter.{request.user.pk}"
+
+
+def get_saved_task_filter(request) -> dict:
+    try:
+        saved = request.get_signed_cookie(
+            TASK_FILTER_COOKIE,
+            salt=task_filter_salt(request),
+            max_age=TASK_FILTER_MAX_AGE,
+        )
+        saved = json.loads(saved)
+    except (KeyError, signing.BadSignature, ValueError):
+        return {}
+
+    if not isinstance(saved, dict):
+        return {}
+
+    return {
+        field: str(saved[field])
+        for field in TASK_FILTER_FIELDS
+        if field in saved
+    }
+
+
+def save_task_filter(request, response, task_filter: dict) -> None:
+    if task_filter == get_saved_task_filter(request):
+        return
+
+    response.set_signed_cookie(
+        TASK_FILTER_COOKIE,
+        json.dumps(task_filter, separators=(",", ":")),
+        salt=task_filter_salt(request),
+        max_age=TASK_FILTER_MAX_AGE,
+        httponly=True,
+        samesite="Lax",
+    )
+
+
+def clear_task_filter(response) -> None:
+    response.delete_cookie(TASK_FILTER_COOKIE, samesite="Lax")
@@ -0,0 +1,228 @@
+import re
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet, BooleanField, FloatField, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def search_tokens(query: str) -> list:
+    return TOKEN_RE.findall(query)
+
+
+class ContainsSearchBackend:
+    # fallback for databases without a full-text index: no ranking
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        condition = Q()
+
+        for token in search_tokens(query):
+            condition &= (
+                Q(name__icontains=token) | Q(description__icontains=token)
+            )
+
+        return queryset.filter(condition).annotate(
+            search_rank=Value(0.0, output_field=FloatField())
+        )
+
+
+class SQLiteSearchBackend:
+    # FTS5 external content table kept in sync by triggers, see
+    # install_sqlite_search_index()
+    def match_expression(self, query: str) -> str:
+        return " ".join(f'"{token}"*' for token in search_tokens(query))
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        table = queryset.model._meta.db_table
+        fts_table = f"{table}_fts"
+        match = self.match_expression(query)
+
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH %s",
+                (match,),
+            )
+        ).annotate(
+            # bm25() is lower for better matches, flip it so that a higher
+            # rank is better on every backend
+            search_rank=RawSQL(
+                f"SELECT -bm25({fts_table}) FROM {fts_table} "
+                f"WHERE {fts_table} MATCH %s AND rowid = {table}.id",
+                (match,),
+                output_field=FloatField(),
+            )
+        )
+
+
+class PostgresSearchBackend:
+    # the document expression must stay identical to the one in
+    # install_postgres_search_index(), otherwise the GIN index is not used
+    document = (
+        "to_tsvector('english', coalesce({prefix}name, '') || ' ' || "
+        "coalesce({prefix}description, ''))"
+    )
+
+    def tsquery(self, query: str) -> str:
+        return " & ".join(f"{token}:*" for token in search_tokens(query))
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        table = queryset.model._meta.db_table
+        document = self.document.format(prefix=f"{table}.")
+        tsquery = self.tsquery(query)
+
+        return queryset.filter(
+            RawSQL(
+                f"{document} @@ to_tsquery('english', %s)",
+                (tsquery,),
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"ts_rank({document}, to_tsquery('english', %s))",
+                (tsquery,),
+                output_field=FloatField(),
+            )
+        )
+
+
+BACKENDS = {
+    "sqlite": SQLiteSearchBackend,
+    "postgresql": PostgresSearchBackend,
+}
+
+
+def get_search_backend():
+    backend = getattr(settings, "SEARCH_BACKEND", None)
+
+    if backend:
+        return import_string(backend)()
+
+    return BACKENDS.get(connection.vendor, ContainsSearchBackend)()
+
+
+def search(queryset: QuerySet, query: str) -> QuerySet:
+    if not search_tokens(query):
+        return queryset
+
+    return get_search_backend().search(queryset, query)
+
+
+def sqlite_insert_trigger(table: str) -> str:
+    fts_table = f"{table}_fts"
+
+    return (
+        f"CREATE TRIGGER {fts_table}_insert AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts_table}(rowid, name, description) "
+        f"VALUES (new.id, new.name, new.description); END"
+    )
+
+
+def install_sqlite_search_index(schema_editor, table: str) -> None:
+    fts_table = f"{table}_fts"
+
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"name, description, content='{table}', content_rowid='id')",
+
+        f"DROP TRIGGER IF EXISTS {fts_table}_insert",
+        sqlite_insert_trigger(table),
+
+        f"DROP TRIGGER IF EXISTS {fts_table}_delete",
+        f"CREATE TRIGGER {fts_table}_delete AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, name, description) "
+        f"VALUES ('delete', old.id, old.name, old.description); END",
+
+        f"DROP TRIGGER IF EXISTS {fts_table}_update",
+        f"CREATE TRIGGER {fts_table}_update "
+        f"AFTER UPDATE OF name, description ON {table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, name, description) "
+        f"VALUES ('delete', old.id, old.name, old.description); "
+        f"INSERT INTO {fts_table}(rowid, name, description) "
+        f"VALUES (new.id, new.name, new.description); END",
+
+        # index the rows that already exist
+        f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')",
+    ]
+
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def uninstall_sqlite_search_index(schema_editor, table: str) -> None:
+    fts_table = f"{table}_fts"
+
+    for trigger in ("insert", "delete", "update"):
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {fts_table}_{trigger}")
+
+    schema_editor.execute(f"DROP TABLE IF EXISTS {fts_table}")
+
+
+@contextmanager
+def deferred_search_index(table: str):
+    # the FTS insert trigger indexes one row at a time, which costs several
+    # times the insert itself. Bulk loads drop it for the length of the
+    # transaction and index all the new rows with one statement. Ids only
+    # grow and SQLite has a single writer, so the new rows are the ones
+    # past the current maximum id
+    if connection.vendor != "sqlite":
+        yield
+        return
+
+    fts_table = f"{table}_fts"
+
+    with transaction.atomic(savepoint=False), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = %s",
+            [f"{fts_table}_insert"],
+        )
+        if cursor.fetchone() is None:
+            yield
+            return
+
+        cursor.execute(f"DROP TRIGGER {fts_table}_insert")
+        cursor.execute(f"SELECT coalesce(max(id), 0) FROM {table}")
+        last_id = cursor.fetchone()[0]
+
+        yield
+
+        cursor.execute(
+            f"INSERT INTO {fts_table}(rowid, name, description) "
+            f"SELECT id, name, description FROM {table} WHERE id > %s",
+            [last_id],
+        )
+        cursor.execute(sqlite_insert_trigger(table))
+
+
+def install_postgres_search_index(schema_editor, table: str) -> None:
+    document = PostgresSearchBackend.document.format(prefix="")
+
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {table}_search_idx "
+        f"ON {table} USING gin ({document})"
+    )
+
+
+def uninstall_postgres_search_index(schema_editor, table: str) -> None:
+    schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_idx")
+
+
+def install_search_index(schema_editor, table: str) -> None:
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        install_sqlite_search_index(schema_editor, table)
+    elif vendor == "postgresql":
+        install_postgres_search_index(schema_editor, table)
+
+
+def uninstall_search_index(schema_editor, table: str) -> None:
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        uninstall_sqlite_search_index(schema_editor, table)
+    elif vendor == "postgresql":
+        uninstall_postgres_search_index(schema_editor, table)
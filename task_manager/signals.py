@@ -0,0 +1,111 @@
+from django.db.models.signals import m2m_changed, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from taggit.models import Tag, TaggedItem
+
+from .facets import invalidate_task_facets
+from .models import TaskType, Task, Project, TagIndex
+from .tag_index import adjust_tag_count
+from team_manager.models import Team
+
+
+def touch(model, pks) -> None:
+    # bumps the version cached fragments and ETags are computed from
+    model.objects.filter(pk__in=pks).update(updated_at=timezone.now())
+
+
+def touch_tasks(task_ids) -> None:
+    touch(Task, task_ids)
+
+
+def touch_instance(instance) -> None:
+    instance.updated_at = timezone.now()
+    type(instance).objects.filter(pk=instance.pk).update(
+        updated_at=instance.updated_at
+    )
+
+
+def related_pks(through, instance, model) -> list:
+    # the other side of instance's rows, read before a clear() deletes them
+    source, target = (
+        next(
+            field for field in through._meta.fields
+            if field.is_relation and issubclass(related, field.related_model)
+        )
+        for related in (type(instance), model)
+    )
+    return list(through.objects.filter(
+        **{source.name: instance.pk}
+    ).values_list(target.attname, flat=True))
+
+
+# Both sides of a relation show it: a task page lists its assignees and
+# a worker page the tasks, so both get a new version
+@receiver(m2m_changed, sender=Task.assignees.through)
+@receiver(m2m_changed, sender=Team.members.through)
+@receiver(m2m_changed, sender=Project.teams.through)
+def touch_on_m2m_changed(
+    sender, instance, action, model, pk_set, **kwargs
+) -> None:
+    if action == "pre_clear":
+        instance._cleared_pks = related_pks(sender, instance, model)
+        return
+
+    if action == "post_clear":
+        pk_set = instance.__dict__.pop("_cleared_pks", None)
+    elif action not in ("post_add", "post_remove"):
+        return
+
+    if pk_set:
+        touch_instance(instance)
+        touch(model, pk_set)
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def touch_on_tags_changed(sender, instance, action, pk_set, **kwargs) -> None:
+    if not isinstance(instance, (Task, Project)):
+        return
+
+    if action == "post_clear" or (
+        action in ("post_add", "post_remove") and pk_set
+    ):
+        touch_instance(instance)
+
+        if isinstance(instance, Task):
+            invalidate_task_facets()
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_facets_on_task_change(sender, **kwargs) -> None:
+    invalidate_task_facets()
+
+
+@receiver(post_save, sender=TaskType)
+def touch_tasks_of_type(sender, instance, created, **kwargs) -> None:
+    # cached rows and cards show the type's name
+    if not created:
+        Task.objects.filter(task_type=instance).update(
+            updated_at=timezone.now()
+        )
+
+
+@receiver(post_save, sender=Tag)
+def index_tag(sender, instance, created, **kwargs) -> None:
+    if created:
+        TagIndex.objects.create(tag=instance, name=instance.name.lower())
+    else:
+        TagIndex.objects.filter(tag=instance).update(
+            name=instance.name.lower()
+        )
+
+
+@receiver(post_save, sender=TaggedItem)
+def count_tagged_item(sender, instance, created, **kwargs) -> None:
+    if created:
+        adjust_tag_count(instance.tag_id, instance.content_type_id, 1)
+
+
+@receiver(post_delete, sender=TaggedItem)
+def uncount_tagged_item(sender, instance, **kwargs) -> None:
+    adjust_tag_count(instance.tag_id, instance.content_type_id, -1)
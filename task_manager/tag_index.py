@@ -0,0 +1,190 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, F
+from taggit.models import Tag, TaggedItem
+
+from .autocomplete import code_point_order
+from .models import Task, Project, TagIndex
+
+
+COUNT_FIELDS = {
+    Task: "task_count",
+    Project: "project_count",
+}
+
+# the tagmodel the suggestion widgets of each form ask for
+SUGGESTION_MODELS = {
+    "task_manager.task": Task,
+    "task_manager.project": Project,
+}
+
+BATCH_SIZE = 1000
+
+# prefixes matching more tags than this are looked up by popularity
+RANGE_SCAN_ROWS = 500
+
+
+class LRUCache:
+    # A dict with a size limit and an expiry, for values that are cheap to
+    # get wrong for a few seconds. Per process and thread safe.
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            item = self.data.get(key)
+            if item is None:
+                return None
+
+            expires, value = item
+            if expires < time.monotonic():
+                del self.data[key]
+                return None
+
+            self.data.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        with self.lock:
+            self.data[key] = (time.monotonic() + self.ttl, value)
+            self.data.move_to_end(key)
+
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.data.clear()
+
+
+# Suggestions can be TAG_SUGGESTION_CACHE_TTL seconds behind, the counts
+# only decide the order
+suggestion_cache = LRUCache(
+    getattr(settings, "TAG_SUGGESTION_CACHE_SIZE", 4096),
+    getattr(settings, "TAG_SUGGESTION_CACHE_TTL", 60),
+)
+
+
+def count_field(content_type_id: int) -> str | None:
+    for model, field in COUNT_FIELDS.items():
+        if ContentType.objects.get_for_model(model).pk == content_type_id:
+            return field
+    return None
+
+
+def adjust_tag_count(tag_id: int, content_type_id: int, delta: int) -> None:
+    field = count_field(content_type_id)
+    if field is None:
+        return
+
+    updated = TagIndex.objects.filter(tag_id=tag_id).update(
+        **{field: F(field) + delta}
+    )
+    if not updated:
+        # the tag was created with bulk_create()
+        refresh_tag_index([tag_id])
+
+
+def refresh_tag_index(tag_ids) -> None:
+    # recounts the given tags, tag_ids can be a list or a subquery. Three
+    # queries per BATCH_SIZE tags. The items are only filtered on the tag
+    # so they are read through its index, a content type matches most of
+    # the table.
+    tags = Tag.objects.filter(pk__in=tag_ids).order_by("pk").values_list(
+        "pk", "name"
+    )
+    content_types = {
+        ContentType.objects.get_for_model(model).pk: field
+        for model, field in COUNT_FIELDS.items()
+    }
+
+    last_pk = 0
+    while True:
+        rows = list(tags.filter(pk__gt=last_pk)[:BATCH_SIZE])
+        counts = {
+            (tag_id, content_types[content_type_id]): count
+            for tag_id, content_type_id, count in TaggedItem.objects.filter(
+                tag__in=[pk for pk, name in rows]
+            ).values("tag", "content_type").annotate(
+                count=Count("*")
+            ).values_list("tag", "content_type", "count")
+            if content_type_id in content_types
+        }
+        TagIndex.objects.bulk_create(
+            [
+                TagIndex(
+                    tag_id=pk,
+                    name=name.lower(),
+                    **{
+                        field: counts.get((pk, field), 0)
+                        for field in COUNT_FIELDS.values()
+                    },
+                )
+                for pk, name in rows
+            ],
+            update_conflicts=True,
+            unique_fields=["tag"],
+            update_fields=["name", *COUNT_FIELDS.values()],
+        )
+
+        if len(rows) < BATCH_SIZE:
+            break
+        last_pk = rows[-1][0]
+
+
+def rebuild_tag_index() -> int:
+    refresh_tag_index(Tag.objects.values("pk"))
+    return TagIndex.objects.count()
+
+
+# The prefix range needs code point order like autocomplete_key(), on
+# Postgres that's an index on the "C" collated name next to the plain one
+def install_tag_prefix_index(schema_editor, table: str) -> None:
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_name_prefix_idx "
+            f'ON {table} ((name COLLATE "C"))'
+        )
+
+
+def uninstall_tag_prefix_index(schema_editor, table: str) -> None:
+    schema_editor.execute(f"DROP INDEX IF EXISTS {table}_name_prefix_idx")
+
+
+def suggest_tags(term: str, model=None, limit: int = 20) -> list[str]:
+    # the most used tags starting with term, for model if it's given
+    term = term.strip().lower()
+    key = (term, model and model._meta.label, limit)
+
+    names = suggestion_cache.get(key)
+    if names is not None:
+        return names
+
+    if model in COUNT_FIELDS:
+        ordering = F(COUNT_FIELDS[model]).desc()
+    else:
+        ordering = (F("task_count") + F("project_count")).desc()
+
+    # A short prefix matches thousands of tags, sorting them all would be
+    # slow. Those are read in popularity order from the count index until
+    # enough match instead, which stops early because so many do. Rarer
+    # prefixes are a range scan on name and a sort of a few rows.
+    matches = TagIndex.objects.annotate(
+        prefix_key=code_point_order(F("name"))
+    ).filter(prefix_key__gte=term, prefix_key__lt=term + "\U0010ffff")
+    if matches.order_by("prefix_key")[RANGE_SCAN_ROWS:].exists():
+        matches = TagIndex.objects.filter(name__startswith=term)
+
+    names = list(matches.order_by(ordering, "name").values_list(
+        "tag__name", flat=True
+    )[:limit])
+    suggestion_cache.set(key, names)
+
+    return names
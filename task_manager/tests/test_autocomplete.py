@@ -0,0 +1,144 @@
+from django.contrib.auth import get_user_model
+from django.contrib.staticfiles import finders
+from django.test import TestCase
+from django.urls import reverse_lazy
+from datetime import datetime
+
+from ..form import ProjectCreateForm
+from ..models import Project
+from team_manager.form import TeamCreationForm
+from team_manager.models import Team
+
+
+WORKER_AUTOCOMPLETE = reverse_lazy("team_manager:worker-autocomplete")
+COWORKER_AUTOCOMPLETE = reverse_lazy("team_manager:coworker-autocomplete")
+TEAM_AUTOCOMPLETE = reverse_lazy("team_manager:team-autocomplete")
+PROJECT_AUTOCOMPLETE = reverse_lazy("task_manager:project-autocomplete")
+
+
+class AutocompleteViewTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.client.force_login(self.user)
+
+        for i in range(30):
+            get_user_model().objects.create(username=f"worker{i:02}")
+            Team.objects.create(name=f"team{i:02}")
+
+        get_user_model().objects.create(username="other")
+
+    def texts(self, url, **params) -> tuple:
+        data = self.client.get(url, params).json()
+        return [result["text"] for result in data["results"]], data["next"]
+
+    def test_login_required(self):
+        self.client.logout()
+
+        response = self.client.get(WORKER_AUTOCOMPLETE)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_prefix_search_pages_through_results(self):
+        first, cursor = self.texts(WORKER_AUTOCOMPLETE, term="worker")
+        second, cursor = self.texts(
+            WORKER_AUTOCOMPLETE, term="worker", cursor=cursor
+        )
+
+        self.assertEqual(len(first), 20)
+        self.assertEqual(first[0], "worker00")
+        self.assertEqual(second[-1], "worker29")
+        self.assertEqual(len(first + second), 30)
+        self.assertIsNone(cursor)
+
+    def test_prefix_only_matches_the_start(self):
+        texts, cursor = self.texts(TEAM_AUTOCOMPLETE, term="team1")
+
+        self.assertEqual(texts, [f"team1{i}" for i in range(10)])
+
+        texts, cursor = self.texts(TEAM_AUTOCOMPLETE, term="eam")
+
+        self.assertEqual(texts, [])
+
+    def test_prefix_ignores_case(self):
+        texts, cursor = self.texts(WORKER_AUTOCOMPLETE, term="main")
+
+        self.assertEqual(texts, ["MainUser"])
+
+        texts, cursor = self.texts(TEAM_AUTOCOMPLETE, term="TEAM2")
+
+        self.assertEqual(texts, [f"team2{i}" for i in range(10)])
+
+    def test_coworkers_share_a_team(self):
+        team = Team.objects.get(name="team00")
+        team.members.add(
+            self.user, get_user_model().objects.get(username="worker05")
+        )
+
+        texts, cursor = self.texts(COWORKER_AUTOCOMPLETE)
+
+        self.assertEqual(texts, ["MainUser", "worker05"])
+
+    def test_projects(self):
+        Project.objects.create(
+            name="Website", deadline=datetime.today().date()
+        )
+
+        texts, cursor = self.texts(PROJECT_AUTOCOMPLETE, term="Web")
+
+        self.assertEqual(texts, ["Website"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(TEAM_AUTOCOMPLETE, {"cursor": "broken"})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class AutocompleteWidgetTest(TestCase):
+    def setUp(self) -> None:
+        for i in range(50):
+            get_user_model().objects.create(username=f"worker{i:02}")
+            Team.objects.create(name=f"team{i:02}")
+
+    def test_only_selected_values_are_rendered(self):
+        selected = Team.objects.filter(name__in=["team03", "team07"])
+        form = ProjectCreateForm(initial={"teams": list(selected)})
+
+        html = str(form["teams"])
+
+        self.assertIn("team03", html)
+        self.assertIn("team07", html)
+        self.assertNotIn("team04", html)
+        self.assertEqual(html.count("<option"), 2)
+        self.assertIn(f'data-autocomplete-url="{TEAM_AUTOCOMPLETE}"', html)
+
+    def test_empty_form_renders_no_options(self):
+        form = TeamCreationForm()
+
+        with self.assertNumQueries(0):
+            html = str(form["members"]) + str(form["projects"])
+
+        self.assertNotIn("<option", html)
+
+    def test_submitted_values_are_validated(self):
+        worker = get_user_model().objects.get(username="worker10")
+        form = TeamCreationForm(data={
+            "name": "NewTeam",
+            "members": [worker.id],
+            "owner": worker.id,
+        })
+
+        self.assertTrue(form.is_valid())
+        self.assertEqual(list(form.cleaned_data["members"]), [worker])
+
+    def test_script_runs_after_jquery_init(self):
+        media = str(ProjectCreateForm().media)
+
+        # jquery.init.js removes the global $ and jQuery, the script has to
+        # use django.jQuery, which select2 was added to
+        self.assertLess(
+            media.index("admin/js/jquery.init.js"),
+            media.index("js/autocomplete.js"),
+        )
+        with open(finders.find("js/autocomplete.js")) as file:
+            script = file.read()
+        self.assertIn("})((window.django && django.jQuery)", script)
@@ -0,0 +1,82 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, RequestFactory
+from django.urls import reverse
+from datetime import datetime
+
+from ..boards import build_task_board
+from ..models import TaskType, Task, Project
+
+
+class TaskBoardTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="MainUser", password="Main1234"
+        )
+        self.project = Project.objects.create(
+            name="Project", deadline=datetime.today().date()
+        )
+        task_type = TaskType.objects.create(name="Bug")
+
+        for i in range(8):
+            Task.objects.create(
+                name=f"task{i}",
+                deadline=datetime.today().date(),
+                task_type=task_type,
+                owner=self.user,
+                project=self.project,
+                is_completed=i < 3,
+            )
+
+    def build(self, **params):
+        request = RequestFactory().get("/", params)
+        return build_task_board(request, Task.objects.all(), per_page=2)
+
+    def test_columns_are_partitioned_and_joined(self):
+        with self.assertNumQueries(2):
+            board = self.build()
+            owners = [
+                task.owner.username
+                for column in board.columns
+                for task in column
+            ]
+
+        self.assertEqual(owners, ["MainUser"] * 4)
+        self.assertEqual(
+            [task.name for task in board.completed], ["task0", "task1"]
+        )
+        self.assertEqual(
+            [task.name for task in board.open], ["task3", "task4"]
+        )
+
+    def test_columns_page_independently(self):
+        board = self.build()
+        board = self.build(open_cursor=board.open.page.next_cursor)
+
+        self.assertEqual(
+            [task.name for task in board.completed], ["task0", "task1"]
+        )
+        self.assertEqual(
+            [task.name for task in board.open], ["task5", "task6"]
+        )
+        self.assertIn("open_cursor=", board.open.previous_query)
+        self.assertIn("open_cursor=", board.open.next_query)
+
+    def test_detail_page_renders_board(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse("task_manager:project-detail", args=[self.project.id])
+        )
+
+        board = response.context["task_board"]
+
+        self.assertContains(response, "task4")
+        self.assertEqual(len(board.completed.page), 3)
+        self.assertIsNone(board.open.next_query)
+
+        response = self.client.get(
+            reverse("task_manager:project-detail", args=[self.project.id]),
+            {"completed_cursor": "broken"},
+        )
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,190 @@
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.messages import get_messages
+from django.test import TestCase
+from django.urls import reverse_lazy
+from datetime import datetime
+from taggit.models import TaggedItem
+
+from ..bulk_actions import run_bulk_action
+from ..models import TaskType, Task, Project
+from team_manager.counters import get_counters
+from team_manager.models import Team
+
+
+BULK_ACTION = reverse_lazy("task_manager:task-bulk-action")
+
+
+class BulkActionTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.coworker = get_user_model().objects.create(username="Coworker")
+        team = Team.objects.create(name="Team")
+        team.members.add(self.user, self.coworker)
+
+        project = Project.objects.create(
+            name="Mine", deadline=datetime.today().date()
+        )
+        project.teams.add(team)
+        other_project = Project.objects.create(
+            name="Other", deadline=datetime.today().date()
+        )
+        task_type = TaskType.objects.create(name="Bug")
+
+        self.tasks = [
+            Task.objects.create(
+                name=f"task{i}",
+                deadline=datetime.today().date(),
+                task_type=task_type,
+                project=project,
+            )
+            for i in range(5)
+        ]
+        self.foreign = Task.objects.create(
+            name="foreign",
+            deadline=datetime.today().date(),
+            task_type=task_type,
+            project=other_project,
+        )
+        self.ids = [task.pk for task in self.tasks]
+
+    def run_action(self, action, **kwargs):
+        return run_bulk_action(
+            self.user, action, self.ids + [self.foreign.pk], **kwargs
+        )
+
+    def test_complete_skips_tasks_outside_teams(self):
+        # permission check, savepoint, update, counter and release
+        with self.assertNumQueries(5):
+            done, skipped = self.run_action("complete")
+
+        self.assertEqual((done, skipped), (5, 1))
+        self.assertEqual(Task.objects.filter(is_completed=True).count(), 5)
+        self.assertFalse(Task.objects.get(pk=self.foreign.pk).is_completed)
+        self.assertEqual(get_counters()["completed_tasks"], 5)
+
+        self.run_action("incomplete")
+
+        self.assertEqual(get_counters()["completed_tasks"], 0)
+
+    def test_set_priority(self):
+        self.run_action("set_priority", priority="urgent")
+
+        self.assertEqual(
+            Task.objects.filter(priority="urgent").count(), 5
+        )
+        self.assertEqual(
+            Task.objects.get(pk=self.foreign.pk).priority, "medium"
+        )
+
+    def test_assignees(self):
+        self.tasks[0].assignees.add(self.coworker)
+
+        # permission check, savepoint, insert, updated_at of the tasks and
+        # the workers, release
+        with self.assertNumQueries(6):
+            self.run_action(
+                "add_assignees", worker_ids=[self.user.pk, self.coworker.pk]
+            )
+
+        self.assertEqual(Task.assignees.through.objects.count(), 10)
+        self.assertFalse(self.foreign.assignees.exists())
+
+        self.run_action("remove_assignees", worker_ids=[self.coworker.pk])
+
+        self.assertEqual(
+            set(Task.assignees.through.objects.values_list(
+                "worker_id", flat=True
+            )),
+            {self.user.pk},
+        )
+
+    def test_tags(self):
+        self.tasks[0].tags.add("alpha")
+
+        self.run_action("add_tags", tag_names=["alpha", "beta"])
+
+        self.assertEqual(Task.objects.filter(tags__name="alpha").count(), 5)
+        self.assertEqual(Task.objects.filter(tags__name="beta").count(), 5)
+        self.assertFalse(self.foreign.tags.exists())
+
+        self.run_action("remove_tags", tag_names=["alpha"])
+
+        self.assertFalse(Task.objects.filter(tags__name="alpha").exists())
+        self.assertEqual(Task.objects.filter(tags__name="beta").count(), 5)
+
+    def test_delete(self):
+        self.tasks[0].assignees.add(self.user)
+        self.tasks[0].tags.add("alpha")
+        self.tasks[1].is_completed = True
+        self.tasks[1].save()
+        # the tag index looks it up, cached or not depending on test order
+        ContentType.objects.get_for_model(Project)
+
+        # permission check, savepoint, completed count, assignees, tag ids,
+        # tags, tasks, counter, tag index tags, counts and update, release
+        with self.assertNumQueries(12):
+            self.run_action("delete")
+
+        self.assertEqual(list(Task.objects.all()), [self.foreign])
+        self.assertFalse(Task.assignees.through.objects.exists())
+        self.assertEqual(get_counters()["completed_tasks"], 0)
+
+    def test_only_assignees_and_tags_refer_to_tasks(self):
+        # delete_tasks() deletes the tasks without cascading, anything
+        # else referring to a task has to be deleted there too
+        referring = {
+            field.related_model
+            for field in Task._meta.get_fields(include_hidden=True)
+            if field.is_relation and not field.concrete
+        }
+
+        self.assertEqual(referring, {Task.assignees.through, TaggedItem})
+
+
+class BulkActionViewTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.client.force_login(self.user)
+        team = Team.objects.create(name="Team")
+        team.members.add(self.user)
+        project = Project.objects.create(
+            name="Mine", deadline=datetime.today().date()
+        )
+        project.teams.add(team)
+        self.task = Task.objects.create(
+            name="task",
+            deadline=datetime.today().date(),
+            task_type=TaskType.objects.create(name="Bug"),
+            project=project,
+        )
+
+    def test_action_redirects_back(self):
+        response = self.client.post(BULK_ACTION, {
+            "tasks": [self.task.pk],
+            "action": "complete",
+            "next": "/tasks/?name=task",
+        })
+
+        self.assertRedirects(
+            response, "/tasks/?name=task", fetch_redirect_response=False
+        )
+        self.assertTrue(Task.objects.get().is_completed)
+
+    def test_missing_option_is_reported(self):
+        response = self.client.post(BULK_ACTION, {
+            "tasks": [self.task.pk],
+            "action": "set_priority",
+            "next": "https://example.com/",
+        })
+
+        self.assertRedirects(
+            response,
+            reverse_lazy("task_manager:task-list"),
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ["This field is required for this action."],
+        )
+        self.assertEqual(Task.objects.get().priority, "medium")
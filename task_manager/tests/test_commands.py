@@ -0,0 +1,155 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from ..management.commands.bench import SIZES
+from ..models import TaskType, Task, Project
+from team_manager.models import Team
+
+
+class BenchmarkIndexesCommandTest(TestCase):
+    def test_reports_plans_and_rolls_back(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark_indexes",
+            tasks=200,
+            projects=20,
+            repeat=1,
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertIn("type + open", output)
+        self.assertIn("plan with indexes", output)
+        self.assertIn("task_type_open_name_idx", output)
+
+        self.assertFalse(TaskType.objects.exists())
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(Project.objects.exists())
+
+
+class BenchmarkTagFiltersCommandTest(TestCase):
+    def test_reports_filters_and_rolls_back(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark_tag_filters",
+            tasks=200,
+            tags=10,
+            projects=20,
+            repeat=1,
+            stdout=out,
+            stderr=StringIO(),
+        )
+
+        output = out.getvalue()
+        self.assertIn("all, grouped semi-join", output)
+        self.assertIn("join + distinct (before)", output)
+        self.assertIn("taggit_taggeditem", output)
+
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(Project.objects.exists())
+
+
+class GenerateLoadDataCommandTest(TestCase):
+    def generate(self, prefix: str) -> list:
+        call_command(
+            "generate_load_data",
+            workers=20,
+            teams=4,
+            projects=10,
+            tasks=150,
+            tags=8,
+            seed=7,
+            prefix=prefix,
+            batch_size=40,
+            stdout=StringIO(),
+        )
+
+        return [
+            (
+                task.description,
+                task.deadline,
+                task.is_completed,
+                task.priority,
+                task.assignees.count(),
+                task.tags.count(),
+            )
+            for task in Task.objects.filter(
+                name__startswith=f"{prefix}-"
+            ).order_by("name")
+        ]
+
+    def test_generates_graph(self):
+        tasks = self.generate("first")
+
+        self.assertEqual(len(tasks), 150)
+        self.assertEqual(Project.objects.count(), 10)
+        self.assertEqual(get_user_model().objects.count(), 20)
+        self.assertEqual(Team.objects.count(), 4)
+        self.assertFalse(Team.objects.filter(members=None).exists())
+        self.assertTrue(Task.assignees.through.objects.exists())
+
+    def test_same_seed_generates_same_data(self):
+        self.assertEqual(self.generate("first"), self.generate("second"))
+
+
+@mock.patch.dict(SIZES, {"tiny": {
+    "workers": 10, "teams": 2, "projects": 3, "tasks": 20, "tags": 3,
+}})
+class BenchCommandTest(TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.baseline = os.path.join(directory.name, "baseline.json")
+
+    def bench(self, **options):
+        call_command(
+            "bench",
+            sizes="tiny",
+            repeat=2,
+            baseline=self.baseline,
+            stdout=StringIO(),
+            stderr=StringIO(),
+            **options,
+        )
+
+    def test_saves_baseline_and_rolls_back(self):
+        self.bench(save=True)
+
+        with open(self.baseline) as file:
+            results = json.load(file)["tiny"]
+
+        self.assertIn("task_manager:task-list", results)
+        self.assertIn("team_manager:team-detail", results)
+        self.assertIn("task_manager:task-create", results)
+        self.assertNotIn("task_manager:task-update", results)
+        self.assertEqual(
+            set(results["task_manager:task-list"]),
+            {"p50_ms", "p95_ms", "queries", "bytes"},
+        )
+        self.assertFalse(Task.objects.exists())
+
+    def test_fails_without_baseline(self):
+        with self.assertRaisesMessage(CommandError, "No baseline"):
+            self.bench()
+
+    def test_fails_on_regression(self):
+        self.bench(save=True)
+        self.bench(tolerance=100)
+
+        with open(self.baseline) as file:
+            baseline = json.load(file)
+        baseline["tiny"]["task_manager:task-list"]["queries"] -= 1
+        with open(self.baseline, "w") as file:
+            json.dump(baseline, file)
+
+        with self.assertRaisesMessage(CommandError, "1 regressions"):
+            self.bench(tolerance=100)
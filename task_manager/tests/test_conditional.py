@@ -0,0 +1,192 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.urls import reverse
+from django.views import generic
+from django.utils.crypto import get_random_string
+from datetime import datetime
+
+from ..conditional import ConditionalGetMixin
+from ..models import TaskType, Task, Project
+from ..saved_filters import TASK_FILTER_COOKIE
+from team_manager.models import Team
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.coworker = get_user_model().objects.create(username="Coworker")
+        self.team = Team.objects.create(name="Team")
+        self.team.members.add(self.user)
+        self.project = Project.objects.create(
+            name="Project", deadline=datetime.today().date()
+        )
+        self.project.teams.add(self.team)
+        self.task = Task.objects.create(
+            name="Task",
+            deadline=datetime.today().date(),
+            task_type=TaskType.objects.create(name="Bug"),
+            project=self.project,
+            owner=self.user,
+        )
+        self.client.force_login(self.user)
+
+    def revalidate(self, url: str, change=None):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        if change:
+            change()
+
+        return self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=response["ETag"],
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+
+    def assert_not_modified(self, url: str) -> None:
+        self.assertEqual(self.revalidate(url).status_code, 304)
+
+    def assert_modified_by(self, url: str, change) -> None:
+        self.assertEqual(self.revalidate(url, change).status_code, 200)
+
+    def test_headers(self):
+        response = self.client.get(
+            reverse("task_manager:task-detail", args=[self.task.pk])
+        )
+
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_not_modified_skips_the_view(self):
+        url = reverse("task_manager:task-detail", args=[self.task.pk])
+        etag = self.client.get(url)["ETag"]
+
+        # session, user and the version
+        with self.assertNumQueries(3):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_pages_are_not_modified(self):
+        for url in [
+            reverse("task_manager:task-list"),
+            reverse("task_manager:task-detail", args=[self.task.pk]),
+            reverse("task_manager:project-list"),
+            reverse("task_manager:project-detail", args=[self.project.pk]),
+            reverse("team_manager:worker-list"),
+            reverse("team_manager:worker-detail", args=[self.user.pk]),
+            reverse("team_manager:team-list"),
+            reverse("team_manager:team-detail", args=[self.team.pk]),
+        ]:
+            with self.subTest(url):
+                self.assert_not_modified(url)
+
+    def test_task_detail_changes(self):
+        url = reverse("task_manager:task-detail", args=[self.task.pk])
+
+        self.assert_modified_by(url, lambda: self.task.tags.add("alpha"))
+        self.assert_modified_by(
+            url, lambda: self.task.assignees.add(self.coworker)
+        )
+        self.assert_modified_by(
+            url, lambda: self.coworker.teams.add(self.team)
+        )
+        self.assert_modified_by(
+            url, lambda: Project.objects.get(pk=self.project.pk).save()
+        )
+
+    def test_etag_differs_between_users(self):
+        url = reverse("task_manager:task-detail", args=[self.task.pk])
+        etag = self.client.get(url)["ETag"]
+
+        self.client.force_login(self.coworker)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_changes_with_the_csrf_token(self):
+        # the pages have forms, a cached copy would post a rotated token
+        def rotate():
+            token = get_random_string(32)
+            self.client.cookies[settings.CSRF_COOKIE_NAME] = token
+
+        for url in [
+            reverse("task_manager:task-list"),
+            reverse("task_manager:task-detail", args=[self.task.pk]),
+            reverse("team_manager:team-detail", args=[self.team.pk]),
+        ]:
+            with self.subTest(url):
+                self.assert_modified_by(url, rotate)
+
+    def test_not_modified_list_saves_its_filter(self):
+        url = reverse("task_manager:task-list")
+        response = self.client.get(url, {"priority": "high"})
+        self.client.get(url, {"priority": "low"})
+
+        response = self.client.get(
+            url, {"priority": "high"}, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertIn("high", response.cookies[TASK_FILTER_COOKIE].value)
+
+    def test_board_changes(self):
+        url = reverse("task_manager:project-detail", args=[self.project.pk])
+
+        self.assert_modified_by(
+            url, lambda: get_user_model().objects.get(pk=self.user.pk).save()
+        )
+        self.assert_modified_by(url, lambda: self.task.delete())
+
+    def test_team_detail_changes(self):
+        url = reverse("team_manager:team-detail", args=[self.team.pk])
+
+        self.assert_modified_by(
+            url, lambda: self.team.members.add(self.coworker)
+        )
+        self.assert_modified_by(url, lambda: self.coworker.delete())
+        self.assert_modified_by(url, lambda: self.project.teams.clear())
+
+    def test_list_changes(self):
+        url = reverse("task_manager:task-list")
+
+        self.assert_modified_by(
+            url, lambda: Task.objects.get(pk=self.task.pk).save()
+        )
+        self.assert_modified_by(url, lambda: self.task.delete())
+
+    def test_list_changes_with_task_type(self):
+        def rename():
+            self.task.task_type.name = "Defect"
+            self.task.task_type.save()
+
+        self.assert_modified_by(reverse("task_manager:task-list"), rename)
+
+    def test_pending_messages_are_rendered(self):
+        url = reverse("task_manager:task-list")
+        etag = self.client.get(url)["ETag"]
+
+        self.client.post(
+            reverse("task_manager:task-bulk-action"),
+            {"action": "set_priority", "tasks": [self.task.pk]},
+        )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(response, "required for this action")
+
+    def test_view_without_version_is_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            class BrokenView(ConditionalGetMixin, generic.DetailView):
+                model = Task
+
+    def test_missing_object(self):
+        response = self.client.get(
+            reverse("task_manager:task-detail", args=[0])
+        )
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,130 @@
+import csv
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse_lazy
+from datetime import datetime
+
+from ..models import TaskType, Task, Project
+from ..views import ExportView
+from team_manager.models import Team
+
+
+TASK_EXPORT = reverse_lazy("task_manager:task-export")
+PROJECT_EXPORT = reverse_lazy("task_manager:project-export")
+
+
+class ExportTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.client.force_login(self.user)
+        self.bug = TaskType.objects.create(name="Bug")
+        feature = TaskType.objects.create(name="Feature")
+        self.project = Project.objects.create(
+            name="Website", deadline=datetime.today().date()
+        )
+        self.project.teams.add(Team.objects.create(name="Team"))
+        self.project.tags.add("web")
+
+        for i in range(10):
+            task = Task.objects.create(
+                name=f"task{i}",
+                description="line one\nline, two",
+                deadline=datetime.today().date(),
+                task_type=self.bug if i % 2 else feature,
+                project=self.project if i < 5 else None,
+                owner=self.user,
+            )
+            task.assignees.add(self.user)
+            task.tags.add("alpha", "beta")
+
+    def content(self, response) -> str:
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_export_uses_list_filters(self):
+        response = self.client.get(
+            TASK_EXPORT, {"format": "csv", "task_type": self.bug.id}
+        )
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="tasks.csv"', response["Content-Disposition"])
+
+        rows = list(csv.DictReader(StringIO(self.content(response))))
+
+        self.assertEqual(
+            [row["name"] for row in rows],
+            ["task1", "task3", "task5", "task7", "task9"],
+        )
+        self.assertEqual(rows[0]["description"], "line one\nline, two")
+        self.assertEqual(rows[0]["project"], "Website")
+        self.assertEqual(rows[-1]["project"], "")
+        self.assertEqual(rows[0]["assignees"], "MainUser")
+        self.assertEqual(sorted(rows[0]["tags"].split(";")), ["alpha", "beta"])
+
+    def test_jsonl_export(self):
+        response = self.client.get(TASK_EXPORT, {"format": "jsonl"})
+        rows = [
+            json.loads(line)
+            for line in self.content(response).splitlines()
+        ]
+
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[0]["assignees"], ["MainUser"])
+        self.assertEqual(
+            rows[0]["deadline"], datetime.today().date().isoformat()
+        )
+        self.assertIsNone(rows[-1]["project"])
+
+    def test_related_rows_are_prefetched_per_chunk(self):
+        # session and user, the tasks query read in chunks of 4, then one
+        # query for assignees and one for tags per chunk
+        with mock.patch("task_manager.exports.CHUNK_SIZE", 4):
+            with self.assertNumQueries(2 + 1 + 3 * 2):
+                list(self.client.get(
+                    TASK_EXPORT, {"format": "jsonl"}
+                ).streaming_content)
+
+    def test_project_export(self):
+        response = self.client.get(
+            PROJECT_EXPORT, {"format": "jsonl", "name": "web"}
+        )
+        rows = [
+            json.loads(line)
+            for line in self.content(response).splitlines()
+        ]
+
+        self.assertEqual(rows[0]["name"], "Website")
+        self.assertEqual(rows[0]["teams"], ["Team"])
+        self.assertEqual(rows[0]["tags"], ["web"])
+
+    def test_unknown_format(self):
+        response = self.client.get(TASK_EXPORT, {"format": "xml"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_subclass_without_queryset_is_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            class BrokenExportView(ExportView):
+                filename = "broken"
+
+    def test_export_command_writes_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tasks.jsonl")
+            err = StringIO()
+
+            call_command(
+                "export_tasks", path, is_completed="False", stderr=err
+            )
+
+            with open(path, encoding="utf-8") as file:
+                rows = [json.loads(line) for line in file]
+
+        self.assertEqual(len(rows), 10)
+        self.assertIn("Exported 10 tasks", err.getvalue())
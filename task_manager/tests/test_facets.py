@@ -0,0 +1,102 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse_lazy
+from datetime import datetime
+
+from ..bulk_actions import run_bulk_action
+from ..facets import get_task_facets
+from ..models import TaskType, Task, Project
+from team_manager.models import Team
+
+
+TASK_FILTER = reverse_lazy("task_manager:task-filter")
+TASK_LIST = reverse_lazy("task_manager:task-list")
+
+
+class TaskFacetsTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = get_user_model().objects.create(username="MainUser")
+        team = Team.objects.create(name="Team")
+        team.members.add(self.user)
+        project = Project.objects.create(
+            name="Project", deadline=datetime.today().date()
+        )
+        project.teams.add(team)
+        self.bug = TaskType.objects.create(name="Bug")
+        self.feature = TaskType.objects.create(name="Feature")
+
+        self.tasks = []
+        for name, task_type, is_completed, priority, tags in [
+            ("one", self.bug, False, "high", ["api", "web"]),
+            ("two", self.bug, True, "low", ["api"]),
+            ("three", self.feature, False, "high", ["web"]),
+        ]:
+            task = Task.objects.create(
+                name=name,
+                deadline=datetime.today().date(),
+                task_type=task_type,
+                is_completed=is_completed,
+                priority=priority,
+                project=project,
+            )
+            task.tags.add(*tags)
+            self.tasks.append(task)
+
+    def test_counts(self):
+        facets = get_task_facets({})
+
+        self.assertEqual(
+            facets["task_type"], {self.bug.pk: 2, self.feature.pk: 1}
+        )
+        self.assertEqual(facets["is_completed"], {False: 2, True: 1})
+        self.assertEqual(facets["priority"], {"high": 2, "low": 1})
+        self.assertEqual(facets["tags"], [("api", 2), ("web", 2)])
+
+    def test_counts_ignore_their_own_filter(self):
+        facets = get_task_facets({
+            "task_type": str(self.bug.pk), "tags": "web"
+        })
+
+        self.assertEqual(
+            facets["task_type"], {self.bug.pk: 1, self.feature.pk: 1}
+        )
+        self.assertEqual(facets["is_completed"], {False: 1})
+        self.assertEqual(facets["tags"], [("api", 2), ("web", 1)])
+
+    def test_counts_are_cached_until_a_task_changes(self):
+        get_task_facets({})
+
+        with self.assertNumQueries(0):
+            get_task_facets({})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tasks[0].tags.add("db")
+
+        self.assertIn(("db", 1), get_task_facets({})["tags"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            run_bulk_action(self.user, "complete", [self.tasks[0].pk])
+
+        self.assertEqual(
+            get_task_facets({})["is_completed"], {False: 1, True: 2}
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tasks[2].delete()
+
+        self.assertEqual(
+            get_task_facets({})["task_type"], {self.bug.pk: 2}
+        )
+
+    def test_filter_page_shows_counts_of_saved_filter(self):
+        self.client.force_login(self.user)
+        self.client.get(TASK_LIST, {"priority": "high"})
+
+        response = self.client.get(TASK_FILTER)
+
+        self.assertContains(response, "Bug (1)")
+        self.assertContains(response, "Not completed (2)")
+        self.assertContains(response, "Low (1)")
+        self.assertContains(response, "Most used: web (2), api (1)")
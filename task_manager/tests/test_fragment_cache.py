@@ -0,0 +1,96 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from datetime import datetime
+
+from ..bulk_actions import run_bulk_action
+from ..models import TaskType, Task, Project
+from team_manager.models import Team
+
+
+class FragmentCacheTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = get_user_model().objects.create(username="MainUser")
+        team = Team.objects.create(name="Team")
+        team.members.add(self.user)
+        project = Project.objects.create(
+            name="Project", deadline=datetime.today().date()
+        )
+        project.teams.add(team)
+        self.task = Task.objects.create(
+            name="Old name",
+            deadline=datetime.today().date(),
+            task_type=TaskType.objects.create(name="Bug"),
+            project=project,
+            owner=self.user,
+        )
+        self.client.force_login(self.user)
+
+    def updated_at(self):
+        return Task.objects.get(pk=self.task.pk).updated_at
+
+    def assert_bumped(self, change) -> None:
+        before = self.updated_at()
+        change()
+        self.assertGreater(self.updated_at(), before)
+
+    def test_tags_bump_updated_at(self):
+        self.assert_bumped(lambda: self.task.tags.add("alpha"))
+        self.assert_bumped(lambda: self.task.tags.remove("alpha"))
+        self.task.tags.add("beta")
+        self.assert_bumped(lambda: self.task.tags.clear())
+
+    def test_assignees_bump_updated_at(self):
+        self.assert_bumped(lambda: self.task.assignees.add(self.user))
+        self.assert_bumped(lambda: self.task.assignees.clear())
+        self.assert_bumped(lambda: self.user.tasks.add(self.task))
+        self.assert_bumped(lambda: self.user.tasks.clear())
+
+    def test_bulk_actions_bump_updated_at(self):
+        for action, kwargs in [
+            ("complete", {}),
+            ("set_priority", {"priority": "urgent"}),
+            ("add_assignees", {"worker_ids": [self.user.pk]}),
+            ("remove_assignees", {"worker_ids": [self.user.pk]}),
+            ("add_tags", {"tag_names": ["alpha"]}),
+            ("remove_tags", {"tag_names": ["alpha"]}),
+        ]:
+            with self.subTest(action):
+                self.assert_bumped(lambda: run_bulk_action(
+                    self.user, action, [self.task.pk], **kwargs
+                ))
+
+    def test_cached_row_is_replaced_when_the_task_changes(self):
+        url = reverse("task_manager:task-list")
+        self.assertContains(self.client.get(url), "Old name")
+
+        # update() leaves updated_at alone, the cached row is served
+        Task.objects.filter(pk=self.task.pk).update(name="New name")
+        self.assertContains(self.client.get(url), "Old name")
+
+        self.task.tags.add("alpha")
+        self.assertContains(self.client.get(url), "New name")
+
+    def test_cached_card_is_replaced_when_the_task_changes(self):
+        self.task.assignees.add(self.user)
+        url = reverse("team_manager:worker-detail", args=[self.user.pk])
+        self.assertContains(self.client.get(url), "Old name")
+
+        Task.objects.filter(pk=self.task.pk).update(name="New name")
+        self.assertContains(self.client.get(url), "Old name")
+
+        self.task.refresh_from_db()
+        self.task.save()
+        self.assertContains(self.client.get(url), "New name")
+
+    def test_cached_row_is_replaced_when_the_task_type_is_renamed(self):
+        url = reverse("task_manager:task-list")
+        self.assertContains(self.client.get(url), "Bug")
+
+        task_type = self.task.task_type
+        task_type.name = "Defect"
+        task_type.save()
+
+        self.assertContains(self.client.get(url), "Defect")
@@ -0,0 +1,233 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse_lazy
+
+from ..imports import BATCH_SIZE, TaskImporter
+from ..models import TaskType, Task, Project
+from ..search import search
+from team_manager.counters import get_counters
+
+
+TASK_IMPORT = reverse_lazy("task_manager:task-import")
+
+CSV_HEADER = (
+    "name,description,deadline,is_completed,priority,task_type,"
+    "project,owner,assignees,tags\n"
+)
+
+
+class TaskImporterTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.other = get_user_model().objects.create(username="Other")
+        self.bug = TaskType.objects.create(name="Bug")
+        self.project = Project.objects.create(
+            name="Website", deadline="2030-01-01"
+        )
+        Task.objects.create(
+            name="existing", deadline="2030-01-01", task_type=self.bug
+        )
+
+    def run_csv(self, rows: str, **kwargs):
+        return TaskImporter(**kwargs).run(StringIO(CSV_HEADER + rows), "csv")
+
+    def test_csv_import_resolves_names(self):
+        result = self.run_csv(
+            "one,text,2030-01-02,true,high,Bug,Website,Other,"
+            "MainUser;Other,alpha;beta\n"
+            "two,,2030-01-03,,,Bug,,,,alpha\n",
+            default_owner=self.user,
+        )
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.created, 2)
+
+        one = Task.objects.get(name="one")
+        self.assertTrue(one.is_completed)
+        self.assertEqual(one.priority, "high")
+        self.assertEqual(one.project, self.project)
+        self.assertEqual(one.owner, self.other)
+        self.assertEqual(
+            sorted(one.assignees.values_list("username", flat=True)),
+            ["MainUser", "Other"],
+        )
+        self.assertEqual(
+            sorted(one.tags.values_list("name", flat=True)),
+            ["alpha", "beta"],
+        )
+
+        two = Task.objects.get(name="two")
+        self.assertIsNone(two.description)
+        self.assertFalse(two.is_completed)
+        self.assertEqual(two.priority, "medium")
+        self.assertEqual(two.owner, self.user)
+        self.assertEqual(
+            list(two.tags.values_list("name", flat=True)), ["alpha"]
+        )
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        result = self.run_csv(
+            "good,,2030-01-02,,,Bug,,,,\n"
+            ",,2030-01-02,,,Bug,,,,\n"
+            "bad date,,tomorrow,,,Bug,,,,\n"
+            "bad priority,,2030-01-02,,someday,Bug,,,,\n"
+            "bad type,,2030-01-02,,,Chore,,,,\n"
+            "bad project,,2030-01-02,,,Bug,Nowhere,,,\n"
+            "bad worker,,2030-01-02,,,Bug,,,Nobody,\n"
+            "existing,,2030-01-02,,,Bug,,,,\n"
+            "good,,2030-01-02,,,Bug,,,,\n"
+        )
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual(
+            [row for row, message in result.errors],
+            [2, 3, 4, 5, 6, 7, 8, 9],
+        )
+        self.assertIn("Nobody", result.errors[5][1])
+        self.assertEqual(
+            sorted(Task.objects.values_list("name", flat=True)),
+            ["existing", "good"],
+        )
+
+    def test_long_names_are_rejected(self):
+        result = self.run_csv(
+            f"{'n' * 256},,2030-01-02,,,Bug,,,,\n"
+            f"long tag,,2030-01-02,,,Bug,,,,ok;{'t' * 101}\n"
+            f"longest tag,,2030-01-02,,,Bug,,,,{'t' * 100}\n"
+        )
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual(
+            result.errors,
+            [
+                (1, "name is longer than 255 characters"),
+                (2, "tags can't be longer than 100 characters"),
+            ],
+        )
+        self.assertFalse(Task.objects.filter(name="long tag").exists())
+
+    def test_jsonl_import(self):
+        rows = [
+            {
+                "name": "one",
+                "deadline": "2030-01-02",
+                "is_completed": False,
+                "task_type": "Bug",
+                "assignees": ["Other"],
+                "tags": ["alpha"],
+            },
+            "not an object",
+        ]
+        file = StringIO(
+            "\n".join(json.dumps(row) for row in rows) + "\n{broken\n"
+        )
+
+        result = TaskImporter().run(file, "jsonl")
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual([row for row, _ in result.errors], [2, 3])
+        self.assertEqual(
+            list(Task.objects.get(name="one").assignees.all()), [self.other]
+        )
+
+    def test_lookups_are_per_batch(self):
+        rows = "".join(
+            f"task{i},,2030-01-02,true,,Bug,Website,MainUser,Other,"
+            f"tag{i % 3}\n"
+            for i in range(20)
+        )
+
+        # per batch: task types, projects, workers, existing names,
+        # savepoint, tags, tasks, task ids, assignees, tagged items,
+        # counter, tag index tags, counts and update, and release, plus five
+        # statements to defer the search index. The first batch also checks
+        # the slugs, inserts and rereads the new tags
+        with self.assertNumQueries(2 * 20 + 3):
+            result = self.run_csv(rows, batch_size=10)
+
+        self.assertEqual(result.created, 20)
+        self.assertEqual(Task.objects.filter(tags__name="tag0").count(), 7)
+        self.assertEqual(get_counters()["completed_tasks"], 20)
+        self.assertEqual(
+            list(search(Task.objects.all(), "task13")),
+            [Task.objects.get(name="task13")],
+        )
+
+    def test_dry_run_writes_nothing(self):
+        result = self.run_csv("one,,2030-01-02,,,Bug,,,,alpha\n", dry_run=True)
+
+        self.assertEqual(result.created, 1)
+        self.assertFalse(Task.objects.filter(name="one").exists())
+
+
+class ImportTasksCommandTest(TestCase):
+    def setUp(self) -> None:
+        get_user_model().objects.create(username="MainUser")
+        TaskType.objects.create(name="Bug")
+
+    def test_command_imports_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tasks.csv")
+            with open(path, "w") as file:
+                file.write(CSV_HEADER)
+                file.write("one,,2030-01-02,,,Bug,,,,\n")
+                file.write("two,,2030-01-02,,,Chore,,,,\n")
+
+            stderr = StringIO()
+            call_command("import_tasks", path, owner="MainUser", stderr=stderr)
+
+        self.assertEqual(Task.objects.get().owner.username, "MainUser")
+        self.assertIn("Row 2: unknown task type 'Chore'", stderr.getvalue())
+        self.assertIn("Imported 1 tasks", stderr.getvalue())
+
+
+class TaskImportViewTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.client.force_login(self.user)
+        TaskType.objects.create(name="Bug")
+
+    def test_upload(self):
+        upload = SimpleUploadedFile(
+            "tasks.csv",
+            ("﻿" + CSV_HEADER + "one,,2030-01-02,,,Bug,,,,\n").encode(),
+        )
+
+        response = self.client.post(TASK_IMPORT, {"file": upload})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["result"].created, 1)
+        self.assertEqual(Task.objects.get().owner, self.user)
+
+    def test_undecodable_upload_imports_nothing(self):
+        # the reader decodes a few kilobytes ahead, the first batch is
+        # written well before the bad byte
+        rows = "".join(
+            f"task{i},,2030-01-02,,,Bug,,,,\n" for i in range(2 * BATCH_SIZE)
+        )
+        upload = SimpleUploadedFile(
+            "tasks.csv", (CSV_HEADER + rows).encode() + b"\xff,,\n"
+        )
+
+        response = self.client.post(TASK_IMPORT, {"file": upload})
+
+        self.assertFormError(
+            response.context["form"], "file", "The file must be UTF-8 encoded."
+        )
+        self.assertFalse(Task.objects.exists())
+
+    def test_unknown_extension(self):
+        upload = SimpleUploadedFile("tasks.txt", CSV_HEADER.encode())
+
+        response = self.client.post(TASK_IMPORT, {"file": upload})
+
+        self.assertFormError(
+            response.context["form"], "format", "Can't tell the file format."
+        )
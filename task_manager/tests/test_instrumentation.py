@@ -0,0 +1,73 @@
+import re
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+from datetime import datetime
+
+from ..models import TaskType, Task
+
+
+TASK_LIST = reverse_lazy("task_manager:task-list")
+INDEX = reverse_lazy("team_manager:index")
+
+SERVER_TIMING_RE = re.compile(
+    r'db;dur=[\d.]+;desc="(\d+) queries", '
+    r"template;dur=([\d.]+), total;dur=[\d.]+"
+)
+
+
+class InstrumentationMiddlewareTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.client.force_login(self.user)
+        Task.objects.create(
+            name="task",
+            deadline=datetime.today().date(),
+            task_type=TaskType.objects.create(name="Bug"),
+        )
+
+    def test_server_timing_header(self):
+        with self.assertNumQueries(4) as context:
+            response = self.client.get(TASK_LIST)
+
+        match = SERVER_TIMING_RE.fullmatch(response["Server-Timing"])
+
+        self.assertIsNotNone(match, response["Server-Timing"])
+        self.assertEqual(
+            int(match.group(1)), len(context.captured_queries)
+        )
+        self.assertGreater(float(match.group(2)), 0)
+
+    def test_template_time_of_render(self):
+        # the index view renders with render(), not a TemplateResponse
+        response = self.client.get(INDEX)
+
+        match = SERVER_TIMING_RE.fullmatch(response["Server-Timing"])
+
+        self.assertGreater(float(match.group(2)), 0)
+
+    def test_request_log_line(self):
+        with self.assertLogs("task_manager.instrumentation", "INFO") as logs:
+            self.client.get(TASK_LIST)
+
+        record = logs.records[-1]
+
+        self.assertEqual(record.view, "task_manager:task-list")
+        self.assertEqual(record.status, 200)
+        self.assertEqual(record.queries, 4)
+        self.assertIn("view=task_manager:task-list", record.getMessage())
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_slow_queries_are_logged_with_view(self):
+        with self.assertLogs(
+            "task_manager.instrumentation", "WARNING"
+        ) as logs:
+            self.client.get(TASK_LIST)
+
+        self.assertEqual(len(logs.records), 4)
+        self.assertTrue(all(
+            record.view == "task_manager:task-list"
+            for record in logs.records
+        ))
+        self.assertIn("task_manager_task", logs.records[-1].sql)
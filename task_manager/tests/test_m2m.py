@@ -0,0 +1,83 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from datetime import datetime
+
+from ..form import TaskChangeStatusForm
+from ..m2m import sync_m2m
+from ..models import TaskType, Task
+from team_manager.models import Team
+
+
+class SyncM2MTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.workers = [
+            get_user_model().objects.create(username=f"worker{i}")
+            for i in range(4)
+        ]
+        team = Team.objects.create(name="Team")
+        team.members.add(self.user, *self.workers)
+
+        self.task = Task.objects.create(
+            name="Task",
+            deadline=datetime.today().date(),
+            task_type=TaskType.objects.create(name="Bug"),
+        )
+        self.task.assignees.add(*self.workers[:2])
+
+    def assignees(self) -> list:
+        return sorted(self.task.assignees.values_list("username", flat=True))
+
+    def change_status(self, assignees: list, is_completed: bool = False):
+        task = Task.objects.get(pk=self.task.pk)
+        form = TaskChangeStatusForm(
+            user=self.user,
+            instance=task,
+            data={
+                "assignees": [worker.id for worker in assignees],
+                "is_completed": "on" if is_completed else "",
+            },
+        )
+        self.assertTrue(form.is_valid())
+        return form
+
+    def test_unchanged_set_only_reads(self):
+        with self.assertNumQueries(1):
+            added, removed = sync_m2m(self.task.assignees, self.workers[:2])
+
+        self.assertEqual((added, removed), (set(), set()))
+
+    def test_only_the_delta_is_written(self):
+        # SELECT current ids, DELETE, SELECT existing, INSERT, and an UPDATE
+        # of the task and the workers after each write
+        with self.assertNumQueries(8):
+            sync_m2m(self.task.assignees, self.workers[1:3])
+
+        self.assertEqual(self.assignees(), ["worker1", "worker2"])
+
+    def test_accepts_ids(self):
+        sync_m2m(self.task.assignees, [str(self.workers[3].id)])
+
+        self.assertEqual(self.assignees(), ["worker3"])
+
+    def test_change_status_form_without_changes(self):
+        form = self.change_status(self.workers[:2])
+
+        # SAVEPOINT, SELECT current ids, RELEASE SAVEPOINT
+        with self.assertNumQueries(3):
+            form.save()
+
+        self.assertEqual(self.assignees(), ["worker0", "worker1"])
+
+    def test_change_status_form_writes_delta(self):
+        form = self.change_status(self.workers[1:3], is_completed=True)
+
+        # SAVEPOINT, UPDATE task, UPDATE completed tasks counter,
+        # SELECT current ids, DELETE, SELECT existing, INSERT, an UPDATE of
+        # the task and the workers after each write, RELEASE SAVEPOINT
+        with self.assertNumQueries(12):
+            form.save()
+
+        self.task.refresh_from_db()
+        self.assertTrue(self.task.is_completed)
+        self.assertEqual(self.assignees(), ["worker1", "worker2"])
@@ -0,0 +1,111 @@
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+
+from ..metrics import INITIAL_SIZE, MmapedDict, observe, render_metrics
+
+
+TASK_LIST = reverse_lazy("task_manager:task-list")
+METRICS = reverse_lazy("metrics")
+
+
+class MetricsStoreTest(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_values_survive_reopening_and_growth(self):
+        store = MmapedDict(self.path("metrics_1.db"))
+        store.inc("first", 1.5)
+        store.inc("first", 1)
+
+        # enough keys to outgrow the initial file
+        for i in range(INITIAL_SIZE // 32):
+            store.inc(f"key{i}", i)
+
+        values = MmapedDict.read(self.path("metrics_1.db"))
+        self.assertEqual(values["first"], 2.5)
+        self.assertEqual(values[f"key{INITIAL_SIZE // 32 - 1}"], 2047)
+
+        reopened = MmapedDict(self.path("metrics_1.db"))
+        reopened.inc("first", 1)
+        self.assertEqual(
+            MmapedDict.read(self.path("metrics_1.db"))["first"], 3.5
+        )
+
+    def test_histograms_are_summed_over_processes(self):
+        for pid, durations in ((1, [0.003, 0.2]), (2, [20])):
+            store = MmapedDict(self.path(f"metrics_{pid}.db"))
+            for duration in durations:
+                observe(
+                    store, "http_request_duration_seconds", "a:b", duration
+                )
+
+        with override_settings(METRICS_DIR=self.directory.name):
+            lines = render_metrics().splitlines()
+
+        name = "http_request_duration_seconds"
+        self.assertIn(f'{name}_bucket{{view="a:b",le="0.005"}} 1', lines)
+        self.assertIn(f'{name}_bucket{{view="a:b",le="0.1"}} 1', lines)
+        self.assertIn(f'{name}_bucket{{view="a:b",le="0.25"}} 2', lines)
+        self.assertIn(f'{name}_bucket{{view="a:b",le="10"}} 2', lines)
+        self.assertIn(f'{name}_bucket{{view="a:b",le="+Inf"}} 3', lines)
+        self.assertIn(f'{name}_count{{view="a:b"}} 3', lines)
+        self.assertIn(f"# TYPE {name} histogram", lines)
+
+
+class MetricsViewTest(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.client.force_login(self.user)
+
+    def test_requests_are_reported_by_url_name(self):
+        with override_settings(METRICS_DIR=self.directory.name):
+            self.client.get(TASK_LIST)
+            self.client.get(TASK_LIST)
+            response = self.client.get(METRICS)
+
+        content = response.content.decode()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'http_request_duration_seconds_count'
+            '{view="task_manager:task-list"} 2',
+            content,
+        )
+        self.assertIn(
+            'http_request_db_queries_bucket'
+            '{view="task_manager:task-list",le="5"} 2',
+            content,
+        )
+        self.assertIn(
+            'http_response_size_bytes_count'
+            '{view="task_manager:task-list"} 2',
+            content,
+        )
+
+    def test_remote_scrapes_need_token(self):
+        with override_settings(
+            METRICS_DIR=self.directory.name, METRICS_TOKEN="secret"
+        ):
+            response = self.client.get(METRICS, REMOTE_ADDR="10.0.0.1")
+            self.assertEqual(response.status_code, 403)
+
+            response = self.client.get(
+                METRICS,
+                REMOTE_ADDR="10.0.0.1",
+                HTTP_AUTHORIZATION="Bearer secret",
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_disabled_without_directory(self):
+        with override_settings(METRICS_DIR=""):
+            self.assertEqual(self.client.get(METRICS).status_code, 404)
@@ -0,0 +1,151 @@
+import base64
+import json
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from datetime import datetime
+
+from ..models import TaskType, Task, Project
+from ..pagination import KeysetPaginator, InvalidCursor
+
+
+TASK_LIST = reverse_lazy("task_manager:task-list")
+WORKER_LIST = reverse_lazy("team_manager:worker-list")
+PROJECT_AUTOCOMPLETE = reverse_lazy("task_manager:project-autocomplete")
+
+# well formed cursors with key values that don't fit the key fields
+TAMPERED_KEYS = [
+    ["t1", "abc"],
+    [None, None],
+    ["t1", 2 ** 70],
+    ["t1", {"id": 1}],
+]
+
+
+def make_cursor(values: list, direction: str = "next") -> str:
+    payload = json.dumps([values, direction, 2]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+class KeysetPaginatorTest(TestCase):
+    def setUp(self) -> None:
+        task_type = TaskType.objects.create(name="Bug")
+
+        for i in range(12):
+            Task.objects.create(
+                name=f"task{i:02}",
+                deadline=datetime.today().date(),
+                task_type=task_type,
+            )
+
+        self.paginator = KeysetPaginator(Task.objects.all(), 5)
+
+    def test_walk_forward_and_back(self):
+        first = self.paginator.page()
+        second = self.paginator.page(first.next_cursor)
+        third = self.paginator.page(second.next_cursor)
+
+        self.assertEqual(
+            [task.name for task in third],
+            ["task10", "task11"],
+        )
+        self.assertFalse(third.has_next())
+        self.assertEqual(third.number, 3)
+        self.assertEqual(self.paginator.num_pages, 3)
+
+        back = self.paginator.page(third.previous_cursor)
+
+        self.assertEqual(list(back), list(second))
+        self.assertTrue(back.has_next())
+        self.assertTrue(back.has_previous())
+
+        self.assertFalse(
+            self.paginator.page(back.previous_cursor).has_previous()
+        )
+
+    def test_descending_fields(self):
+        paginator = KeysetPaginator(
+            Task.objects.all(), 5, fields=("-name", "id")
+        )
+
+        second = paginator.page(paginator.page().next_cursor)
+
+        self.assertEqual(second[0].name, "task06")
+
+    def test_skip_count(self):
+        paginator = KeysetPaginator(Task.objects.all(), 5, count=False)
+
+        with CaptureQueriesContext(connection) as queries:
+            page = paginator.page()
+            list(page)
+
+        self.assertEqual(len(queries), 1)
+        self.assertIsNone(paginator.num_pages)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            self.paginator.page("not-a-cursor")
+
+    def test_tampered_key_values(self):
+        for values in TAMPERED_KEYS:
+            with self.subTest(values), self.assertRaises(InvalidCursor):
+                self.paginator.page(make_cursor(values))
+
+
+class KeysetPaginationViewTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(
+            username="MainUser", password="Main1234"
+        )
+        self.client.force_login(self.user)
+        task_type = TaskType.objects.create(name="Bug")
+
+        for i in range(7):
+            Task.objects.create(
+                name=f"task{i}",
+                deadline=datetime.today().date(),
+                task_type=task_type,
+            )
+
+    def test_next_page_link_keeps_filters(self):
+        response = self.client.get(TASK_LIST, {"is_completed": "False"})
+        page = response.context["page_obj"]
+
+        self.assertContains(response, f"cursor={page.next_cursor}")
+        self.assertContains(response, "is_completed=False")
+
+        response = self.client.get(
+            TASK_LIST,
+            {"is_completed": "False", "cursor": page.next_cursor},
+        )
+
+        self.assertEqual(
+            [task.name for task in response.context["task_list"]],
+            ["task5", "task6"],
+        )
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(TASK_LIST, {"cursor": "broken"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_tampered_cursors_are_rejected(self):
+        project = Project.objects.create(
+            name="Project", deadline=datetime.today().date()
+        )
+        board = reverse_lazy("task_manager:project-detail", args=[project.pk])
+
+        for values in TAMPERED_KEYS:
+            cursor = make_cursor(values, "previous")
+            for url, params, status_code in [
+                (TASK_LIST, {"cursor": cursor}, 404),
+                (WORKER_LIST, {"cursor": cursor}, 404),
+                (board, {"open_cursor": cursor}, 404),
+                (PROJECT_AUTOCOMPLETE, {"cursor": cursor}, 400),
+            ]:
+                with self.subTest(url=url, values=values):
+                    response = self.client.get(url, params)
+                    self.assertEqual(response.status_code, status_code)
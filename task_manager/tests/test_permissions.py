@@ -0,0 +1,80 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+from django.urls import reverse
+from datetime import datetime
+
+from ..models import TaskType, Task, Project
+from ..permissions import is_task_team_member, is_task_assignee
+from team_manager.models import Team
+
+
+class TaskPermissionTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="MainUser", password="Main1234"
+        )
+        self.other = get_user_model().objects.create_user(
+            username="OtherUser", password="Other1234"
+        )
+        self.project = Project.objects.create(
+            name="Project", deadline=datetime.today().date()
+        )
+        self.task = Task.objects.create(
+            name="Task",
+            deadline=datetime.today().date(),
+            task_type=TaskType.objects.create(name="Bug"),
+            project=self.project,
+        )
+
+        for i in range(5):
+            Team.objects.create(name=f"team{i}").members.add(self.user)
+
+        team = Team.objects.create(name="ProjectTeam")
+        team.members.add(self.user)
+        self.project.teams.add(team)
+        self.task.assignees.add(self.user)
+
+    def test_team_member_check_is_one_query(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(is_task_team_member(self.user, self.task))
+
+        with self.assertNumQueries(1):
+            self.assertFalse(is_task_team_member(self.other, self.task))
+
+    def test_assignee_check_is_one_query(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(is_task_assignee(self.user, self.task))
+
+        with self.assertNumQueries(1):
+            self.assertFalse(is_task_assignee(self.other, self.task))
+
+    def test_task_without_project(self):
+        self.task.project = None
+        self.task.save()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(is_task_team_member(self.user, self.task))
+
+        self.client.force_login(self.user)
+        response = self.client.get(
+            reverse("task_manager:task-detail", args=[self.task.id])
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context["valid_user"])
+
+    def test_anonymous_user(self):
+        with self.assertNumQueries(0):
+            self.assertFalse(is_task_team_member(AnonymousUser(), self.task))
+            self.assertFalse(is_task_assignee(AnonymousUser(), self.task))
+
+    def test_only_team_members_can_update_task(self):
+        self.client.force_login(self.other)
+        self.client.post(
+            reverse("task_manager:task-detail", args=[self.task.id]),
+            {"is_completed": "on"},
+        )
+
+        self.task.refresh_from_db()
+        self.assertFalse(self.task.is_completed)
@@ -0,0 +1,100 @@
+import os
+import pstats
+import sys
+import tempfile
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+
+from ..profiling import ProfilingMiddleware, StackSampler, make_profiling_token
+
+
+TASK_LIST = reverse_lazy("task_manager:task-list")
+
+
+def busy_loop(seconds: float) -> None:
+    ends = time.perf_counter() + seconds
+    while time.perf_counter() < ends:
+        pass
+
+
+class ProfilingMiddlewareTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(username="MainUser")
+        self.client.force_login(self.user)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def files(self) -> list:
+        return sorted(os.listdir(self.directory.name))
+
+    def test_disabled_without_directory(self):
+        with override_settings(PROFILING_DIR=""):
+            with self.assertRaises(MiddlewareNotUsed):
+                ProfilingMiddleware(lambda request: None)
+
+    def test_keeps_at_least_one_profile(self):
+        with override_settings(
+            PROFILING_DIR=self.directory.name, PROFILING_KEEP=0
+        ):
+            with self.assertRaises(ImproperlyConfigured):
+                ProfilingMiddleware(lambda request: None)
+
+    def test_every_nth_request_is_profiled(self):
+        with override_settings(
+            PROFILING_DIR=self.directory.name, PROFILING_SAMPLE_RATE=2
+        ):
+            for _ in range(4):
+                self.client.get(TASK_LIST)
+
+        files = self.files()
+
+        self.assertEqual(len(files), 4)
+        self.assertTrue(all("task_manager.task-list" in f for f in files))
+
+        stats = pstats.Stats(os.path.join(self.directory.name, files[-1]))
+        self.assertTrue(any(
+            function == "get" and "django/views/generic/list.py" in path
+            for path, line, function in stats.stats
+        ))
+
+    def test_signed_header(self):
+        with override_settings(PROFILING_DIR=self.directory.name):
+            self.client.get(TASK_LIST)
+            self.client.get(TASK_LIST, HTTP_X_PROFILE="forged")
+            self.assertEqual(self.files(), [])
+
+            self.client.get(TASK_LIST, HTTP_X_PROFILE=make_profiling_token())
+            self.assertEqual(len(self.files()), 2)
+
+    def test_old_profiles_are_rotated(self):
+        with override_settings(
+            PROFILING_DIR=self.directory.name,
+            PROFILING_SAMPLE_RATE=1,
+            PROFILING_KEEP=2,
+        ):
+            for _ in range(3):
+                self.client.get(TASK_LIST)
+
+        self.assertEqual(
+            [name.rsplit(".", 1)[1] for name in self.files()],
+            ["collapsed", "prof", "collapsed", "prof"],
+        )
+
+
+class StackSamplerTest(TestCase):
+    def test_collapsed_stacks_start_below_root_frame(self):
+        sampler = StackSampler(sys._getframe(), 0.001)
+
+        sampler.start()
+        busy_loop(0.05)
+        sampler.stop()
+
+        self.assertTrue(sampler.stacks)
+        self.assertIn(
+            "task_manager.tests.test_profiling:busy_loop",
+            sampler.stacks,
+        )
@@ -0,0 +1,152 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import datetime
+from taggit.models import Tag
+
+from ..models import TaskType, Task, Project
+from team_manager.models import Position, Team
+
+
+# Rows on the list pages, compared in pairs. One row and a full page show
+# a query per row, each row has its own related rows. Two pages and many
+# show queries that grow with the data, the page count only runs once
+# there is a second page.
+SIZES = ((1, 5), (6, 100))
+
+# maximum number of queries a page may run, whatever the amount of data
+# including the version query of the conditional GET
+QUERY_BUDGET = {
+    "task_manager:task-list": 5,
+    "task_manager:task-detail": 9,
+    "task_manager:project-list": 5,
+    "task_manager:project-detail": 7,
+}
+
+
+class QueryBudgetTest(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="Developer")
+        self.user = get_user_model().objects.create_user(
+            username="MainUser",
+            password="Main1234",
+            position=self.position,
+        )
+        self.client.force_login(self.user)
+
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.team = Team.objects.create(name="MainTeam", owner=self.user)
+
+        self.project = Project.objects.create(
+            name="MainProject",
+            deadline=datetime.today().date(),
+            owner=self.user,
+        )
+        self.project.teams.add(self.team)
+
+        self.task = Task.objects.create(
+            name="MainTask",
+            deadline=datetime.today().date(),
+            task_type=self.task_type,
+            owner=self.user,
+            project=self.project,
+        )
+
+    def grow(self, size: int) -> None:
+        start = Task.objects.count()
+        if start >= size:
+            return
+
+        task_types = TaskType.objects.bulk_create(
+            TaskType(name=f"type{i}") for i in range(start, size)
+        )
+        workers = get_user_model().objects.bulk_create(
+            get_user_model()(
+                username=f"worker{i}",
+                position=self.position,
+            )
+            for i in range(start, size)
+        )
+        teams = Team.objects.bulk_create(
+            Team(name=f"team{i}", owner=worker)
+            for i, worker in enumerate(workers, start=start)
+        )
+        projects = Project.objects.bulk_create(
+            Project(
+                name=f"project{i}",
+                deadline=datetime.today().date(),
+                owner=worker,
+            )
+            for i, worker in enumerate(workers, start=start)
+        )
+        Task.objects.bulk_create(
+            Task(
+                name=f"task{i}",
+                deadline=datetime.today().date(),
+                task_type=task_type,
+                owner=worker,
+                project=self.project,
+            )
+            for i, (worker, task_type) in enumerate(
+                zip(workers, task_types), start=start
+            )
+        )
+
+        # the user works in many teams but only the newest one is on the
+        # project, so membership checks have to look past all the others
+        self.user.teams.add(*teams)
+        self.project.teams.set([teams[-1]])
+        self.task.assignees.add(*workers)
+        self.task.tags.add(*Tag.objects.bulk_create(
+            Tag(name=f"tag{i}", slug=f"tag{i}")
+            for i in range(start, size)
+        ))
+        for project in projects:
+            project.teams.add(self.team)
+
+    def assert_within_budget(self, name: str, url: str) -> None:
+        for sizes in SIZES:
+            query_counts = []
+
+            for size in sizes:
+                self.grow(size)
+
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+
+                self.assertEqual(response.status_code, 200)
+                query_counts.append(len(queries))
+
+            self.assertEqual(
+                len(set(query_counts)),
+                1,
+                f"{name} query count grows with data: {query_counts} "
+                f"queries for {sizes} rows",
+            )
+            self.assertLessEqual(max(query_counts), QUERY_BUDGET[name])
+
+    def test_task_list_query_budget(self):
+        self.assert_within_budget(
+            "task_manager:task-list",
+            reverse("task_manager:task-list"),
+        )
+
+    def test_task_detail_query_budget(self):
+        self.assert_within_budget(
+            "task_manager:task-detail",
+            reverse("task_manager:task-detail", args=[self.task.id]),
+        )
+
+    def test_project_list_query_budget(self):
+        self.assert_within_budget(
+            "task_manager:project-list",
+            reverse("task_manager:project-list"),
+        )
+
+    def test_project_detail_query_budget(self):
+        self.assert_within_budget(
+            "task_manager:project-detail",
+            reverse("task_manager:project-detail", args=[self.project.id]),
+        )
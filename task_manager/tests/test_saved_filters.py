@@ -0,0 +1,84 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from ..models import TaskType
+from ..saved_filters import TASK_FILTER_COOKIE
+
+
+TASK_LIST = reverse_lazy("task_manager:task-list")
+TASK_FILTER = reverse_lazy("task_manager:task-filter")
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+
+
+class SavedTaskFilterTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(
+            username="MainUser", password="Main1234"
+        )
+        self.client.force_login(self.user)
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.params = {
+            "task_type": str(self.task_type.id),
+            "is_completed": "False",
+        }
+
+    def writes(self, url, params: dict) -> tuple:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+
+        writes = [
+            query["sql"] for query in queries
+            if query["sql"].lstrip().upper().startswith(WRITE_STATEMENTS)
+        ]
+        return response, writes
+
+    def test_filtered_list_requests_do_not_write(self):
+        # the filter used to be saved to the session, one UPDATE of
+        # django_session per filtered request
+        for _ in range(3):
+            response, writes = self.writes(TASK_LIST, self.params)
+            self.assertEqual(writes, [])
+
+    def test_cookie_is_only_set_when_the_filter_changes(self):
+        response = self.client.get(TASK_LIST, self.params)
+        self.assertIn(TASK_FILTER_COOKIE, response.cookies)
+
+        response = self.client.get(TASK_LIST, self.params)
+        self.assertNotIn(TASK_FILTER_COOKIE, response.cookies)
+
+        response = self.client.get(TASK_LIST, {"is_completed": "True"})
+        self.assertIn(TASK_FILTER_COOKIE, response.cookies)
+
+    def test_filter_page_reads_saved_filter(self):
+        self.client.get(TASK_LIST, self.params)
+
+        response = self.client.get(TASK_FILTER)
+
+        self.assertEqual(
+            response.context["task_filter"].initial,
+            {**self.params, "tags": "", "tags_mode": "", "priority": ""},
+        )
+
+    def test_reset_clears_saved_filter(self):
+        self.client.get(TASK_LIST, self.params)
+
+        response = self.client.get(TASK_FILTER, {"reset": "True"})
+
+        self.assertEqual(response.context["task_filter"].initial, {})
+        self.assertEqual(response.cookies[TASK_FILTER_COOKIE].value, "")
+
+        response = self.client.get(TASK_FILTER)
+        self.assertEqual(response.context["task_filter"].initial, {})
+
+    def test_filter_is_not_shared_between_users(self):
+        self.client.get(TASK_LIST, self.params)
+        other = get_user_model().objects.create(username="OtherUser")
+        self.client.force_login(other)
+
+        response = self.client.get(TASK_FILTER)
+
+        self.assertEqual(response.context["task_filter"].initial, {})
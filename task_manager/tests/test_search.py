@@ -0,0 +1,124 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+from datetime import datetime
+
+from ..models import TaskType, Task, Project
+from ..search import search
+
+
+TASK_LIST = reverse_lazy("task_manager:task-list")
+PROJECT_LIST = reverse_lazy("task_manager:project-list")
+
+
+class SearchTest(TestCase):
+    def setUp(self) -> None:
+        self.task_type = TaskType.objects.create(name="Bug")
+
+    def create_task(self, name: str, description: str = "") -> Task:
+        return Task.objects.create(
+            name=name,
+            description=description,
+            deadline=datetime.today().date(),
+            task_type=self.task_type,
+        )
+
+    def names(self, query: str) -> list:
+        return [task.name for task in search(Task.objects.all(), query)]
+
+    def test_search_matches_name_and_description(self):
+        self.create_task("Login page", "Fix the broken redirect")
+        self.create_task("Signup page", "Redirect after signup")
+        self.create_task("Footer", "Update copyright")
+
+        self.assertEqual(
+            sorted(self.names("redirect")),
+            ["Login page", "Signup page"],
+        )
+        self.assertEqual(self.names("foot"), ["Footer"])
+        self.assertEqual(self.names("page redirect signup"), ["Signup page"])
+
+    def test_search_ranks_better_matches_first(self):
+        self.create_task("Cache", "Cache the cache of the cache")
+        self.create_task("Database", "Add a cache in front of it")
+
+        results = search(Task.objects.all(), "cache").order_by("-search_rank")
+
+        self.assertEqual(
+            [task.name for task in results],
+            ["Cache", "Database"],
+        )
+
+    def test_search_index_follows_updates_and_deletes(self):
+        task = self.create_task("Old name")
+
+        task.name = "New name"
+        task.save()
+
+        self.assertEqual(self.names("old"), [])
+        self.assertEqual(self.names("new"), ["New name"])
+
+        task.delete()
+
+        self.assertEqual(self.names("new"), [])
+
+    def test_empty_query_returns_everything(self):
+        self.create_task("First")
+        self.create_task("Second")
+
+        self.assertEqual(len(self.names("  ,, ")), 2)
+
+    @override_settings(
+        SEARCH_BACKEND="task_manager.search.ContainsSearchBackend"
+    )
+    def test_contains_backend(self):
+        self.create_task("Login page", "Fix the broken redirect")
+        self.create_task("Footer")
+
+        self.assertEqual(self.names("direc"), ["Login page"])
+
+
+class SearchViewTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create(
+            username="MainUser", password="Main1234"
+        )
+        self.client.force_login(self.user)
+        task_type = TaskType.objects.create(name="Bug")
+
+        for i in range(7):
+            Task.objects.create(
+                name=f"task{i}",
+                description="deploy " * (i + 1),
+                deadline=datetime.today().date(),
+                task_type=task_type,
+            )
+
+    def test_task_list_pages_through_ranked_results(self):
+        response = self.client.get(TASK_LIST, {"name": "deploy"})
+        first_page = list(response.context["task_list"])
+
+        response = self.client.get(TASK_LIST, {
+            "name": "deploy",
+            "cursor": response.context["page_obj"].next_cursor,
+        })
+        second_page = list(response.context["task_list"])
+
+        ranks = [task.search_rank for task in first_page + second_page]
+
+        self.assertEqual(len(first_page + second_page), 7)
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+
+    def test_project_list_searches_description(self):
+        Project.objects.create(
+            name="Website",
+            description="Marketing landing pages",
+            deadline=datetime.today().date(),
+        )
+
+        response = self.client.get(PROJECT_LIST, {"name": "landing"})
+
+        self.assertEqual(
+            [project.name for project in response.context["project_list"]],
+            ["Website"],
+        )
@@ -0,0 +1,156 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from datetime import datetime
+
+from ..bulk_actions import run_bulk_action
+from ..models import TaskType, Task, Project, TagIndex
+from ..tag_index import (
+    LRUCache,
+    suggestion_cache,
+    rebuild_tag_index,
+    suggest_tags,
+)
+from team_manager.models import Team
+
+
+class TagIndexTest(TestCase):
+    def setUp(self) -> None:
+        suggestion_cache.clear()
+        self.user = get_user_model().objects.create(username="MainUser")
+        team = Team.objects.create(name="Team")
+        team.members.add(self.user)
+        self.project = Project.objects.create(
+            name="Project", deadline=datetime.today().date()
+        )
+        self.project.teams.add(team)
+        task_type = TaskType.objects.create(name="Bug")
+        self.tasks = [
+            Task.objects.create(
+                name=f"task{i}",
+                deadline=datetime.today().date(),
+                task_type=task_type,
+                project=self.project,
+            )
+            for i in range(3)
+        ]
+
+    def counts(self) -> dict:
+        rows = TagIndex.objects.values_list(
+            "name", "task_count", "project_count"
+        )
+        return {
+            name: (task_count, project_count)
+            for name, task_count, project_count in rows
+            if task_count or project_count
+        }
+
+    def assert_rebuild_agrees(self) -> None:
+        counts = self.counts()
+        rebuild_tag_index()
+        self.assertEqual(self.counts(), counts)
+
+    def test_counts_follow_tag_changes(self):
+        self.tasks[0].tags.add("alpha", "beta")
+        self.tasks[1].tags.add("alpha")
+        self.project.tags.add("beta")
+
+        self.assertEqual(
+            self.counts(), {"alpha": (2, 0), "beta": (1, 1)}
+        )
+
+        self.tasks[0].tags.remove("beta")
+        self.tasks[1].tags.clear()
+        self.tasks[0].delete()
+
+        self.assertEqual(self.counts(), {"beta": (0, 1)})
+        self.assert_rebuild_agrees()
+
+    def test_bulk_actions_refresh_counts(self):
+        task_ids = [task.pk for task in self.tasks]
+
+        run_bulk_action(self.user, "add_tags", task_ids, tag_names=["alpha"])
+        self.assertEqual(self.counts(), {"alpha": (3, 0)})
+
+        run_bulk_action(
+            self.user, "remove_tags", task_ids[:1], tag_names=["alpha"]
+        )
+        self.assertEqual(self.counts(), {"alpha": (2, 0)})
+
+        run_bulk_action(self.user, "delete", task_ids[1:2])
+        self.assertEqual(self.counts(), {"alpha": (1, 0)})
+        self.assert_rebuild_agrees()
+
+    def test_suggestions_match_prefix_ignoring_case(self):
+        self.tasks[0].tags.add("Backend", "backlog", "frontend")
+
+        self.assertEqual(
+            sorted(suggest_tags("BAC")), ["Backend", "backlog"]
+        )
+        self.assertEqual(suggest_tags("end"), [])
+
+    def test_suggestions_are_ranked_per_model(self):
+        for task in self.tasks:
+            task.tags.add("bug")
+        self.tasks[0].tags.add("build")
+        self.project.tags.add("build")
+        Project.objects.create(
+            name="Other", deadline=datetime.today().date()
+        ).tags.add("build")
+
+        self.assertEqual(suggest_tags("bu", Task), ["bug", "build"])
+        self.assertEqual(suggest_tags("bu", Project), ["build", "bug"])
+        self.assertEqual(suggest_tags("bu", limit=1), ["bug"])
+
+    def test_suggestions_are_cached(self):
+        self.tasks[0].tags.add("alpha")
+        suggest_tags("al")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(suggest_tags("al"), ["alpha"])
+
+    def test_view(self):
+        self.tasks[0].tags.add("alpha", "alps")
+        self.tasks[1].tags.add("alpha")
+
+        response = self.client.get(
+            reverse(
+                "taggit_autosuggest-list",
+                kwargs={"tagmodel": "task_manager.task"},
+            ),
+            {"q": "al", "limit": "1"},
+        )
+
+        self.assertEqual(
+            response.json(), [{"name": "alpha", "value": "alpha"}]
+        )
+
+    def test_forms_ask_for_their_model(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("task_manager:task-filter"))
+
+        self.assertContains(
+            response,
+            reverse(
+                "tag-suggestions", kwargs={"tagmodel": "task_manager.task"}
+            ),
+        )
+
+
+class LRUCacheTest(TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(
+            (cache.get("a"), cache.get("b"), cache.get("c")), (1, None, 3)
+        )
+
+    def test_expires(self):
+        cache = LRUCache(maxsize=2, ttl=-1)
+        cache.set("a", 1)
+
+        self.assertIsNone(cache.get("a"))
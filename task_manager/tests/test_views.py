@@ -150,6 +150,29 @@ class PrivateTaskViewTest(TestCase):
             "task_manager/task_list.html"
         )
 
+    def test_task_list_marks_own_tasks_without_loading_owners(self):
+        other = get_user_model().objects.create(username="OtherUser")
+
+        for i, owner in enumerate([self.user, other, None]):
+            Task.objects.create(
+                name=f"test{i}",
+                description="long text " * 100,
+                deadline=datetime.today().date(),
+                task_type=self.task_type,
+                owner=owner,
+            )
+
+        response = self.client.get(TASK_LIST)
+        tasks = list(response.context["task_list"])
+
+        self.assertEqual(
+            [task.is_mine for task in tasks],
+            [True, False, False],
+        )
+        self.assertIn("description", tasks[0].get_deferred_fields())
+        self.assertContains(response, "Your task: test0")
+        self.assertNotContains(response, "Your task: test1")
+
     def test_receive_test_by_name(self):
         Task.objects.create(
                 name="test_1",
@@ -263,6 +286,52 @@ class PrivateTaskViewTest(TestCase):
             searched_test.name
         )
 
+    def tagged_tasks(self) -> dict:
+        tasks = {}
+        for name, tags in [
+            ("both", ["backend", "api"]),
+            ("backend", ["backend"]),
+            ("api", ["api", "web"]),
+            ("untagged", []),
+        ]:
+            tasks[name] = Task.objects.create(
+                name=name,
+                deadline=datetime.today().date(),
+                task_type=self.task_type,
+                owner=self.user,
+            )
+            tasks[name].tags.add(*tags)
+        return tasks
+
+    def test_tasks_with_any_tag_are_listed_once(self):
+        tasks = self.tagged_tasks()
+
+        response = self.client.get(TASK_LIST, {"tags": "backend,api,"})
+
+        self.assertEqual(
+            sorted(task.name for task in response.context["task_list"]),
+            ["api", "backend", "both"],
+        )
+        self.assertEqual(response.context["paginator"].count, 3)
+        self.assertNotIn(tasks["untagged"], response.context["task_list"])
+
+    def test_tasks_with_all_tags(self):
+        self.tagged_tasks()
+
+        response = self.client.get(
+            TASK_LIST, {"tags": "backend,api", "tags_mode": "all"}
+        )
+
+        self.assertEqual(
+            [task.name for task in response.context["task_list"]], ["both"]
+        )
+
+        response = self.client.get(
+            TASK_LIST, {"tags": "backend,missing", "tags_mode": "all"}
+        )
+
+        self.assertEqual(list(response.context["task_list"]), [])
+
 
 class PublicProjectViewTest(TestCase):
     def setUp(self) -> None:
@@ -425,6 +494,27 @@ class PrivateProjectViewTest(TestCase):
             project_list
         )
 
+    def test_receive_projects_by_tags(self):
+        self.project.tags.add("web", "mobile")
+        web = Project.objects.create(
+            name="Web",
+            deadline=datetime.today().date(),
+            owner=self.user,
+        )
+        web.tags.add("web")
+
+        response = self.client.get(PROJECT_LIST, {"tags": "web,mobile"})
+
+        self.assertEqual(len(response.context["project_list"]), 2)
+
+        response = self.client.get(
+            PROJECT_LIST, {"tags": "web,mobile", "tags_mode": "all"}
+        )
+
+        self.assertEqual(
+            list(response.context["project_list"]), [self.project]
+        )
+
 
 class ValidDeadlineTest(TestCase):
 
@@ -8,12 +8,17 @@ from .views import (
     TaskDeleteView,
     TaskUpdateView,
     TaskDetailView,
+    TaskExportView,
+    TaskImportView,
+    TaskBulkActionView,
 
     ProjectListView,
     ProjectDeleteView,
     ProjectCreateView,
     ProjectUpdateView,
     ProjectDetailView,
+    ProjectExportView,
+    ProjectAutocompleteView,
 
 )
 
@@ -33,6 +38,21 @@ urlpatterns = [
         TaskCreateView.as_view(),
         name="task-create"
     ),
+    path(
+        "tasks/export/",
+        TaskExportView.as_view(),
+        name="task-export"
+    ),
+    path(
+        "tasks/import/",
+        TaskImportView.as_view(),
+        name="task-import"
+    ),
+    path(
+        "tasks/bulk/",
+        TaskBulkActionView.as_view(),
+        name="task-bulk-action"
+    ),
     path(
         "task/<int:pk>/update/",
         TaskUpdateView.as_view(),
@@ -58,6 +78,11 @@ urlpatterns = [
         ProjectListView.as_view(),
         name="project-list"
     ),
+    path(
+        "projects/export/",
+        ProjectExportView.as_view(),
+        name="project-export"
+    ),
     path(
         "project/create/",
         ProjectCreateView.as_view(),
@@ -83,6 +108,11 @@ urlpatterns = [
         ProjectListView.as_view(),
         name="project-list"
     ),
+    path(
+        "projects/autocomplete/",
+        ProjectAutocompleteView.as_view(),
+        name="project-autocomplete"
+    ),
 ]
 
 app_name = "task_manager"
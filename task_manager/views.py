@@ -1,12 +1,56 @@
 import datetime
+import io
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import (
+    Http404,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render, redirect
 from django.urls import reverse_lazy
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.views import generic
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import (
+    QuerySet,
+    BooleanField,
+    Case,
+    When,
+    Value,
+    OuterRef,
+)
 
+from .autocomplete import AutocompleteView
+from .boards import build_task_board
+from .conditional import (
+    ConditionalGetMixin,
+    fingerprint,
+    board_fingerprint,
+    list_fingerprint,
+)
 from .models import TaskType, Task, Project
+from .pagination import KeysetPaginationMixin
+from .permissions import is_task_team_member, is_task_assignee
+from .saved_filters import (
+    TASK_FILTER_FIELDS,
+    get_saved_task_filter,
+    save_task_filter,
+    clear_task_filter,
+)
+from .exports import EXPORT_FORMATS, export
+from .facets import get_task_facets
+from .imports import TaskImporter
+from .metrics import metrics_allowed, render_metrics
+from .filters import task_filter_params, filter_tasks, filter_projects
+from .search import search_tokens
+from .tag_index import SUGGESTION_MODELS, suggest_tags
+from team_manager.models import Team
 from .form import (
     TaskFilterForm,
     TaskSearchForm,
@@ -14,6 +58,9 @@ from .form import (
     TaskChangeStatusForm,
     ProjectSearchForm,
     ProjectCreateForm,
+    ProjectUpdateForm,
+    TaskImportForm,
+    TaskBulkActionForm,
 )
 
 
@@ -25,17 +72,56 @@ def valid_deadline(deadline: datetime) -> bool:
 
 @login_required()
 def task_filter_view(request):
-    if request.GET.get("reset"):
-        # Remove the session filter data
-        request.session.pop("task_filter", None)
+    reset = request.GET.get("reset")
+    initial = {} if reset else get_saved_task_filter(request)
 
     context = {
         "task_filter": TaskFilterForm(
-            initial=request.session.get("task_filter", {})
+            initial=initial, facets=get_task_facets(initial)
         )
     }
 
-    return render(request, "task_manager/task_filter.html", context=context)
+    response = render(
+        request, "task_manager/task_filter.html", context=context
+    )
+
+    if reset:
+        clear_task_filter(response)
+
+    return response
+
+
+def metrics_view(request):
+    if not settings.METRICS_DIR:
+        raise Http404("Metrics are disabled")
+
+    if not metrics_allowed(request):
+        return HttpResponse(status=403)
+
+    return HttpResponse(
+        render_metrics(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def tag_suggestions_view(request, tagmodel=None):
+    # replaces taggit_autosuggest's list_tags, same parameters and
+    # response, but prefix matches from the tag index, most used first
+    max_suggestions = getattr(
+        settings, "TAGGIT_AUTOSUGGEST_MAX_SUGGESTIONS", 20
+    )
+    try:
+        limit = min(int(request.GET.get("limit", "")), max_suggestions)
+    except ValueError:
+        limit = max_suggestions
+
+    names = suggest_tags(
+        request.GET.get("q", ""), SUGGESTION_MODELS.get(tagmodel), limit
+    )
+
+    return JsonResponse(
+        [{"name": name, "value": name} for name in names], safe=False
+    )
 
 
 class TaskTypeCreateView(LoginRequiredMixin, generic.CreateView):
@@ -46,7 +132,12 @@ class TaskTypeCreateView(LoginRequiredMixin, generic.CreateView):
     success_url = reverse_lazy("task_manager:task-list")
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Task
     paginate_by = 5
 
@@ -60,47 +151,160 @@ class TaskListView(LoginRequiredMixin, generic.ListView):
         })
 
         context["search_form"] = search_form
+        context["bulk_form"] = TaskBulkActionForm(user=self.request.user)
 
         return context
 
+    def get_keyset_fields(self) -> tuple:
+        if search_tokens(self.request.GET.get("name", "")):
+            # best matches first while searching
+            return ("-search_rank",) + self.keyset_fields
+        return self.keyset_fields
+
     def get_queryset(self) -> QuerySet:
+        # only the columns the table renders, description can be large
         queryset = Task.objects.select_related(
             "task_type"
+        ).only(
+            "id",
+            "name",
+            "is_completed",
+            "priority",
+            "deadline",
+            "updated_at",
+            "task_type__name",
+        ).annotate(
+            is_mine=Case(
+                When(owner=self.request.user.pk, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
         )
 
-        name = self.request.GET.get("name", "")
-        task_type = self.request.GET.get("task_type", "")
-        # remove coma ',' that taggit_auttosugest is adding to tags
-        tags = self.request.GET.get("tags", "").strip(",")
-        is_completed = self.request.GET.get("is_completed", "")
+        params = task_filter_params(self.request.GET)
+
+        self.task_filter = {
+            field: params[field] for field in TASK_FILTER_FIELDS
+        }
+        if not any(self.task_filter.values()):
+            self.task_filter = None
+
+        return filter_tasks(queryset, params)
 
-        if task_type or tags or is_completed:
-            self.request.session["task_filter"] = {
-                "task_type": task_type,
-                "tags": tags,
-                "is_completed": is_completed,
-            }
+    def get_version(self) -> dict:
+        return list_fingerprint(self.get_queryset())
 
-        if name:
-            queryset = queryset.filter(name__icontains=name)
+    def get(self, request, *args, **kwargs):
+        # a 304 doesn't render either, the filter is saved on it too
+        response = super().get(request, *args, **kwargs)
 
-        if task_type:
-            queryset = queryset.filter(task_type=task_type)
+        if self.task_filter:
+            save_task_filter(request, response, self.task_filter)
 
-        if tags:
-            # convert string to list of tags
-            queryset = queryset.filter(tags__name__in=tags.split(","))
+        return response
 
-        if is_completed == "True":
-            queryset = queryset.filter(is_completed=True)
 
-        if is_completed == "False":
-            queryset = queryset.filter(is_completed=False)
+class TaskBulkActionView(LoginRequiredMixin, generic.View):
+    def post(self, request, *args, **kwargs):
+        form = TaskBulkActionForm(user=request.user, data=request.POST)
 
-        return queryset
+        if form.is_valid():
+            done, skipped = form.save()
+            messages.success(request, f"Updated {done} tasks.")
+            if skipped:
+                messages.warning(
+                    request,
+                    f"Skipped {skipped} tasks outside your teams' projects.",
+                )
+        else:
+            for errors in form.errors.values():
+                messages.error(request, " ".join(errors))
+
+        # back to the page the tasks were selected on
+        next_url = request.POST.get("next", "")
+        if not url_has_allowed_host_and_scheme(
+            next_url,
+            allowed_hosts={request.get_host()},
+            require_https=request.is_secure(),
+        ):
+            next_url = reverse_lazy("task_manager:task-list")
+
+        return redirect(next_url)
+
+
+class ExportView(LoginRequiredMixin, generic.View):
+    filename = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # fail on import rather than with a 500 on the first download
+        if not cls.filename or cls.get_queryset is ExportView.get_queryset:
+            raise ImproperlyConfigured(
+                f"{cls.__name__} must set filename and define get_queryset()"
+            )
+
+    def get_queryset(self) -> QuerySet:
+        raise NotImplementedError
 
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("format", "csv")
 
-class TaskDetailView(LoginRequiredMixin, generic.DetailView):
+        if export_format not in EXPORT_FORMATS:
+            raise Http404(f"Unknown export format {export_format!r}")
+
+        response = StreamingHttpResponse(
+            export(self.get_queryset(), export_format),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.filename}.{export_format}"'
+        )
+
+        return response
+
+
+class TaskExportView(ExportView):
+    filename = "tasks"
+
+    def get_queryset(self) -> QuerySet:
+        return filter_tasks(Task.objects.all(), self.request.GET)
+
+
+class TaskImportView(LoginRequiredMixin, generic.FormView):
+    form_class = TaskImportForm
+    template_name = "task_manager/task_import.html"
+
+    def form_valid(self, form):
+        importer = TaskImporter(
+            default_owner=self.request.user,
+            dry_run=form.cleaned_data["dry_run"],
+        )
+        # utf-8-sig drops the byte order mark spreadsheets like to add
+        file = io.TextIOWrapper(
+            form.cleaned_data["file"], encoding="utf-8-sig", newline=""
+        )
+
+        try:
+            # the file is decoded batch by batch, one transaction keeps a
+            # bad byte late in it from leaving the earlier batches imported
+            with transaction.atomic():
+                result = importer.run(file, form.cleaned_data["format"])
+        except UnicodeDecodeError:
+            form.add_error("file", "The file must be UTF-8 encoded.")
+            return self.form_invalid(form)
+
+        return self.render_to_response(self.get_context_data(
+            form=TaskImportForm(),
+            result=result,
+            dry_run=form.cleaned_data["dry_run"],
+        ))
+
+
+class TaskDetailView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    generic.DetailView
+):
     model = Task
     queryset = Task.objects.prefetch_related(
         "assignees__position", "tags"
@@ -115,10 +319,12 @@ class TaskDetailView(LoginRequiredMixin, generic.DetailView):
             user=self.request.user
         )
 
-        for user_team in self.request.user.teams.all():
-            if user_team in self.object.project.teams.all():
-                context["valid_user"] = True
-                break
+        context["valid_user"] = is_task_team_member(
+            self.request.user, self.object
+        )
+        context["is_assignee"] = is_task_assignee(
+            self.request.user, self.object
+        )
 
         context["is_past_deadline"] = valid_deadline(
             deadline=self.object.deadline
@@ -126,6 +332,22 @@ class TaskDetailView(LoginRequiredMixin, generic.DetailView):
 
         return context
 
+    def get_version(self) -> dict | None:
+        # teams are listed to users outside them
+        return Task.objects.filter(pk=self.kwargs["pk"]).values(
+            "updated_at",
+            "project__updated_at",
+            "owner__updated_at",
+            "task_type__name",
+        ).annotate(
+            **fingerprint("assignees", get_user_model().objects.filter(
+                tasks=OuterRef("pk")
+            )),
+            **fingerprint("teams", Team.objects.filter(
+                projects=OuterRef("project")
+            )),
+        ).first()
+
     def post(self, *args, **kwargs):
         task = self.get_object()
 
@@ -135,7 +357,10 @@ class TaskDetailView(LoginRequiredMixin, generic.DetailView):
             data=self.request.POST
         )
 
-        if update_task.is_valid():
+        if (
+            is_task_team_member(self.request.user, task)
+            and update_task.is_valid()
+        ):
             update_task.save()
 
         return redirect("task_manager:task-detail", pk=task.id)
@@ -178,43 +403,62 @@ class TaskDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task_manager:task-list")
 
 
-class ProjectListView(LoginRequiredMixin, generic.ListView):
+class ProjectListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Project
     paginate_by = 5
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        name = self.request.GET.get("name", "")
-
-        search_form = ProjectSearchForm(initial={"name": name})
+        search_form = ProjectSearchForm(initial={
+            field: self.request.GET.get(field, "")
+            for field in ("name", "tags", "tags_mode")
+        })
 
         context["search_form"] = search_form
 
         return context
 
+    def get_keyset_fields(self) -> tuple:
+        if search_tokens(self.request.GET.get("name", "")):
+            # best matches first while searching
+            return ("-search_rank",) + self.keyset_fields
+        return self.keyset_fields
+
     def get_queryset(self) -> QuerySet:
-        queryset = Project.objects.all()
-        name = self.request.GET.get("name", "")
-        team_projects = self.request.GET.get("team_projects", "")
+        return filter_projects(Project.objects.all(), self.request.GET)
 
-        if name:
-            queryset = queryset.filter(name__icontains=name)
+    def get_version(self) -> dict:
+        return list_fingerprint(self.get_queryset())
 
-        if team_projects:
-            queryset = queryset.filter(teams=team_projects)
 
-        return queryset
+class ProjectExportView(ExportView):
+    filename = "projects"
+
+    def get_queryset(self) -> QuerySet:
+        return filter_projects(Project.objects.all(), self.request.GET)
 
 
-class ProjectDetailView(LoginRequiredMixin, generic.DetailView):
+class ProjectDetailView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    generic.DetailView
+):
     model = Project
     queryset = Project.objects.prefetch_related(
-        "teams", "tags", "tasks"
+        "tags"
     ).select_related("owner")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        context["task_board"] = build_task_board(
+            self.request, self.object.tasks.all()
+        )
 
         context["is_past_deadline"] = valid_deadline(
             deadline=self.object.deadline
@@ -222,6 +466,13 @@ class ProjectDetailView(LoginRequiredMixin, generic.DetailView):
 
         return context
 
+    def get_version(self) -> dict | None:
+        return Project.objects.filter(pk=self.kwargs["pk"]).values(
+            "updated_at", "owner__updated_at"
+        ).annotate(
+            **board_fingerprint(Task.objects.filter(project=OuterRef("pk")))
+        ).first()
+
 
 class ProjectCreateView(LoginRequiredMixin, generic.CreateView):
     model = Project
@@ -236,7 +487,7 @@ class ProjectCreateView(LoginRequiredMixin, generic.CreateView):
 
 class ProjectUpdateView(LoginRequiredMixin, generic.UpdateView):
     model = Project
-    fields = "__all__"
+    form_class = ProjectUpdateForm
 
     def get_success_url(self):
         return reverse_lazy(
@@ -248,3 +499,7 @@ class ProjectUpdateView(LoginRequiredMixin, generic.UpdateView):
 class ProjectDeleteView(LoginRequiredMixin, generic.DeleteView):
     model = Project
     success_url = reverse_lazy("task_manager:project-list")
+
+
+class ProjectAutocompleteView(AutocompleteView):
+    queryset = Project.objects.all()
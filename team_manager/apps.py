@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TeamManagerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'team_manager'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,48 @@
+from django.db import transaction
+from django.db.models import F, QuerySet
+
+from .models import DashboardCounter, Worker, Team
+from task_manager.models import Task, Project
+
+
+# Counters shown on the index page. They are kept up to date by the
+# handlers in signals.py. bulk_create(), QuerySet.update() and raw SQL
+# don't send signals, so code that changes rows that way must call
+# rebuild_counters() afterwards.
+def counter_querysets() -> dict[str, QuerySet]:
+    return {
+        "completed_projects": Project.objects.filter(is_completed=True),
+        "completed_tasks": Task.objects.filter(is_completed=True),
+        "teams": Team.objects.all(),
+        "workers": Worker.objects.all(),
+    }
+
+
+def get_counters() -> dict[str, int]:
+    counters = dict(DashboardCounter.objects.values_list("name", "value"))
+
+    if counters.keys() != counter_querysets().keys():
+        return rebuild_counters()
+
+    return counters
+
+
+def refresh_counter(name: str) -> int:
+    value = counter_querysets()[name].count()
+    DashboardCounter.objects.update_or_create(
+        name=name, defaults={"value": value}
+    )
+    return value
+
+
+def rebuild_counters() -> dict[str, int]:
+    with transaction.atomic():
+        return {name: refresh_counter(name) for name in counter_querysets()}
+
+
+def adjust_counter(name: str, delta: int) -> None:
+    # a single UPDATE, so concurrent requests can't lose increments
+    if delta:
+        DashboardCounter.objects.filter(name=name).update(
+            value=F("value") + delta
+        )
@@ -1,8 +1,11 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth import get_user_model
+from django.db import transaction
 
 from .models import Worker, Team
+from task_manager.autocomplete import AutocompleteSelectMultiple
+from task_manager.m2m import sync_m2m
 from task_manager.models import Project
 
 
@@ -59,12 +62,12 @@ class TeamCreationForm(forms.ModelForm):
     projects = forms.ModelMultipleChoiceField(
         queryset=Project.objects.all(),
         required=False,
-        widget=forms.CheckboxSelectMultiple()
+        widget=AutocompleteSelectMultiple("task_manager:project-autocomplete")
     )
     members = forms.ModelMultipleChoiceField(
         queryset=get_user_model().objects.all(),
         required=False,
-        widget=forms.CheckboxSelectMultiple()
+        widget=AutocompleteSelectMultiple("team_manager:worker-autocomplete")
     )
 
     class Meta:
@@ -74,6 +77,38 @@ class TeamCreationForm(forms.ModelForm):
             "owner": forms.HiddenInput()
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if self.instance.pk:
+            self.initial.setdefault("projects", list(
+                self.instance.projects.values_list("pk", flat=True)
+            ))
+
+    def _save_m2m(self):
+        sync_m2m(self.instance.members, self.cleaned_data["members"])
+        sync_m2m(self.instance.projects, self.cleaned_data["projects"])
+
+    def save(self, commit=True):
+        team = super().save(commit=False)
+
+        if commit:
+            changed_fields = [
+                field for field in self.changed_data
+                if field not in ("members", "projects")
+            ]
+
+            with transaction.atomic():
+                if team._state.adding:
+                    team.save()
+                elif changed_fields:
+                    team.save(
+                        update_fields=changed_fields + ["updated_at"]
+                    )
+                self._save_m2m()
+
+        return team
+
 
 class TeamJoinLeaveForm(forms.ModelForm):
     class Meta:
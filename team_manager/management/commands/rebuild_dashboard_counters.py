@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from team_manager.counters import rebuild_counters
+
+
+class Command(BaseCommand):
+    help = "Recount the index page counters from the database"
+
+    def handle(self, *args, **options):
+        for name, value in rebuild_counters().items():
+            self.stdout.write(f"{name}: {value}")
@@ -1,3 +1,4 @@
+from django.core import serializers
 from django.core.management import call_command
 from django.db import migrations
 
@@ -5,7 +6,14 @@ from it_company_task_manager.settings import TESTING
 
 
 def load_data(apps, schema_editor):
-    call_command("loaddata", "project_data.json")
+    # the fixture matches the tables as of this migration, deserialize it
+    # with the historical models so columns added later don't break it
+    current_apps = serializers.python.apps
+    serializers.python.apps = apps
+    try:
+        call_command("loaddata", "project_data.json")
+    finally:
+        serializers.python.apps = current_apps
 
 
 def reverse_load_data(apps, schema_editor):
@@ -13,8 +21,11 @@ def reverse_load_data(apps, schema_editor):
 
 
 class Migration(migrations.Migration):
+    # the fixture has tasks and projects too. Applied databases must have
+    # these already, don't depend on anything newer
     dependencies = [
         ("team_manager", "0001_initial"),
+        ("task_manager", "0003_alter_task_project"),
     ]
     if not TESTING:
         # do not load fixture if we are running test
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.4 on 2026-10-18 18:20
+
+from django.db import migrations, models
+
+
+def populate_counters(apps, schema_editor):
+    DashboardCounter = apps.get_model("team_manager", "DashboardCounter")
+    Worker = apps.get_model("team_manager", "Worker")
+    Team = apps.get_model("team_manager", "Team")
+    Task = apps.get_model("task_manager", "Task")
+    Project = apps.get_model("task_manager", "Project")
+
+    counters = {
+        "completed_projects": Project.objects.filter(is_completed=True),
+        "completed_tasks": Task.objects.filter(is_completed=True),
+        "teams": Team.objects.all(),
+        "workers": Worker.objects.all(),
+    }
+
+    DashboardCounter.objects.bulk_create(
+        DashboardCounter(name=name, value=queryset.count())
+        for name, queryset in counters.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("team_manager", "0002_auto_load__fixture_data_20230914_1915"),
+        ("task_manager", "0005_task_list_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DashboardCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=63, unique=True)),
+                ("value", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.4 on 2026-10-18 19:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("team_manager", "0003_dashboard_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="team",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.4 on 2026-10-18 19:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("team_manager", "0004_team_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="worker",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
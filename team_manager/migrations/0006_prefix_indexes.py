@@ -0,0 +1,36 @@
+from django.db import migrations
+
+from task_manager.autocomplete import (
+    install_autocomplete_index,
+    uninstall_autocomplete_index,
+)
+
+
+PREFIX_INDEXES = [
+    ("Worker", "username"),
+    ("Team", "name"),
+]
+
+
+def create_prefix_indexes(apps, schema_editor):
+    for model_name, column in PREFIX_INDEXES:
+        model = apps.get_model("team_manager", model_name)
+        install_autocomplete_index(schema_editor, model._meta.db_table, column)
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    for model_name, column in PREFIX_INDEXES:
+        model = apps.get_model("team_manager", model_name)
+        uninstall_autocomplete_index(
+            schema_editor, model._meta.db_table, column
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("team_manager", "0005_worker_updated_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -19,6 +19,9 @@ class Worker(AbstractUser):
         related_name="workers",
         null=True
     )
+    # bumped with the teams and tasks the worker is added to or removed
+    # from, see task_manager/signals.py
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "worker"
@@ -41,6 +44,7 @@ class Team(models.Model):
         on_delete=models.CASCADE,
         null=True,
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "team",
@@ -48,3 +52,11 @@ class Team(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class DashboardCounter(models.Model):
+    name = models.CharField(max_length=63, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
@@ -0,0 +1,79 @@
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+
+from .counters import adjust_counter, refresh_counter
+from .models import Worker, Team
+from task_manager.models import Task, Project
+
+
+COMPLETED_COUNTERS = {
+    Project: "completed_projects",
+    Task: "completed_tasks",
+}
+
+ROW_COUNTERS = {
+    Team: "teams",
+    Worker: "workers",
+}
+
+
+@receiver(post_init, sender=Project)
+@receiver(post_init, sender=Task)
+def remember_completed(sender, instance, **kwargs) -> None:
+    # deferred fields are left alone, reading them would run a query
+    instance._counted_is_completed = instance.__dict__.get("is_completed")
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Task)
+def count_completed_on_save(
+    sender, instance, created, raw, update_fields, **kwargs
+) -> None:
+    # raw saves come from loaddata, the fixture is loaded before the
+    # counters table exists
+    if raw:
+        return
+    if update_fields is not None and "is_completed" not in update_fields:
+        return
+
+    is_completed = instance.__dict__.get("is_completed")
+    if is_completed is None:
+        # deferred and never loaded, so it wasn't saved either
+        return
+
+    name = COMPLETED_COUNTERS[sender]
+    was_completed = (
+        False if created
+        else getattr(instance, "_counted_is_completed", None)
+    )
+
+    if was_completed is None:
+        refresh_counter(name)
+    else:
+        adjust_counter(name, int(is_completed) - int(was_completed))
+
+    instance._counted_is_completed = is_completed
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Task)
+def count_completed_on_delete(sender, instance, **kwargs) -> None:
+    is_completed = instance.__dict__.get("is_completed")
+
+    if is_completed is None:
+        refresh_counter(COMPLETED_COUNTERS[sender])
+    elif is_completed:
+        adjust_counter(COMPLETED_COUNTERS[sender], -1)
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Worker)
+def count_created(sender, instance, created, raw, **kwargs) -> None:
+    if created and not raw:
+        adjust_counter(ROW_COUNTERS[sender], 1)
+
+
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=Worker)
+def count_deleted(sender, instance, **kwargs) -> None:
+    adjust_counter(ROW_COUNTERS[sender], -1)
@@ -0,0 +1,126 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import datetime
+
+from ..counters import get_counters
+from ..models import DashboardCounter, Position, Team
+from task_manager.models import TaskType, Task, Project
+
+
+INDEX_URL = reverse("team_manager:index")
+
+
+class DashboardCounterTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="MainUser", password="Main1234"
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+
+    def create_task(self, name: str, **kwargs) -> Task:
+        return Task.objects.create(
+            name=name,
+            deadline=datetime.today().date(),
+            task_type=self.task_type,
+            **kwargs,
+        )
+
+    def test_counters_follow_saves_and_deletes(self):
+        done = self.create_task("done", is_completed=True)
+        todo = self.create_task("todo")
+        team = Team.objects.create(name="team", owner=self.user)
+        Project.objects.create(
+            name="project", deadline=datetime.today().date(),
+            is_completed=True,
+        )
+
+        self.assertEqual(get_counters(), {
+            "completed_projects": 1,
+            "completed_tasks": 1,
+            "teams": 1,
+            "workers": 1,
+        })
+
+        todo.is_completed = True
+        todo.save()
+        done.is_completed = False
+        done.save()
+        done.save()
+
+        self.assertEqual(get_counters()["completed_tasks"], 1)
+
+        todo.delete()
+        team.delete()
+
+        self.assertEqual(get_counters()["completed_tasks"], 0)
+        self.assertEqual(get_counters()["teams"], 0)
+
+    def test_cascade_deletes_are_counted(self):
+        position = Position.objects.create(name="Developer")
+        worker = get_user_model().objects.create(
+            username="worker", position=position
+        )
+        self.create_task("done", is_completed=True, owner=worker)
+        Team.objects.create(name="team", owner=worker)
+
+        position.delete()
+
+        self.assertEqual(get_counters(), {
+            "completed_projects": 0,
+            "completed_tasks": 0,
+            "teams": 0,
+            "workers": 1,
+        })
+
+    def test_deferred_and_partial_saves(self):
+        self.create_task("task")
+
+        task = Task.objects.only("name").get()
+        task.name = "renamed"
+        task.save()
+
+        task = Task.objects.get()
+        task.is_completed = True
+        task.save(update_fields=["name"])
+
+        self.assertEqual(get_counters()["completed_tasks"], 0)
+
+        task.save(update_fields=["is_completed"])
+
+        self.assertEqual(get_counters()["completed_tasks"], 1)
+
+    def test_rebuild_command_fixes_bulk_changes(self):
+        self.create_task("task")
+        Task.objects.update(is_completed=True)
+
+        self.assertEqual(get_counters()["completed_tasks"], 0)
+
+        out = StringIO()
+        call_command("rebuild_dashboard_counters", stdout=out)
+
+        self.assertIn("completed_tasks: 1", out.getvalue())
+        self.assertEqual(get_counters()["completed_tasks"], 1)
+
+    def test_missing_counters_are_rebuilt(self):
+        self.create_task("task", is_completed=True)
+        DashboardCounter.objects.all().delete()
+
+        self.assertEqual(get_counters()["completed_tasks"], 1)
+        self.assertEqual(DashboardCounter.objects.count(), 4)
+
+    def test_index_runs_no_aggregate_queries(self):
+        self.create_task("task", is_completed=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(INDEX_URL)
+
+        self.assertEqual(response.context["num_completed_tasks"], 1)
+        self.assertEqual(response.context["num_workers"], 1)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("COUNT(", queries[0]["sql"])
@@ -0,0 +1,140 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import datetime
+
+from ..models import Position, Team
+from task_manager.models import TaskType, Task, Project
+
+
+# Rows on the list pages, compared in pairs. One row and a full page show
+# a query per row, each row has its own related rows. Two pages and many
+# show queries that grow with the data, the page count only runs once
+# there is a second page.
+SIZES = ((1, 5), (6, 100))
+
+# maximum number of queries a page may run, whatever the amount of data
+# including the version query of the conditional GET
+QUERY_BUDGET = {
+    "team_manager:index": 3,
+    "team_manager:worker-list": 5,
+    "team_manager:worker-detail": 6,
+    "team_manager:position-list": 4,
+    "team_manager:team-list": 5,
+    "team_manager:team-detail": 7,
+}
+
+
+class QueryBudgetTest(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="Developer")
+        self.user = get_user_model().objects.create_user(
+            username="MainUser",
+            password="Main1234",
+            position=self.position,
+        )
+        self.client.force_login(self.user)
+
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.team = Team.objects.create(name="MainTeam", owner=self.user)
+        self.team.members.add(self.user)
+
+        self.project = Project.objects.create(
+            name="MainProject",
+            deadline=datetime.today().date(),
+            owner=self.user,
+        )
+        self.project.teams.add(self.team)
+
+    def grow(self, size: int) -> None:
+        start = Team.objects.count()
+        if start >= size:
+            return
+
+        positions = Position.objects.bulk_create(
+            Position(name=f"position{i}") for i in range(start, size)
+        )
+        workers = get_user_model().objects.bulk_create(
+            get_user_model()(username=f"worker{i}", position=position)
+            for i, position in enumerate(positions, start=start)
+        )
+        teams = Team.objects.bulk_create(
+            Team(name=f"team{i}", owner=worker)
+            for i, worker in enumerate(workers, start=start)
+        )
+        tasks = Task.objects.bulk_create(
+            Task(
+                name=f"task{i}",
+                deadline=datetime.today().date(),
+                task_type=self.task_type,
+                owner=worker,
+                project=self.project,
+                is_completed=bool(i % 2),
+            )
+            for i, worker in enumerate(workers, start=start)
+        )
+
+        self.position.workers.add(*workers)
+        self.team.members.add(*workers)
+        self.project.teams.add(*teams)
+        self.user.teams.add(*teams)
+        self.user.tasks.add(*tasks)
+
+    def assert_within_budget(self, name: str, url: str) -> None:
+        for sizes in SIZES:
+            query_counts = []
+
+            for size in sizes:
+                self.grow(size)
+
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+
+                self.assertEqual(response.status_code, 200)
+                query_counts.append(len(queries))
+
+            self.assertEqual(
+                len(set(query_counts)),
+                1,
+                f"{name} query count grows with data: {query_counts} "
+                f"queries for {sizes} rows",
+            )
+            self.assertLessEqual(max(query_counts), QUERY_BUDGET[name])
+
+    def test_index_query_budget(self):
+        self.assert_within_budget(
+            "team_manager:index",
+            reverse("team_manager:index"),
+        )
+
+    def test_worker_list_query_budget(self):
+        self.assert_within_budget(
+            "team_manager:worker-list",
+            reverse("team_manager:worker-list"),
+        )
+
+    def test_worker_detail_query_budget(self):
+        self.assert_within_budget(
+            "team_manager:worker-detail",
+            reverse("team_manager:worker-detail", args=[self.user.id]),
+        )
+
+    def test_position_list_query_budget(self):
+        self.assert_within_budget(
+            "team_manager:position-list",
+            reverse("team_manager:position-list"),
+        )
+
+    def test_team_list_query_budget(self):
+        self.assert_within_budget(
+            "team_manager:team-list",
+            reverse("team_manager:team-list"),
+        )
+
+    def test_team_detail_query_budget(self):
+        self.assert_within_budget(
+            "team_manager:team-detail",
+            reverse("team_manager:team-detail", args=[self.team.id]),
+        )
@@ -0,0 +1,106 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from datetime import datetime
+
+from ..form import TeamCreationForm
+from ..models import Team
+from task_manager.models import Project
+
+
+class TeamWriteTest(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="MainUser", password="Main1234"
+        )
+        self.client.force_login(self.user)
+        self.workers = [
+            get_user_model().objects.create(username=f"worker{i}")
+            for i in range(3)
+        ]
+        self.projects = [
+            Project.objects.create(
+                name=f"project{i}", deadline=datetime.today().date()
+            )
+            for i in range(3)
+        ]
+        self.team = Team.objects.create(name="Team", owner=self.user)
+        self.team.members.add(*self.workers[:2])
+        self.team.projects.add(*self.projects[:2])
+
+    def form(self, **changes) -> TeamCreationForm:
+        data = {
+            "name": "Team",
+            "description": "",
+            "owner": self.user.id,
+            "members": [worker.id for worker in self.workers[:2]],
+            "projects": [project.id for project in self.projects[:2]],
+        }
+        data.update(changes)
+
+        team = Team.objects.get(pk=self.team.pk)
+        form = TeamCreationForm(instance=team, data=data)
+        self.assertTrue(form.is_valid(), form.errors)
+        return form
+
+    def test_update_without_changes_only_reads(self):
+        form = self.form()
+
+        self.assertEqual(form.changed_data, [])
+
+        # SAVEPOINT, SELECT members, SELECT projects, RELEASE SAVEPOINT
+        with self.assertNumQueries(4):
+            form.save()
+
+    def test_update_writes_only_the_delta(self):
+        form = self.form(
+            name="Renamed",
+            members=[self.workers[0].id, self.workers[2].id],
+            projects=[project.id for project in self.projects],
+        )
+
+        # SAVEPOINT, UPDATE team, SELECT members, DELETE, SELECT existing,
+        # INSERT, SELECT projects, SELECT existing, INSERT, an UPDATE of the
+        # team and of the other side after each write, RELEASE SAVEPOINT
+        with self.assertNumQueries(16):
+            form.save()
+
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.name, "Renamed")
+        self.assertEqual(
+            sorted(self.team.members.values_list("username", flat=True)),
+            ["worker0", "worker2"],
+        )
+        self.assertEqual(self.team.projects.count(), 3)
+
+    def test_update_form_shows_current_projects(self):
+        form = TeamCreationForm(instance=self.team)
+
+        self.assertIn("project1", str(form["projects"]))
+        self.assertNotIn("project2", str(form["projects"]))
+
+    def test_invalid_update_does_not_touch_projects(self):
+        self.client.post(
+            reverse("team_manager:team-update", args=[self.team.id]),
+            {"projects": [self.projects[2].id]},
+        )
+
+        self.assertEqual(self.team.projects.count(), 2)
+
+    def test_join_and_leave(self):
+        url = reverse("team_manager:team-detail", args=[self.team.id])
+
+        # session, user, team, SAVEPOINT, SELECT existing, INSERT, UPDATE
+        # team and worker, RELEASE SAVEPOINT
+        with self.assertNumQueries(9):
+            self.client.post(url, {"join": self.workers[2].id})
+
+        # session, user, team, SAVEPOINT, DELETE, UPDATE team and worker,
+        # RELEASE SAVEPOINT
+        with self.assertNumQueries(8):
+            self.client.post(url, {"leave": self.workers[0].id})
+
+        self.assertEqual(
+            sorted(self.team.members.values_list("username", flat=True)),
+            ["worker1", "worker2"],
+        )
@@ -49,6 +49,17 @@ class PrivatePositionTest(TestCase):
         )
         self.assertTemplateUsed(response, "team_manager/position_list.html")
 
+    def test_positions_are_listed_by_name(self):
+        for name in ["zeta", "alpha", "mid"]:
+            Position.objects.create(name=name)
+
+        response = self.client.get(POSITION_LIST)
+
+        self.assertEqual(
+            [position.name for position in response.context["position_list"]],
+            ["alpha", "mid", "zeta"],
+        )
+
     def test_receive_positions_by_search_bar(self):
         Position.objects.create(name="Position1")
         Position.objects.create(name="Position2")
@@ -384,6 +395,45 @@ class PrivateTeamTest(TestCase):
             project1.name
         )
 
+    def test_team_list_counts_are_not_narrowed_by_filters(self):
+        other_member = get_user_model().objects.create(
+            username="other",
+            password="other1234",
+            position=self.position
+        )
+        self.team.members.add(self.user, other_member)
+
+        for i in range(3):
+            Project.objects.create(
+                name=f"project{i}",
+                owner=self.user,
+                deadline=datetime.today().date()
+            ).teams.add(self.team)
+
+        response = self.client.get(TEAM_LIST, data={
+            "members": self.user.id
+        })
+
+        team = response.context["team_list"][0]
+        self.assertEqual(team.num_members, 2)
+        self.assertEqual(team.num_projects, 3)
+
+    def test_position_list_counts_workers(self):
+        Position.objects.create(name="empty")
+        get_user_model().objects.create(
+            username="other",
+            password="other1234",
+            position=self.position
+        )
+
+        response = self.client.get(POSITION_LIST)
+
+        counts = {
+            position.name: position.num_workers
+            for position in response.context["position_list"]
+        }
+        self.assertEqual(counts, {"empty": 0, "position": 2})
+
     def test_view_own_team_page_with_update_delete_actions(self):
         url = reverse("team_manager:team-detail", args=[self.team.id])
 
@@ -14,7 +14,11 @@ from .views import (
     TeamDetailView,
     TeamCreateView,
     TeamUpdateView,
-    TeamDeleteView
+    TeamDeleteView,
+    TeamAutocompleteView,
+
+    WorkerAutocompleteView,
+    CoworkerAutocompleteView,
 )
 
 urlpatterns = [
@@ -74,6 +78,21 @@ urlpatterns = [
         TeamDeleteView.as_view(),
         name="team-delete"
     ),
+    path(
+        "workers/autocomplete/",
+        WorkerAutocompleteView.as_view(),
+        name="worker-autocomplete"
+    ),
+    path(
+        "workers/autocomplete/coworkers/",
+        CoworkerAutocompleteView.as_view(),
+        name="coworker-autocomplete"
+    ),
+    path(
+        "teams/autocomplete/",
+        TeamAutocompleteView.as_view(),
+        name="team-autocomplete"
+    ),
 
 ]
 
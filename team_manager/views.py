@@ -3,10 +3,22 @@ from django.urls import reverse_lazy
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import generic
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import QuerySet, Count, Max, Sum, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
+from .counters import get_counters
 from .models import Worker, Position, Team
+from task_manager.autocomplete import AutocompleteView
+from task_manager.boards import build_task_board
+from task_manager.conditional import (
+    ConditionalGetMixin,
+    fingerprint,
+    board_fingerprint,
+    list_fingerprint,
+)
 from task_manager.models import Task, Project
+from task_manager.pagination import KeysetPaginationMixin
 
 from .form import (
     WorkerSearchForm,
@@ -18,25 +30,41 @@ from .form import (
 )
 
 
+def count_subquery(through) -> Coalesce:
+    # counting in a correlated subquery keeps the outer query free of
+    # joins, so the member and project filters below can't skew the counts
+    return Coalesce(
+        Subquery(
+            through.objects.filter(
+                team=OuterRef("pk")
+            ).values("team").annotate(count=Count("*")).values("count")
+        ),
+        0,
+    )
+
+
 def index(request):
-    num_completed_projects = Project.objects.filter(is_completed=True).count()
-    num_completed_tasks = Task.objects.filter(is_completed=True).count()
-    num_teams = Team.objects.count()
-    num_workers = Worker.objects.count()
+    counters = get_counters()
 
     context = {
-        "num_completed_projects": num_completed_projects,
-        "num_completed_tasks": num_completed_tasks,
-        "num_teams": num_teams,
-        "num_workers": num_workers,
+        "num_completed_projects": counters["completed_projects"],
+        "num_completed_tasks": counters["completed_tasks"],
+        "num_teams": counters["teams"],
+        "num_workers": counters["workers"],
     }
 
     return render(request, "index.html", context=context)
 
 
-class WorkerListView(LoginRequiredMixin, generic.ListView):
+class WorkerListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView
+):
     model = Worker
     paginate_by = 5
+    keyset_fields = ("username", "id")
 
     def get_context_data(self, *, object_list=None, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
@@ -63,12 +91,32 @@ class WorkerListView(LoginRequiredMixin, generic.ListView):
 
         return queryset
 
+    def get_version(self) -> dict:
+        return list_fingerprint(self.get_queryset())
 
-class WorkerDetailView(LoginRequiredMixin, generic.DetailView):
+
+class WorkerDetailView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    generic.DetailView
+):
     model = Worker
-    queryset = Worker.objects.prefetch_related(
-        "tasks", "tasks__owner"
-    )
+    queryset = Worker.objects.select_related("position")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["task_board"] = build_task_board(
+            self.request, self.object.tasks.all()
+        )
+
+        return context
+
+    def get_version(self) -> dict | None:
+        return Worker.objects.filter(pk=self.kwargs["pk"]).values(
+            "updated_at", "position__name"
+        ).annotate(
+            **board_fingerprint(Task.objects.filter(assignees=OuterRef("pk")))
+        ).first()
 
 
 class WorkerCreateView(LoginRequiredMixin, generic.CreateView):
@@ -117,7 +165,10 @@ class PositionListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self) -> QuerySet:
-        queryset = Position.objects.prefetch_related("workers")
+        # Meta.ordering is dropped from GROUP BY queries
+        queryset = Position.objects.annotate(
+            num_workers=Count("workers")
+        ).order_by("name")
         name = self.request.GET.get("name")
 
         if name:
@@ -125,7 +176,11 @@ class PositionListView(LoginRequiredMixin, generic.ListView):
         return queryset
 
 
-class TeamListView(LoginRequiredMixin, generic.ListView):
+class TeamListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    generic.ListView
+):
     model = Team
     paginate_by = 5
 
@@ -142,8 +197,10 @@ class TeamListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self) -> QuerySet:
-        queryset = Team.objects.prefetch_related(
-            "members")
+        queryset = Team.objects.annotate(
+            num_projects=count_subquery(Project.teams.through),
+            num_members=count_subquery(Team.members.through),
+        )
         name = self.request.GET.get("name", "")
         worker = self.request.GET.get("members", "")
         project_id = self.request.GET.get("project", "")
@@ -156,33 +213,57 @@ class TeamListView(LoginRequiredMixin, generic.ListView):
             queryset = queryset.filter(projects=project_id)
         return queryset
 
+    def get_version(self) -> dict:
+        # the counts also drop when a project or worker is deleted
+        return self.get_queryset().order_by().aggregate(
+            updated_at=Max("updated_at"),
+            count=Count("*"),
+            num_projects=Sum("num_projects"),
+            num_members=Sum("num_members"),
+        )
+
 
-class TeamDetailView(LoginRequiredMixin, generic.DetailView):
+class TeamDetailView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    generic.DetailView
+):
     model = Team
-    queryset = Team.objects.prefetch_related(
-        "projects", "projects__tasks"
-    ).select_related("owner")
+    queryset = Team.objects.select_related("owner")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["team_join"] = TeamJoinLeaveForm()
-        context["team_task"] = Task.objects.filter(project__teams=self.object)
+        context["task_board"] = build_task_board(
+            self.request, Task.objects.filter(project__teams=self.object)
+        )
 
         return context
 
+    def get_version(self) -> dict | None:
+        return Team.objects.filter(pk=self.kwargs["pk"]).values(
+            "updated_at", "owner__updated_at"
+        ).annotate(
+            **fingerprint("members", Worker.objects.filter(
+                teams=OuterRef("pk")
+            )),
+            **board_fingerprint(Task.objects.filter(
+                project__teams=OuterRef("pk")
+            )),
+        ).first()
+
     def post(self, *args, **kwargs):
         team = self.get_object()
 
         join_user_to_team = self.request.POST.get("join", "")
         user_left_team = self.request.POST.get("leave", "")
 
-        if join_user_to_team:
-            team.members.add(join_user_to_team)
-
-        if user_left_team:
-            team.members.remove(user_left_team)
+        with transaction.atomic():
+            if join_user_to_team:
+                team.members.add(join_user_to_team)
 
-        team.save()
+            if user_left_team:
+                team.members.remove(user_left_team)
 
         return redirect("team_manager:team-detail", pk=team.pk)
 
@@ -207,16 +288,26 @@ class TeamUpdateView(LoginRequiredMixin, generic.UpdateView):
             kwargs={"pk": self.object.pk}
         )
 
-    def post(self, request, *args, **kwargs):
-        team = self.get_object()
 
-        selected_projects = request.POST.getlist("projects")
+class TeamDeleteView(LoginRequiredMixin, generic.DeleteView):
+    model = Team
+    success_url = reverse_lazy("team_manager:team-list")
 
-        team.projects.set(selected_projects)
 
-        return super().post(request, *args, **kwargs)
+class WorkerAutocompleteView(AutocompleteView):
+    queryset = Worker.objects.all()
+    field = "username"
 
 
-class TeamDeleteView(LoginRequiredMixin, generic.DeleteView):
-    model = Team
-    success_url = reverse_lazy("team_manager:team-list")
+class CoworkerAutocompleteView(WorkerAutocompleteView):
+    # workers that share a team with the current user
+    def get_queryset(self) -> QuerySet:
+        return Worker.objects.filter(
+            pk__in=Team.members.through.objects.filter(
+                team__members=self.request.user
+            ).values("worker")
+        )
+
+
+class TeamAutocompleteView(AutocompleteView):
+    queryset = Team.objects.all()